@@ -0,0 +1,86 @@
+"""
+Benchmark the async metric facade with many concurrent producers, against
+validating and updating synchronously on the event loop.
+
+Reports the throughput and the worst stall of the event loop, measured by a
+heartbeat task that should wake every millisecond.
+
+Usage: python -m benchmarks.benchmark_async [--producers N] [--updates U]
+    [--batch-size B]
+"""
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from otito.metrics.async_metric import AsyncMetric
+from otito.metrics.numpy import BinaryAccuracy
+
+
+async def heartbeat(stalls, stop):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        stalls.append(time.perf_counter() - start - 0.001)
+
+
+async def run(producers, update, n_updates, batch_size):
+    rng = np.random.default_rng(0)
+    y_observed = rng.integers(0, 2, batch_size).astype(float)
+    y_predicted = rng.integers(0, 2, batch_size).astype(float)
+
+    async def producer():
+        for _ in range(n_updates):
+            await update(y_observed, y_predicted)
+
+    stalls, stop = [], asyncio.Event()
+    monitor = asyncio.ensure_future(heartbeat(stalls, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(producer() for _ in range(producers)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await monitor
+    return elapsed, max(stalls, default=0.0)
+
+
+def report(label, elapsed, stall, n_samples):
+    print(
+        f"{label}: {elapsed * 1e3:.0f}ms "
+        f"({n_samples / elapsed / 1e6:.1f}M samples/s, "
+        f"worst loop stall {stall * 1e3:.1f}ms)"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--producers", type=int, default=2000)
+    parser.add_argument("--updates", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+    n_samples = args.producers * args.updates * args.batch_size
+
+    metric = BinaryAccuracy(stateful=True)
+
+    async def sync_update(y_observed, y_predicted):
+        metric.update(**metric._parse_input(y_observed, y_predicted))
+        await asyncio.sleep(0)
+
+    elapsed, stall = await run(
+        args.producers, sync_update, args.updates, args.batch_size
+    )
+    report("synchronous", elapsed, stall, n_samples)
+
+    for max_batch_size in (1 << 14, 1 << 17):
+        async_metric = AsyncMetric(BinaryAccuracy(), max_batch_size=max_batch_size)
+        elapsed, stall = await run(
+            args.producers, async_metric.aupdate, args.updates, args.batch_size
+        )
+        await async_metric.acompute()
+        async_metric.close()
+        report(f"async max_batch_size={max_batch_size}", elapsed, stall, n_samples)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+"""
+Benchmark vectorised bootstrap confidence intervals against resampling in a
+loop of metric calls.
+
+Usage: python -m benchmarks.benchmark_bootstrap [--size N] [--resamples R]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from otito.metrics.numpy import BinaryAccuracy, bootstrap
+
+
+def loop_bootstrap(y_observed, y_predicted, sample_weights, n_resamples, rng):
+    replicates = []
+    for _ in range(n_resamples):
+        indices = rng.integers(0, len(y_observed), len(y_observed))
+        weights = None
+        if sample_weights is not None:
+            weights = sample_weights[indices] / sample_weights[indices].sum()
+        replicates.append(
+            BinaryAccuracy()(y_observed[indices], y_predicted[indices], weights)
+        )
+    return np.quantile(replicates, [0.025, 0.975])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--resamples", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    y_observed = rng.integers(0, 2, args.size).astype(float)
+    y_predicted = np.where(rng.random(args.size) < 0.8, y_observed, 1 - y_observed)
+    sample_weights = rng.random(args.size)
+    sample_weights /= sample_weights.sum()
+
+    for weighted in (False, True):
+        weights = sample_weights if weighted else None
+        start = time.perf_counter()
+        low, high = loop_bootstrap(
+            y_observed, y_predicted, weights, args.resamples, rng
+        )
+        loop = time.perf_counter() - start
+        print(f"weighted={weighted} loop: {loop * 1e3:.0f}ms [{low:.4f}, {high:.4f}]")
+
+        for method in ("poisson", "multinomial"):
+            start = time.perf_counter()
+            result = bootstrap(
+                BinaryAccuracy(),
+                y_observed,
+                y_predicted,
+                weights,
+                n_resamples=args.resamples,
+                method=method,
+                n_workers=args.workers,
+            )
+            elapsed = time.perf_counter() - start
+            print(
+                f"weighted={weighted} {method}: {elapsed * 1e3:.0f}ms "
+                f"[{result.low:.4f}, {result.high:.4f}] ({loop / elapsed:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
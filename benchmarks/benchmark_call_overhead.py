@@ -0,0 +1,69 @@
+"""
+Benchmark the per-call latency of metrics on small batches.
+
+For each package, batch size and validation setting, reports the median
+latency of a full metric call (parse, update, compute and reset), which is
+dominated by fixed overhead for the small batches of online scoring.
+
+Usage: python -m benchmarks.benchmark_call_overhead [--packages ...]
+"""
+
+import argparse
+import statistics
+import timeit
+
+import numpy as np
+
+from otito.metrics.utils import load_metric
+
+BATCH_SIZES = (1, 8, 64)
+
+
+def make_inputs(package, size):
+    rng = np.random.default_rng(0)
+    arrays = (
+        rng.integers(0, 2, size).astype(np.float32),
+        rng.integers(0, 2, size).astype(np.float32),
+    )
+    if package == "pytorch":
+        import torch as pt
+
+        return tuple(pt.from_numpy(array) for array in arrays)
+    if package == "tensorflow":
+        import tensorflow as tf
+
+        return tuple(tf.constant(array) for array in arrays)
+    return tuple(array.astype(float) for array in arrays)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--packages", nargs="+", default=["numpy", "pytorch", "tensorflow"]
+    )
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'package':<12}{'batch':>6}{'validate':>10}{'latency (us)':>14}")
+    for package in args.packages:
+        for size in BATCH_SIZES:
+            inputs = make_inputs(package, size)
+            for validate_input in (True, False):
+                metric = load_metric(
+                    metric="BinaryAccuracy",
+                    package=package,
+                    validate_input=validate_input,
+                )
+                metric(*inputs)
+                timings = timeit.repeat(
+                    lambda: metric(*inputs), number=args.number, repeat=args.repeat
+                )
+                latency = statistics.median(timings) / args.number * 1e6
+                print(
+                    f"{package:<12}{size:>6}{str(validate_input):>10}{latency:>14.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmark the cost of constructing metric objects.
+
+Compares construction with the shared validator registry against rebuilding
+the pydantic validator model for every instance (the previous behaviour).
+
+Usage: python -m benchmarks.benchmark_construction [--number N]
+"""
+
+import argparse
+import timeit
+
+from otito.metrics._base_metric import BaseMetric
+from otito.metrics.utils import load_metric
+
+
+def construct(package):
+    return load_metric(metric="BinaryAccuracy", package=package)
+
+
+def construct_uncached(package):
+    BaseMetric._validator_registry.clear()
+    return construct(package)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--packages", nargs="+", default=["numpy"])
+    args = parser.parse_args()
+
+    for package in args.packages:
+        construct(package)
+        uncached = timeit.timeit(
+            lambda: construct_uncached(package), number=args.number
+        )
+        construct(package)
+        cached = timeit.timeit(lambda: construct(package), number=args.number)
+        print(
+            f"{package}: uncached {uncached / args.number * 1e6:.1f}us/instance, "
+            f"cached {cached / args.number * 1e6:.1f}us/instance "
+            f"({uncached / cached:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark the peak memory allocated while validating numpy metric inputs.
+
+Compares the validator model of the numpy ``BinaryAccuracy``, which passes
+float64 arrays through without copying, against the previous strategy of
+copying every input with ``np.array``.
+
+Usage: python -m benchmarks.benchmark_memory [--size N]
+"""
+
+import argparse
+import tracemalloc
+
+import numpy as np
+
+from otito.metrics.utils import load_metric
+
+
+def peak_allocated(func, *args, **kwargs):
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    func(*args, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def legacy_parse(**kwargs):
+    return {key: np.array(value, dtype=float) for key, value in kwargs.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    inputs = {
+        "y_observed": rng.integers(0, 2, args.size).astype(float),
+        "y_predicted": rng.integers(0, 2, args.size).astype(float),
+        "sample_weights": np.full(args.size, 1 / args.size),
+    }
+    input_bytes = sum(array.nbytes for array in inputs.values())
+    int_labels = {
+        "y_observed": inputs["y_observed"].astype(np.int64),
+        "y_predicted": inputs["y_predicted"].astype(np.int64),
+    }
+    metric = load_metric(metric="BinaryAccuracy", package="numpy")
+
+    cases = {
+        "legacy (np.array copies)": lambda: legacy_parse(**inputs),
+        "parse float64 inputs": lambda: metric._parse_input(**inputs),
+        "parse int64 labels": lambda: metric._parse_input(**int_labels),
+        "metric call": lambda: metric(**inputs),
+    }
+    print(f"input size: {input_bytes / 2**20:.1f}MiB")
+    for name, case in cases.items():
+        peak = peak_allocated(case)
+        print(f"{name}: peak {peak / 2**20:.1f}MiB ({peak / input_bytes:.2f}x input)")
+
+
+if __name__ == "__main__":
+    main()
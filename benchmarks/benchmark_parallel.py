@@ -0,0 +1,45 @@
+"""
+Benchmark the scaling of sharded numpy evaluation with the number of workers.
+
+Usage: python -m benchmarks.benchmark_parallel [--size N] [--workers 1 2 4]
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from otito.metrics.numpy import BinaryAccuracy, evaluate_parallel
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=50_000_000)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count()]
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    y_observed = rng.integers(0, 2, args.size).astype(float)
+    y_predicted = rng.integers(0, 2, args.size).astype(float)
+    metric = BinaryAccuracy(validate_input=False)
+
+    start = time.perf_counter()
+    metric(y_observed, y_predicted)
+    serial = time.perf_counter() - start
+    print(f"serial: {serial * 1e3:.0f}ms ({args.size / serial / 1e6:.0f}M elem/s)")
+
+    for n_workers in sorted(set(args.workers)):
+        start = time.perf_counter()
+        evaluate_parallel(metric, y_observed, y_predicted, n_workers=n_workers)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{n_workers} workers: {elapsed * 1e3:.0f}ms "
+            f"({args.size / elapsed / 1e6:.0f}M elem/s, {serial / elapsed:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
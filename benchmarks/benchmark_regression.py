@@ -0,0 +1,76 @@
+"""
+Benchmark the speed, accuracy and state size of the streaming regression
+metrics against a naive two-pass NumPy computation over the whole dataset,
+for float32 inputs with a large offset.
+
+Usage: python -m benchmarks.benchmark_regression [--size N] [--batch-size B]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from otito.metrics.numpy import R2Score
+
+
+def two_pass(y_observed, y_predicted):
+    # the first pass computes the mean, the second the sums of squares
+    mean = y_observed.mean()
+    return (
+        1 - ((y_observed - y_predicted) ** 2).sum() / ((y_observed - mean) ** 2).sum()
+    )
+
+
+def one_pass_sums(y_observed, y_predicted):
+    # textbook single pass sums of squares, which cancel catastrophically
+    residual = y_observed - y_predicted
+    size = y_observed.size
+    total = (y_observed**2).sum() - y_observed.sum() ** 2 / size
+    return 1 - (residual**2).sum() / total
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    value = function(*args)
+    return float(value), time.perf_counter() - start
+
+
+def stream(y_observed, y_predicted, batch_size):
+    metric = R2Score()
+    for index in range(0, len(y_observed), batch_size):
+        batch = slice(index, index + batch_size)
+        metric.update(y_observed[batch], y_predicted[batch])
+    return metric.compute()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=10_000_000)
+    parser.add_argument("--batch-size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    y_observed = (1e4 + rng.normal(0.0, 1.0, args.size)).astype(np.float32)
+    y_predicted = (y_observed + rng.normal(0.0, 0.5, args.size)).astype(np.float32)
+    exact, _ = timed(
+        two_pass, y_observed.astype(np.float64), y_predicted.astype(np.float64)
+    )
+    print(f"float64 two-pass reference: {exact:.12f}")
+
+    for name, function, *extra in (
+        ("float32 two-pass", two_pass),
+        ("float32 one-pass sums", one_pass_sums),
+        ("streaming moments", stream, args.batch_size),
+    ):
+        value, elapsed = timed(function, y_observed, y_predicted, *extra)
+        print(
+            f"{name}: {value:.12f} error={abs(value - exact):.2e} "
+            f"{elapsed * 1e3:.0f}ms"
+        )
+    state = R2Score().state
+    print(f"streaming state={sum(np.asarray(v).nbytes for v in vars(state).values())}B")
+
+
+if __name__ == "__main__":
+    main()
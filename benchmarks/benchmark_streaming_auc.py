@@ -0,0 +1,62 @@
+"""
+Benchmark the accuracy, speed and state size of the histogram ROC AUC against
+the exact sweep, for a stream of batches of scores.
+
+Usage: python -m benchmarks.benchmark_streaming_auc [--size N] [--batch-size B]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from otito.metrics.numpy import BinaryROCAUC
+
+
+def stream(metric, y_observed, y_predicted, batch_size):
+    start = time.perf_counter()
+    for index in range(0, len(y_observed), batch_size):
+        batch = slice(index, index + batch_size)
+        metric.update(y_observed[batch], y_predicted[batch])
+    value = metric.compute()
+    return value, time.perf_counter() - start
+
+
+def state_nbytes(metric):
+    return sum(
+        (
+            sum(value.nbytes for value in values)
+            if isinstance(values, list)
+            else values.nbytes
+        )
+        for values in vars(metric.state).values()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=10_000_000)
+    parser.add_argument("--batch-size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    y_observed = rng.integers(0, 2, args.size).astype(float)
+    y_predicted = 1 / (1 + np.exp(-rng.normal(y_observed * 1.5 - 0.75, 1.0)))
+
+    metric = BinaryROCAUC()
+    exact, elapsed = stream(metric, y_observed, y_predicted, args.batch_size)
+    print(f"exact: {exact:.6f} {elapsed * 1e3:.0f}ms state={state_nbytes(metric)}B")
+
+    for bins in (10, 100, 1_000, 10_000, 100_000):
+        metric = BinaryROCAUC(bins=bins)
+        value, elapsed = stream(metric, y_observed, y_predicted, args.batch_size)
+        low, high = metric.compute_bounds()
+        print(
+            f"bins={bins}: {value:.6f} error={abs(value - exact):.2e} "
+            f"bound={(high - low) / 2:.2e} {elapsed * 1e3:.0f}ms "
+            f"state={state_nbytes(metric)}B"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark the numpy input validation on large arrays.
+
+Compares the validator model of the numpy ``BinaryAccuracy`` against the
+previous validation strategy, which sorted the concatenated labels with
+``np.unique`` and summed the weights with the builtin ``sum``.
+
+Usage: python -m benchmarks.benchmark_validation [--size N] [--repeat R]
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from otito.metrics.numpy.validation.conditions import count_distinct_labels
+from otito.metrics.utils import load_metric
+
+
+def legacy_validation(y_observed, y_predicted, sample_weights):
+    len(np.unique(np.concatenate((y_predicted, y_observed))))
+    sum(sample_weights)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=10_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    y_observed = rng.integers(0, 2, args.size).astype(float)
+    y_predicted = rng.integers(0, 2, args.size).astype(float)
+    sample_weights = np.full(args.size, 1 / args.size)
+
+    validator = load_metric(metric="BinaryAccuracy", package="numpy").validator
+    cases = {
+        "legacy (unique + builtin sum)": lambda: legacy_validation(
+            y_observed, y_predicted, sample_weights
+        ),
+        "count_distinct_labels": lambda: count_distinct_labels(y_predicted, y_observed),
+        "validator model": lambda: validator(
+            y_observed=y_observed,
+            y_predicted=y_predicted,
+            sample_weights=sample_weights,
+        ),
+    }
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        print(f"{name}: {best * 1e3:.1f}ms ({args.size / best / 1e6:.0f}M elem/s)")
+
+
+if __name__ == "__main__":
+    main()
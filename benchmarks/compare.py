@@ -0,0 +1,66 @@
+"""
+Compare two pytest-benchmark JSON results and flag regressions.
+
+A benchmark regresses when its mean latency or peak memory grows, or its
+throughput drops, by more than the threshold relative to the baseline.
+Exits with status 1 if any benchmark regressed.
+
+Usage: python -m benchmarks.compare <baseline.json> <current.json> [--threshold 0.1]
+"""
+
+import argparse
+import json
+import sys
+
+# metric name -> (getter, whether larger values are better)
+METRICS = {
+    "mean": (lambda bench: bench["stats"]["mean"], False),
+    "elements_per_second": (
+        lambda bench: bench["extra_info"].get("elements_per_second"),
+        True,
+    ),
+    "peak_memory": (lambda bench: bench["extra_info"].get("peak_memory"), False),
+}
+
+
+def load_benchmarks(path):
+    with open(path) as f:
+        return {bench["fullname"]: bench for bench in json.load(f)["benchmarks"]}
+
+
+def find_regressions(baseline, current, threshold):
+    regressions = []
+    for name in sorted(baseline.keys() & current.keys()):
+        for metric, (getter, higher_is_better) in METRICS.items():
+            before, after = getter(baseline[name]), getter(current[name])
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append((name, metric, before, after, change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    baseline = load_benchmarks(args.baseline)
+    current = load_benchmarks(args.current)
+    regressions = find_regressions(baseline, current, args.threshold)
+    for name, metric, before, after, change in regressions:
+        print(
+            f"REGRESSION {name} {metric}: {before:.4g} -> {after:.4g} ({change:+.1%})"
+        )
+    print(
+        f"{len(regressions)} regressions in "
+        f"{len(baseline.keys() & current.keys())} compared benchmarks"
+    )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
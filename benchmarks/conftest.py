@@ -0,0 +1,21 @@
+import pytest
+
+DEFAULT_MAX_SIZE = 10**6
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--max-size",
+        type=int,
+        default=DEFAULT_MAX_SIZE,
+        help="largest input size to benchmark, e.g. 100000000 for the full suite",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    max_size = config.getoption("--max-size")
+    skip = pytest.mark.skip(reason=f"input size above --max-size={max_size}")
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and callspec.params.get("size", 0) > max_size:
+            item.add_marker(skip)
@@ -0,0 +1,103 @@
+"""
+pytest-benchmark suite for the binary accuracy metric of every package.
+
+Measures per-call latency, throughput (elements/second, stored in
+``extra_info``) and peak memory for input sizes from 10 to 10^8, with and
+without sample weights and validation. Sizes above ``--max-size`` (10^6 by
+default) are skipped.
+
+Peak memory is traced with ``tracemalloc`` for numpy, which reports its
+allocations to it, and read from the CUDA allocator for pytorch, whose
+inputs are placed on a GPU when one is available. The CPU allocators of
+pytorch and tensorflow are invisible to both, so their peak memory is
+recorded as unavailable (``None``) and skipped by ``benchmarks.compare``.
+
+Usage:
+    python -m pytest benchmarks --benchmark-save=<name>
+    python -m benchmarks.compare <baseline.json> <current.json>
+
+With ``--benchmark-disable``, each case is called once as a plain check
+that it runs.
+"""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+SIZES = [10, 10**3, 10**5, 10**6, 10**7, 10**8]
+PACKAGES = ["numpy", "pytorch", "tensorflow"]
+
+
+def convert(package, array):
+    if package == "pytorch":
+        pt = pytest.importorskip("torch")
+        tensor = pt.from_numpy(array)
+        return tensor.cuda() if pt.cuda.is_available() else tensor
+    if package == "tensorflow":
+        tf = pytest.importorskip("tensorflow")
+        return tf.constant(array)
+    return array
+
+
+def make_inputs(package, size, weighted):
+    rng = np.random.default_rng(0)
+    dtype = np.float64 if package == "numpy" else np.float32
+    inputs = {
+        "y_observed": rng.integers(0, 2, size).astype(dtype),
+        "y_predicted": rng.integers(0, 2, size).astype(dtype),
+    }
+    if weighted:
+        # float64 so that the weights sum to one within the validation tolerance
+        inputs["sample_weights"] = np.full(size, 1 / size)
+    return {name: convert(package, array) for name, array in inputs.items()}
+
+
+def peak_memory(package, inputs, func):
+    if package == "numpy":
+        tracemalloc.start()
+        try:
+            func()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    tensor = inputs["y_observed"]
+    if package == "pytorch" and tensor.is_cuda:
+        import torch as pt
+
+        pt.cuda.synchronize(tensor.device)
+        pt.cuda.reset_peak_memory_stats(tensor.device)
+        before = pt.cuda.memory_allocated(tensor.device)
+        func()
+        pt.cuda.synchronize(tensor.device)
+        return pt.cuda.max_memory_allocated(tensor.device) - before
+    return None
+
+
+@pytest.mark.parametrize("validate_input", [True, False], ids=["valid", "novalid"])
+@pytest.mark.parametrize("weighted", [False, True], ids=["unweighted", "weighted"])
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("package", PACKAGES)
+def test_binary_accuracy(benchmark, package, size, weighted, validate_input):
+    from otito.metrics.utils import import_backend, load_metric
+
+    if package != "numpy":
+        pytest.importorskip({"pytorch": "torch", "tensorflow": "tensorflow"}[package])
+    import_backend(package)
+    inputs = make_inputs(package, size, weighted)
+    metric = load_metric(
+        metric="BinaryAccuracy", package=package, validate_input=validate_input
+    )
+
+    benchmark.group = f"{package}-{size}"
+    benchmark(metric, **inputs)
+
+    if benchmark.stats is None:
+        # benchmarking is disabled, e.g. with --benchmark-disable, so the suite
+        # only checks that every call runs
+        return
+    benchmark.extra_info["size"] = size
+    benchmark.extra_info["elements_per_second"] = size / benchmark.stats.stats.mean
+    benchmark.extra_info["peak_memory"] = peak_memory(
+        package, inputs, lambda: metric(**inputs)
+    )
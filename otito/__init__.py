@@ -0,0 +1,6 @@
+from otito.metrics.async_metric import AsyncMetric
+from otito.metrics.collection import MetricCollection
+from otito.metrics.profiling import Profiler
+from otito.metrics.utils import load_metric
+
+__all__ = ["AsyncMetric", "MetricCollection", "Profiler", "load_metric"]
@@ -1,3 +1,11 @@
-from otito.metrics.utils import load_metric
+from otito.metrics.utils import BACKEND_REQUIREMENTS, import_backend, load_metric
 
-__all__ = ["load_metric"]
+__all__ = ["load_metric", *BACKEND_REQUIREMENTS]
+
+
+def __getattr__(name):
+    # Packages of metrics are imported lazily, so that importing otito does
+    # not import pytorch or tensorflow unless their metrics are used
+    if name in BACKEND_REQUIREMENTS:
+        return import_backend(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,23 +1,62 @@
+import copy
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 
 from pydantic import create_model
 
-from otito.metrics.utils import validation_handler, get_function_arg_names
+from otito.metrics import profiling
+from otito.metrics._state import MetricState
+from otito.metrics.utils import get_function_arg_names
 
 
 class BaseMetric(ABC):
+    _validator_registry = {}
+
+    # Names of validators that constrain a whole dataset rather than each
+    # batch of it, e.g. weights summing to one. These are skipped when
+    # validating the chunks of a stream.
+    dataset_validators = ()
+
+    state: MetricState
+
+    # Cache of intermediate results shared between the metrics of a
+    # MetricCollection while they are updated from the same inputs
+    _intermediates = None
+
     def __init__(
         self,
         validate_input=True,
         package="numpy",
         val_config=None,
         stateful=False,
+        thread_safe=False,
         **kwargs,
     ):
         self.validate_input = validate_input
-        self.validator = self._build_validator(package, val_config)
-        self.metric_args = get_function_arg_names(self.update)
+        self.package = package
+        (
+            self.validator,
+            self.chunk_validator,
+            self.metric_args,
+        ) = self._get_validator(package, val_config)
         self.stateful = stateful
+        self.thread_safe = thread_safe
+        if thread_safe:
+            # each thread updates its own shard of the metric, a copy with a
+            # state of its own, and the states of the shards are merged when
+            # the metric is computed. The shards of finished threads are
+            # merged into the state of the metric itself and dropped, so that
+            # pools replacing their threads do not grow the shards unbounded
+            self._shards = {}
+            self._shards_lock = threading.Lock()
+            self._local = threading.local()
+            self.update = self._update_shard
+            self.compute = self._compute_merged
+            self.reset = self._reset_shards
+            self.merge_state = self._merge_state_locked
+            if not stateful:
+                self._finalize = self._finalize_shard
 
     @abstractmethod
     def reset(self):
@@ -31,27 +70,251 @@ class BaseMetric(ABC):
     def update(self):
         pass
 
-    def _build_validator(self, package, config):
-        return create_model(f"{package}:{self.__class__.__name__}Model", **config)
+    def _empty_copy(self):
+        """
+        A copy of this metric with the same configuration, e.g. ``bins`` or
+        ``average``, but an empty state of its own and without thread safety.
+        """
+        metric = copy.copy(self)
+        for name in (
+            "update",
+            "compute",
+            "reset",
+            "_finalize",
+            "_local",
+            "_shards",
+            "_shards_lock",
+            "merge_state",
+            "_intermediates",
+        ):
+            metric.__dict__.pop(name, None)
+        metric.thread_safe = False
+        metric.reset()
+        return metric
+
+    def __getstate__(self):
+        # the validator models are built at runtime and cannot be pickled, so
+        # they are fetched from the registry again when unpickled
+        state = self.__dict__.copy()
+        for name in ("validator", "chunk_validator", "metric_args"):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        (
+            self.validator,
+            self.chunk_validator,
+            self.metric_args,
+        ) = self._get_validator(self.package, self.input_validator_config)
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._empty_copy()
+            with self._shards_lock:
+                self._retire_shards()
+                self._shards[threading.current_thread()] = shard
+            self._local.shard = shard
+            return shard
+
+    def _retire_shards(self):
+        # called holding the lock of the shards
+        for thread, shard in list(self._shards.items()):
+            if not thread.is_alive():
+                type(self).merge_state(self, shard.state)
+                del self._shards[thread]
+
+    def _update_shard(self, *args, **kwargs):
+        shard = self._shard()
+        # share the cache of the MetricCollection updating this metric, if any
+        shard._intermediates = self._intermediates
+        try:
+            shard.update(*args, **kwargs)
+        finally:
+            shard._intermediates = None
+
+    def _compute_merged(self):
+        merged = copy.copy(self._shard())
+        merged.reset()
+        with self._shards_lock:
+            self._retire_shards()
+            # states merged in from elsewhere, e.g. other processes or
+            # finished threads, are held by the metric itself
+            merged.merge_state(self.state)
+            shards = list(self._shards.values())
+        for shard in shards:
+            merged.merge_state(shard.state)
+        return merged.compute()
+
+    def _reset_shards(self):
+        with self._shards_lock:
+            type(self).reset(self)
+            shards = list(self._shards.values())
+        for shard in shards:
+            shard.reset()
+
+    def _merge_state_locked(self, state: MetricState):
+        with self._shards_lock:
+            type(self).merge_state(self, state)
+
+    def _finalize_shard(self):
+        # each call only computes the updates of its own thread
+        shard = self._shard()
+        result = shard.compute()
+        shard.reset()
+        return result
+
+    def merge_state(self, state: MetricState):
+        """
+        Merge a state accumulated elsewhere, e.g. by another process, into
+        the state of this metric.
+        """
+        self.state.merge(state)
+
+    def _shared(self, key, func, *args):
+        """
+        Compute ``func(*args)``, reusing the result of any other metric that
+        computed ``key`` with the same ``func`` from the same inputs within a
+        MetricCollection.
+        """
+        if self._intermediates is None:
+            return func(*args)
+        # keyed by the function too, so that metrics only collide on a name
+        # when they compute the same thing
+        key = (key, func)
+        if key not in self._intermediates:
+            self._intermediates[key] = func(*args)
+        return self._intermediates[key]
+
+    def _build_validator(self, package, config, suffix="Model"):
+        return create_model(f"{package}:{self.__class__.__name__}{suffix}", **config)
+
+    def _build_chunk_validator(self, package, config):
+        validators = {
+            name: condition
+            for name, condition in config.get("__validators__", {}).items()
+            if name not in self.dataset_validators
+        }
+        return self._build_validator(
+            package, {**config, "__validators__": validators}, suffix="ChunkModel"
+        )
+
+    def _get_validator(self, package, config):
+        """
+        Fetch the validator models and update argument names for this metric
+        class, building and registering them on first use so that all
+        instances of a metric class share a single set of pydantic models.
+        """
+        key = (package, self.__class__)
+        if key not in BaseMetric._validator_registry:
+            BaseMetric._validator_registry[key] = (
+                self._build_validator(package, config),
+                self._build_chunk_validator(package, config),
+                tuple(get_function_arg_names(self.update)),
+            )
+        return BaseMetric._validator_registry[key]
+
+    def _get_profiled_validator(self, validator):
+        """
+        Fetch a variant of ``validator`` whose conditions are each recorded as
+        a stage of the active profiler.
+        """
+        key = (self.package, self.__class__, validator, "profiled")
+        if key not in BaseMetric._validator_registry:
+            names = {
+                check.func.__name__
+                for checks in validator.__validators__.values()
+                for check in checks
+            }
+            config = self.input_validator_config
+            conditions = {
+                name: condition
+                for name, condition in config.get("__validators__", {}).items()
+                if name in names
+            }
+            BaseMetric._validator_registry[key] = create_model(
+                f"{validator.__name__}Profiled",
+                **{
+                    **config,
+                    "__validators__": profiling.profiled_conditions(conditions),
+                },
+            )
+        return BaseMetric._validator_registry[key]
 
     def _merge_args_kwargs(self, *args, **kwargs):
         kwargs.update(dict(zip(self.metric_args, args)))
         return kwargs
 
-    def _parse_input(self, *args, **kwargs):
+    def _parse(self, validator, *args, **kwargs):
         metric_arguments = self._merge_args_kwargs(*args, **kwargs)
         if self.validate_input:
-            metric_arguments = self.validator(**metric_arguments).dict()
+            if profiling.active is not None:
+                validator = self._get_profiled_validator(validator)
+            metric_arguments = dict(validator(**metric_arguments))
         return metric_arguments
 
-    @validation_handler
-    def call(self, **kwargs):
-        self.update(**kwargs)
+    def _parse_input(self, *args, **kwargs):
+        return self._parse(self.validator, *args, **kwargs)
+
+    def _parse_chunk(self, chunk):
+        if isinstance(chunk, Mapping):
+            return self._parse(self.chunk_validator, **chunk)
+        return self._parse(self.chunk_validator, *chunk)
+
+    def call(self, *args, **kwargs):
+        """
+        Evaluate the metric on the inputs, the same as calling the metric.
+        """
+        return self(*args, **kwargs)
+
+    def _evaluate(self, *args, **kwargs):
+        self.update(*args, **kwargs)
+        return self._finalize()
+
+    def _finalize(self):
         result = self.compute()
 
         if not self.stateful:
             self.reset()
         return result
 
+    def update_from_iterable(self, chunks):
+        """
+        Accumulate the metric over an iterable of input chunks and compute it
+        once all chunks are consumed.
+
+        Each chunk is either a tuple of positional ``update`` arguments, e.g.
+        ``(y_observed, y_predicted, sample_weights)``, or a mapping of them.
+        Chunks are validated individually, skipping the validators listed in
+        ``dataset_validators``, so only one chunk needs to be held in memory
+        at a time.
+
+        :param chunks: iterable (e.g. a generator or DataLoader) of chunks
+        :return: the metric computed over all chunks
+        """
+        for chunk in chunks:
+            self.update(**self._parse_chunk(chunk))
+        return self._finalize()
+
+    def _profiled_call(self, profiler, *args, **kwargs):
+        name = self.__class__.__name__
+        nbytes = profiling.input_nbytes(*args, *kwargs.values())
+        if self.validate_input:
+            with profiler.stage("_parse_input", name, nbytes):
+                kwargs = self._parse_input(*args, **kwargs)
+            args = ()
+        with profiler.stage("update", name, nbytes):
+            self.update(*args, **kwargs)
+        with profiler.stage("compute", name):
+            return self._finalize()
+
     def __call__(self, *args, **kwargs):
-        return self.call(**self._parse_input(*args, **kwargs))
+        if profiling.active is not None:
+            return self._profiled_call(profiling.active, *args, **kwargs)
+        if not self.validate_input:
+            # trusted inputs are passed straight to update, skipping the
+            # merging of arguments into a dict
+            return self._evaluate(*args, **kwargs)
+        return self._evaluate(**self._parse_input(*args, **kwargs))
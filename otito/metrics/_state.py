@@ -0,0 +1,27 @@
+class MetricState:
+    """
+    The accumulated state of a metric, held as a set of named counters.
+
+    States are additive: two states of the same metric, e.g. accumulated on
+    different shards of a dataset, are combined by summing their counters
+    with :meth:`merge`. States are plain picklable objects so that they can
+    be returned from worker processes.
+    """
+
+    def __init__(self, **counters):
+        self.__dict__.update(counters)
+
+    def merge(self, other: "MetricState") -> "MetricState":
+        for name, value in vars(other).items():
+            counter = getattr(self, name)
+            if hasattr(counter, "assign_add"):
+                # variables (e.g. tf.Variable) are updated in place, so that
+                # compiled functions holding them stay valid
+                counter.assign_add(value)
+            else:
+                setattr(self, name, counter + value)
+        return self
+
+    def __repr__(self):
+        counters = ", ".join(f"{name}={value!r}" for name, value in vars(self).items())
+        return f"{self.__class__.__name__}({counters})"
@@ -0,0 +1,189 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AsyncMetric:
+    """
+    An asyncio facade over a metric, for evaluating the predictions of many
+    concurrent producers without blocking the event loop.
+
+    Concurrent calls to :meth:`aupdate` are micro-batched: their inputs are
+    queued and concatenated into a single update once ``max_batch_size``
+    samples are pending, or ``max_latency`` seconds after the first of them
+    was queued. Validation and updates run on a thread pool, where numpy and
+    the frameworks release the GIL for the heavy work, and are serialised by
+    a lock, as validation may itself accumulate state such as the deferred
+    checks of pytorch metrics.
+
+    Batches are validated with the chunk validator of the metric, so weights
+    are not required to sum to one per update. When a batch fails
+    validation, its updates are validated one by one so that only the
+    callers of invalid updates receive the error.
+
+    Usage::
+
+        metric = AsyncMetric(BinaryAccuracy())
+        await asyncio.gather(*(metric.aupdate(y, p) for y, p in batches))
+        accuracy = await metric.acompute()
+
+    :param metric: the metric to update, e.g. ``BinaryAccuracy()``
+    :param max_batch_size: number of pending samples that triggers an update
+    :param max_latency: seconds an update may wait for others to batch with
+    :param executor: executor running the updates, defaults to a thread pool
+        owned by this facade, shut down by :meth:`close`
+    """
+
+    def __init__(
+        self,
+        metric,
+        max_batch_size: int = 65536,
+        max_latency: float = 0.005,
+        executor=None,
+    ):
+        self.metric = metric
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            thread_name_prefix="otito-metric"
+        )
+        self._lock = threading.Lock()
+        self._pending = []
+        self._pending_size = 0
+        self._timer = None
+        self._running = set()
+
+    async def aupdate(self, *args, **kwargs):
+        """
+        Queue an update of the metric, returning once it is applied.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        arguments = self.metric._merge_args_kwargs(*args, **kwargs)
+        self._pending.append((arguments, future))
+        self._pending_size += len(arguments[self.metric.metric_args[0]])
+        if self._pending_size >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_latency, self._flush)
+        await future
+
+    async def acompute(self):
+        """
+        Apply all queued updates and compute the metric.
+        """
+        await self.aflush()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._compute)
+
+    async def aflush(self):
+        """
+        Apply all queued updates, without waiting for a batch to fill.
+        """
+        self._flush()
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+    def reset(self):
+        with self._lock:
+            self.metric.reset()
+
+    def close(self):
+        if self._owns_executor:
+            self._executor.shutdown()
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending, self._pending_size = self._pending, [], 0
+        task = asyncio.ensure_future(self._apply(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _apply(self, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            errors = await loop.run_in_executor(
+                self._executor, self._update, [arguments for arguments, _ in batch]
+            )
+        except Exception as e:
+            errors = [e] * len(batch)
+        for (_, future), error in zip(batch, errors):
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
+    def _update(self, updates):
+        """
+        Validate and apply a batch of updates, returning the error raised by
+        each of them, if any.
+        """
+        errors = [None] * len(updates)
+        # updates are concatenated with others passing the same arguments
+        groups = {}
+        for index, arguments in enumerate(updates):
+            names = tuple(
+                name for name, value in arguments.items() if value is not None
+            )
+            groups.setdefault(names, []).append(index)
+
+        for names, indices in groups.items():
+            with self._lock:
+                try:
+                    inputs = self.metric._parse(
+                        self.metric.chunk_validator,
+                        **self._concatenate(
+                            [updates[index] for index in indices], names
+                        ),
+                    )
+                except Exception:
+                    inputs = self._parse_each(updates, indices, errors)
+                if inputs is None:
+                    continue
+                try:
+                    self.metric.update(**inputs)
+                except Exception as e:
+                    for index in indices:
+                        errors[index] = errors[index] or e
+        return errors
+
+    def _concatenate(self, updates, names):
+        if len(updates) == 1:
+            return updates[0]
+        for arguments in updates:
+            if len({len(arguments[name]) for name in names}) > 1:
+                # misaligned inputs would be concealed by concatenation
+                raise ValueError("Shape of inputs mismatched")
+        return {
+            name: self.metric._concatenate([arguments[name] for arguments in updates])
+            for name in names
+        }
+
+    def _parse_each(self, updates, indices, errors):
+        valid = []
+        for index in list(indices):
+            try:
+                updates[index] = self.metric._parse(
+                    self.metric.chunk_validator, **updates[index]
+                )
+                valid.append(index)
+            except Exception as e:
+                errors[index] = e
+        indices[:] = valid
+        if not valid:
+            return None
+        names = tuple(
+            name for name, value in updates[valid[0]].items() if value is not None
+        )
+        return self._concatenate([updates[index] for index in valid], names)
+
+    def _compute(self):
+        with self._lock:
+            return self.metric.compute()
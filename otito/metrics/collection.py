@@ -0,0 +1,80 @@
+class MetricCollection:
+    """
+    A set of metrics of one package that are evaluated together on the same
+    inputs.
+
+    Inputs are validated once per distinct validator configuration rather
+    than once per metric, and intermediate results shared between metrics
+    of the same configuration (e.g. the binary confusion counts) are
+    computed once per update.
+
+    :param metrics: a list of metrics, or a mapping of names to metrics.
+        Metrics in a list are named after their class.
+    :param validate_input: whether to validate the inputs of each update
+    :param stateful: whether to keep accumulating state between calls
+    """
+
+    def __init__(self, metrics, validate_input=True, stateful=False):
+        if not isinstance(metrics, dict):
+            named_metrics = {metric.__class__.__name__: metric for metric in metrics}
+            if len(named_metrics) != len(metrics):
+                raise ValueError(
+                    "Metrics of the same class must be passed as a mapping of "
+                    "unique names to metrics"
+                )
+            metrics = named_metrics
+        packages = {metric.package for metric in metrics.values()}
+        if len(packages) > 1:
+            raise ValueError(
+                f"Metrics of a collection must share a package: found {packages}"
+            )
+        self.metrics = metrics
+        self.validate_input = validate_input
+        self.stateful = stateful
+        # a metric of each distinct validator configuration
+        self._validating_metrics = {
+            id(metric.input_validator_config): metric for metric in metrics.values()
+        }
+
+    def _parse_input(self, *args, **kwargs):
+        """
+        Parse the inputs once per validator configuration, keeping the
+        arguments of each configuration apart, as validators of different
+        configurations may convert the same input differently.
+        """
+        parsed = {}
+        for config, metric in self._validating_metrics.items():
+            arguments = metric._merge_args_kwargs(*args, **kwargs)
+            if self.validate_input:
+                arguments = dict(metric.validator(**arguments))
+            parsed[config] = arguments
+        return parsed
+
+    def reset(self):
+        for metric in self.metrics.values():
+            metric.reset()
+
+    def update(self, *args, **kwargs):
+        parsed = self._parse_input(*args, **kwargs)
+        # intermediates are only shared between metrics of the same arguments
+        intermediates = {config: {} for config in parsed}
+        for metric in self.metrics.values():
+            config = id(metric.input_validator_config)
+            metric._intermediates = intermediates[config]
+            try:
+                metric.update(
+                    **{name: parsed[config].get(name) for name in metric.metric_args}
+                )
+            finally:
+                metric._intermediates = None
+
+    def compute(self):
+        return {name: metric.compute() for name, metric in self.metrics.items()}
+
+    def __call__(self, *args, **kwargs):
+        self.update(*args, **kwargs)
+        result = self.compute()
+
+        if not self.stateful:
+            self.reset()
+        return result
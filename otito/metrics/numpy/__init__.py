@@ -1,3 +1,67 @@
-from otito.metrics.numpy.classification.binary_classification import BinaryAccuracy
+from otito.metrics.numpy.classification.binary_classification import (
+    BinaryAccuracy,
+    BinaryF1Score,
+    BinaryPrecision,
+    BinaryRecall,
+    BinarySpecificity,
+)
+from otito.metrics.numpy.classification.binary_threshold import (
+    BinaryBestThresholdAccuracy,
+    BinaryPRAUC,
+    BinaryROCAUC,
+)
+from otito.metrics.numpy.classification.multiclass_classification import (
+    MulticlassAccuracy,
+    MulticlassF1Score,
+    MulticlassPrecision,
+    MulticlassRecall,
+)
+from otito.metrics.numpy.classification.multilabel_classification import (
+    MultilabelAccuracy,
+    MultilabelExactMatch,
+    MultilabelF1Score,
+    MultilabelPrecision,
+    MultilabelRecall,
+)
+from otito.metrics.numpy.regression.regression_metrics import (
+    ExplainedVariance,
+    MeanAbsoluteError,
+    MeanSquaredError,
+    R2Score,
+    RootMeanSquaredError,
+)
+from otito.metrics.numpy.bootstrap import bootstrap
+from otito.metrics.numpy.memmap import evaluate_memmap, load_memmap
+from otito.metrics.numpy.parallel import evaluate_parallel
+from otito.metrics.numpy.windowed import DecayedMetric, SlidingWindowMetric
 
-__all__ = ["BinaryAccuracy"]
+__all__ = [
+    "BinaryAccuracy",
+    "BinaryBestThresholdAccuracy",
+    "BinaryF1Score",
+    "BinaryPRAUC",
+    "BinaryPrecision",
+    "BinaryROCAUC",
+    "BinaryRecall",
+    "BinarySpecificity",
+    "DecayedMetric",
+    "ExplainedVariance",
+    "MeanAbsoluteError",
+    "MeanSquaredError",
+    "MulticlassAccuracy",
+    "MulticlassF1Score",
+    "MulticlassPrecision",
+    "MulticlassRecall",
+    "MultilabelAccuracy",
+    "MultilabelExactMatch",
+    "MultilabelF1Score",
+    "MultilabelPrecision",
+    "MultilabelRecall",
+    "R2Score",
+    "RootMeanSquaredError",
+    "SlidingWindowMetric",
+    "bootstrap",
+    "evaluate_memmap",
+    "evaluate_parallel",
+    "load_memmap",
+]
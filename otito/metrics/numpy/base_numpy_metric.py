@@ -10,8 +10,142 @@ class NumpyBaseMetric(BaseMetric, ABC):
         super().__init__(*args, **kwargs)
         self.reset()
 
+    @staticmethod
+    def _concatenate(arrays: list) -> np.ndarray:
+        return np.concatenate(arrays)
+
     @staticmethod
     def _array_equality(
         left_tensor: np.ndarray, right_tensor: np.ndarray
     ) -> np.ndarray:
         return (left_tensor == right_tensor).astype(float)
+
+    @staticmethod
+    def _binary_confusion(
+        y_observed: np.ndarray,
+        y_predicted: np.ndarray,
+        sample_weights: np.ndarray = None,
+    ) -> tuple:
+        """
+        Count the true positives, false positives, true negatives and false
+        negatives of binary labels in one pass, treating ``1`` as the
+        positive label. With ``sample_weights`` the weights of each cell are
+        summed instead.
+
+        A sample is a true positive or negative exactly when its labels are
+        equal, so that the accuracy of any two labels is their agreement.
+        """
+        predicted = y_predicted.reshape(-1) == 1
+        observed = NumpyBaseMetric._observed_positive(
+            y_observed, y_predicted, predicted
+        )
+        if sample_weights is None:
+            tp = np.count_nonzero(observed & predicted)
+            observed_positive = np.count_nonzero(observed)
+            predicted_positive = np.count_nonzero(predicted)
+            fp = predicted_positive - tp
+            fn = observed_positive - tp
+            return tp, fp, observed.size - tp - fp - fn, fn
+
+        cells = np.left_shift(observed, 1, dtype=np.intp) | predicted
+        tn, fp, fn, tp = np.bincount(
+            cells, weights=sample_weights.reshape(-1), minlength=4
+        )
+        return tp, fp, tn, fn
+
+    @staticmethod
+    def _confusion_cells(y_observed: np.ndarray, y_predicted: np.ndarray):
+        """
+        The confusion cell of each sample, ``0`` for a true negative, ``1``
+        for a false positive, ``2`` for a false negative and ``3`` for a true
+        positive.
+        """
+        predicted = y_predicted.reshape(-1) == 1
+        observed = NumpyBaseMetric._observed_positive(
+            y_observed, y_predicted, predicted
+        )
+        cells = np.left_shift(observed, 1, dtype=np.intp)
+        cells |= predicted
+        return cells
+
+    @staticmethod
+    def _observed_positive(
+        y_observed: np.ndarray, y_predicted: np.ndarray, predicted: np.ndarray
+    ) -> np.ndarray:
+        """
+        The observed label of each sample as positive or negative: that of
+        the prediction when the labels are equal, its opposite otherwise.
+        For labels in ``{0, 1}`` this is ``y_observed == 1``.
+        """
+        return (y_observed.reshape(-1) == y_predicted.reshape(-1)) == predicted
+
+    @staticmethod
+    def _group_indices(group_by: np.ndarray) -> tuple:
+        """
+        Map the keys of ``group_by`` to consecutive group indices.
+
+        Integer keys spanning a range no larger than the number of keys are
+        indexed by offset in a single pass, while other keys (e.g. strings)
+        are found by sorting with ``np.unique``.
+
+        :return: the sorted keys of the groups, and the group index of each
+            element
+        """
+        group_by = group_by.reshape(-1)
+        if np.issubdtype(group_by.dtype, np.integer) and group_by.size:
+            low, high = group_by.min(), group_by.max()
+            # the range is taken in python integers, as it may overflow int64
+            if int(high) - int(low) < group_by.size:
+                # offsets are taken outside the key dtype, where they may wrap,
+                # except for unsigned keys, which cannot wrap below the lowest
+                if np.issubdtype(group_by.dtype, np.unsignedinteger):
+                    groups = (group_by - low).astype(np.intp)
+                else:
+                    groups = group_by.astype(np.intp) - int(low)
+                present = np.bincount(groups) > 0
+                # the keys are scattered to their offsets rather than built
+                # with np.arange, whose bounds would overflow the key dtype
+                keys = np.empty(present.size, dtype=group_by.dtype)
+                keys[groups] = group_by
+                if present.all():
+                    return keys, groups
+                return keys[present], (np.cumsum(present) - 1)[groups]
+        keys, groups = np.unique(group_by, return_inverse=True)
+        return keys, groups.reshape(-1)
+
+    @staticmethod
+    def _grouped_binary_confusion(
+        y_observed: np.ndarray,
+        y_predicted: np.ndarray,
+        group_by: np.ndarray,
+        sample_weights: np.ndarray = None,
+    ) -> tuple:
+        """
+        Count the binary confusion matrix of each group of ``group_by`` in one
+        pass, with a single ``np.bincount`` over the cell of each element
+        offset by its group.
+
+        :return: the keys of the groups, and arrays of the true positives,
+            false positives, true negatives and false negatives of each group
+        """
+        keys, groups = NumpyBaseMetric._group_indices(group_by)
+        cells = NumpyBaseMetric._confusion_cells(y_observed, y_predicted)
+        cells += groups * 4
+        counts = np.bincount(
+            cells,
+            weights=None if sample_weights is None else sample_weights.reshape(-1),
+            minlength=keys.size * 4,
+        )
+        tn, fp, fn, tp = counts.reshape(keys.size, 4).T
+        return keys, tp, fp, tn, fn
+
+    @staticmethod
+    def _safe_divide(numerator, denominator):
+        """
+        Divide elementwise, returning ``0.0`` wherever the denominator is zero.
+        """
+        numerator = np.asarray(numerator, dtype=float)
+        denominator = np.asarray(denominator, dtype=float)
+        result = np.zeros(np.broadcast(numerator, denominator).shape)
+        np.divide(numerator, denominator, out=result, where=denominator != 0)
+        return result[()]
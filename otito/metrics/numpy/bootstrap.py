@@ -0,0 +1,154 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from math import exp, factorial
+from typing import NamedTuple
+
+import numpy as np
+
+# Upper bound on the number of resampling weights (or indices) drawn at once
+DEFAULT_CHUNK_SIZE = 1 << 24
+
+METHODS = ("poisson", "multinomial")
+
+# Cumulative distribution of Poisson(1), up to the resolution of float32
+POISSON_CDF = np.cumsum([exp(-1) / factorial(k) for k in range(11)]).astype(np.float32)
+
+
+class BootstrapResult(NamedTuple):
+    value: float
+    low: float
+    high: float
+    replicates: np.ndarray
+
+
+def _poisson_ones(rng, shape):
+    """
+    Draw Poisson(1) variates by inverting their distribution, which is a few
+    times faster than ``Generator.poisson`` for this fixed rate.
+    """
+    uniform = rng.random(shape, dtype=np.float32)
+    draws = np.zeros(shape, dtype=np.uint8)
+    for bound in POISSON_CDF[:-1]:
+        draws += uniform >= bound
+    return draws
+
+
+def _poisson_counts(rng, n_resamples, sorted_weights, bounds):
+    # each sample is drawn a Poisson(1) number of times. Samples are sorted by
+    # cell, so the weight sums of a cell are a product with a block of columns
+    draws = _poisson_ones(rng, (n_resamples, sorted_weights.size))
+    draws = draws.astype(sorted_weights.dtype)
+    return np.stack(
+        [
+            draws[:, start:stop] @ sorted_weights[start:stop]
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ],
+        axis=1,
+    )
+
+
+def _multinomial_counts(rng, n_resamples, cells, weights):
+    # each resample is a row of indices drawn with replacement
+    indices = rng.integers(0, cells.size, size=(n_resamples, cells.size))
+    offsets = 4 * np.arange(n_resamples)[:, None]
+    counts = np.bincount(
+        (cells[indices] + offsets).reshape(-1),
+        weights=weights[indices].reshape(-1),
+        minlength=4 * n_resamples,
+    )
+    return counts.reshape(n_resamples, 4)
+
+
+def bootstrap(
+    metric,
+    y_observed,
+    y_predicted,
+    sample_weights=None,
+    n_resamples: int = 1000,
+    confidence_level: float = 0.95,
+    method: str = "poisson",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    n_workers: int = 1,
+    random_state=None,
+) -> BootstrapResult:
+    """
+    Estimate a percentile bootstrap confidence interval of a numpy binary
+    metric.
+
+    Inputs are validated and reduced to the confusion cell of each sample
+    once. Every resample is then a vector of sample weights, and the
+    confusion counts of all resamples are computed together, from which
+    the metric is computed elementwise.
+
+    Without ``sample_weights`` only the number of samples in each cell
+    matters, so the resampled counts are drawn directly from their Poisson
+    or multinomial distribution. With ``sample_weights``, resamples are
+    drawn in chunks of at most ``chunk_size`` weights (or indices), as a
+    matrix of Poisson weights or of indices drawn with replacement, and
+    the chunks are spread over ``n_workers`` threads. Chunks are seeded
+    independently, so results do not depend on ``n_workers``.
+
+    :param metric: a numpy binary metric, e.g. ``BinaryAccuracy()``
+    :param y_observed: observed labels
+    :param y_predicted: predicted labels
+    :param sample_weights: optional sample weights
+    :param n_resamples: number of bootstrap resamples
+    :param confidence_level: confidence level of the interval
+    :param method: ``"poisson"`` to weight each sample by a Poisson(1)
+        draw, or ``"multinomial"`` to resample the samples with replacement
+    :param chunk_size: bound on the weights (or indices) held in memory
+        per worker
+    :param n_workers: number of threads drawing resamples, defaults to 1.
+        ``None`` uses the cpu count
+    :param random_state: seed or ``np.random.Generator`` of the resamples
+    :return: the metric, the bounds of its confidence interval and the
+        metric of each resample
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown bootstrap method '{method}': expected {METHODS}")
+    inputs = metric._parse_input(
+        y_observed=y_observed, y_predicted=y_predicted, sample_weights=sample_weights
+    )
+    cells = metric._confusion_cells(inputs["y_observed"], inputs["y_predicted"])
+    weights = inputs["sample_weights"]
+    rng = np.random.default_rng(random_state)
+
+    if weights is None:
+        cell_counts = np.bincount(cells, minlength=4)
+        value = metric._compute_from_confusion(*cell_counts[[3, 1, 0, 2]])
+        if method == "poisson":
+            counts = rng.poisson(cell_counts, size=(n_resamples, 4))
+        else:
+            counts = rng.multinomial(cells.size, cell_counts / cells.size, n_resamples)
+    else:
+        weights = np.asarray(weights, dtype=float).reshape(-1)
+        cell_counts = np.bincount(cells, weights=weights, minlength=4)
+        value = metric._compute_from_confusion(*cell_counts[[3, 1, 0, 2]])
+        rows = max(1, min(n_resamples, chunk_size // max(cells.size, 1)))
+        sizes = [
+            min(rows, n_resamples - start) for start in range(0, n_resamples, rows)
+        ]
+        seeds = rng.integers(np.iinfo(np.int64).max, size=len(sizes))
+        if method == "poisson":
+            order = np.argsort(cells, kind="stable")
+            bounds = np.searchsorted(cells[order], np.arange(5))
+            sorted_weights = weights[order]
+
+            def draw(seed, size):
+                rng = np.random.default_rng(seed)
+                return _poisson_counts(rng, size, sorted_weights, bounds)
+
+        else:
+
+            def draw(seed, size):
+                rng = np.random.default_rng(seed)
+                return _multinomial_counts(rng, size, cells, weights)
+
+        with ThreadPoolExecutor(max_workers=n_workers or os.cpu_count()) as executor:
+            counts = np.concatenate(list(executor.map(draw, seeds, sizes)))
+
+    tn, fp, fn, tp = counts.T
+    replicates = np.atleast_1d(metric._compute_from_confusion(tp, fp, tn, fn))
+    alpha = (1 - confidence_level) / 2
+    low, high = np.quantile(replicates, [alpha, 1 - alpha])
+    return BootstrapResult(float(value), float(low), float(high), replicates)
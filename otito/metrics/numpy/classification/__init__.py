@@ -1,3 +1,45 @@
-from otito.metrics.numpy.classification.binary_classification import BinaryAccuracy
+from otito.metrics.numpy.classification.binary_classification import (
+    BinaryAccuracy,
+    BinaryF1Score,
+    BinaryPrecision,
+    BinaryRecall,
+    BinarySpecificity,
+)
+from otito.metrics.numpy.classification.binary_threshold import (
+    BinaryBestThresholdAccuracy,
+    BinaryPRAUC,
+    BinaryROCAUC,
+)
+from otito.metrics.numpy.classification.multiclass_classification import (
+    MulticlassAccuracy,
+    MulticlassF1Score,
+    MulticlassPrecision,
+    MulticlassRecall,
+)
+from otito.metrics.numpy.classification.multilabel_classification import (
+    MultilabelAccuracy,
+    MultilabelExactMatch,
+    MultilabelF1Score,
+    MultilabelPrecision,
+    MultilabelRecall,
+)
 
-__all__ = ["BinaryAccuracy"]
+__all__ = [
+    "BinaryAccuracy",
+    "BinaryBestThresholdAccuracy",
+    "BinaryF1Score",
+    "BinaryPRAUC",
+    "BinaryPrecision",
+    "BinaryROCAUC",
+    "BinaryRecall",
+    "BinarySpecificity",
+    "MulticlassAccuracy",
+    "MulticlassF1Score",
+    "MulticlassPrecision",
+    "MulticlassRecall",
+    "MultilabelAccuracy",
+    "MultilabelExactMatch",
+    "MultilabelF1Score",
+    "MultilabelPrecision",
+    "MultilabelRecall",
+]
@@ -1,5 +1,8 @@
+from abc import ABC, abstractmethod
+
 import numpy as np
 
+from otito.metrics._state import MetricState
 from otito.metrics.numpy.base_numpy_metric import NumpyBaseMetric
 from otito.metrics.numpy.validation.custom_types import Array
 from otito.metrics.numpy.validation.conditions import (
@@ -10,11 +13,12 @@ from otito.metrics.numpy.validation.conditions import (
 )
 
 
-class BinaryAccuracy(NumpyBaseMetric):
+class BinaryConfusionMetric(NumpyBaseMetric, ABC):
     """
-    The Numpy Binary Classification Accuracy Metric provides a score that
-    represents the proportion of a dataset that was correctly labeled by a
-    binary classifier
+    Base class of the Numpy Binary Classification Metrics. The state of these
+    metrics is a binary confusion matrix of true/false positive/negative
+    counts (or weight sums), accumulated in a single pass over the inputs, so
+    that every metric derived from it shares the same update.
     """
 
     input_validator_config = {
@@ -29,54 +33,140 @@ class BinaryAccuracy(NumpyBaseMetric):
         },
     }
 
-    correct: int
-    total: int
+    dataset_validators = ("sample_weights_must_sum_to_one",)
 
     def __init__(self, *args, **kwargs):
-        """
-        This is a test docstring
-        :param args:
-        :param kwargs:
-
-        """
         super().__init__(*args, val_config=self.input_validator_config, **kwargs)
 
     def reset(self):
-        self.correct = 0
-        self.total = 0
-
-    def _update_binary_accuracy(
-        self, y_observed: np.ndarray, y_predicted: np.ndarray
-    ) -> float:
-        self.correct += np.sum(self._array_equality(y_observed, y_predicted))
-        self.total += y_observed.size
+        self.state = MetricState(tp=0, fp=0, tn=0, fn=0)
 
-    def _update_weighted_binary_accuracy(
+    def update(
         self,
-        y_observed: np.ndarray,
-        y_predicted: np.ndarray,
-        sample_weights: np.ndarray,
-    ) -> float:
-        self.correct += np.dot(
-            self._array_equality(y_observed, y_predicted), sample_weights
+        y_observed: np.ndarray = None,
+        y_predicted: np.ndarray = None,
+        sample_weights: np.ndarray = None,
+    ):
+        tp, fp, tn, fn = self._shared(
+            "binary_confusion",
+            self._binary_confusion,
+            y_observed,
+            y_predicted,
+            sample_weights,
         )
-        self.total = 1.0
+        self.state.tp += tp
+        self.state.fp += fp
+        self.state.tn += tn
+        self.state.fn += fn
 
-    def update(
+    def compute(self) -> float:
+        return self._compute_from_confusion(
+            self.state.tp, self.state.fp, self.state.tn, self.state.fn
+        )
+
+    def compute_by_group(
         self,
         y_observed: np.ndarray = None,
         y_predicted: np.ndarray = None,
         sample_weights: np.ndarray = None,
-    ):
-        if sample_weights is None:
-            self._update_binary_accuracy(y_observed=y_observed, y_predicted=y_predicted)
-
-        else:
-            self._update_weighted_binary_accuracy(
-                y_observed=y_observed,
-                y_predicted=y_predicted,
-                sample_weights=sample_weights,
+        group_by: np.ndarray = None,
+    ) -> dict:
+        """
+        Compute the metric for each group of the inputs in a single pass,
+        without updating the state of the metric.
+
+        :param group_by: integer or categorical (e.g. string) group key of
+            each sample
+        :return: mapping of each group key to the metric of its samples
+        """
+        metric_arguments = self._parse_input(
+            y_observed=y_observed,
+            y_predicted=y_predicted,
+            sample_weights=sample_weights,
+        )
+        group_by = np.asarray(group_by)
+        if group_by.shape != metric_arguments["y_observed"].shape:
+            raise ValueError(
+                f"Shape of inputs mismatched: {group_by.shape} (group_by) != "
+                f"{metric_arguments['y_observed'].shape} (observed)"
             )
+        keys, tp, fp, tn, fn = self._grouped_binary_confusion(
+            group_by=group_by, **metric_arguments
+        )
+        scores = self._compute_from_confusion(tp, fp, tn, fn)
+        return dict(zip(keys.tolist(), np.atleast_1d(scores).tolist()))
 
-    def compute(self) -> float:
-        return self.correct / self.total
+    def __call__(self, *args, group_by=None, **kwargs):
+        if group_by is None:
+            return super().__call__(*args, **kwargs)
+        return self.compute_by_group(
+            **self._merge_args_kwargs(*args, **kwargs), group_by=group_by
+        )
+
+    @staticmethod
+    @abstractmethod
+    def _compute_from_confusion(tp, fp, tn, fn):
+        """
+        Compute the metric from confusion counts. Counts may be scalars or
+        arrays of counts, in which case the metric is computed elementwise.
+        """
+
+
+class BinaryAccuracy(BinaryConfusionMetric):
+    """
+    The Numpy Binary Classification Accuracy Metric provides a score that
+    represents the proportion of a dataset that was correctly labeled by a
+    binary classifier
+    """
+
+    @staticmethod
+    def _compute_from_confusion(tp, fp, tn, fn):
+        return BinaryAccuracy._safe_divide(tp + tn, tp + fp + tn + fn)
+
+
+class BinaryPrecision(BinaryConfusionMetric):
+    """
+    The Numpy Binary Classification Precision Metric provides a score that
+    represents the proportion of positive predictions of a binary classifier
+    that were correct
+    """
+
+    @staticmethod
+    def _compute_from_confusion(tp, fp, tn, fn):
+        return BinaryPrecision._safe_divide(tp, tp + fp)
+
+
+class BinaryRecall(BinaryConfusionMetric):
+    """
+    The Numpy Binary Classification Recall Metric provides a score that
+    represents the proportion of positive samples that were identified by a
+    binary classifier
+    """
+
+    @staticmethod
+    def _compute_from_confusion(tp, fp, tn, fn):
+        return BinaryRecall._safe_divide(tp, tp + fn)
+
+
+class BinarySpecificity(BinaryConfusionMetric):
+    """
+    The Numpy Binary Classification Specificity Metric provides a score that
+    represents the proportion of negative samples that were identified by a
+    binary classifier
+    """
+
+    @staticmethod
+    def _compute_from_confusion(tp, fp, tn, fn):
+        return BinarySpecificity._safe_divide(tn, tn + fp)
+
+
+class BinaryF1Score(BinaryConfusionMetric):
+    """
+    The Numpy Binary Classification F1 Score Metric provides a score that
+    represents the harmonic mean of the precision and recall of a binary
+    classifier
+    """
+
+    @staticmethod
+    def _compute_from_confusion(tp, fp, tn, fn):
+        return BinaryF1Score._safe_divide(2 * tp, 2 * tp + fp + fn)
@@ -0,0 +1,213 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from otito.metrics._state import MetricState
+from otito.metrics.numpy.base_numpy_metric import NumpyBaseMetric
+from otito.metrics.numpy.validation.custom_types import Array
+from otito.metrics.numpy.validation.conditions import (
+    labels_must_be_same_shape,
+    observed_labels_must_be_zero_or_one,
+    sample_weights_must_be_same_len,
+    sample_weights_must_sum_to_one,
+    scores_must_be_probabilities,
+)
+
+
+class BinaryThresholdMetric(NumpyBaseMetric, ABC):
+    """
+    Base class of the Numpy Binary Classification Metrics of probability
+    scores, which sweep every threshold at which the scores can be turned
+    into binary predictions. Observed labels are 1 for positive and 0 for
+    negative samples.
+
+    The confusion counts at every threshold are found with a single sort of
+    the scores and a cumulative sum of the positive and negative weights,
+    rather than by thresholding the scores once per threshold.
+
+    By default the scores, labels and weights of every update are held in
+    the state, so that the sweep is exact. With ``bins``, the state is
+    instead a histogram of the positive and negative weights of the scores
+    over ``bins`` equal width bins of ``[0, 1]``, which bounds the memory of
+    streaming updates and makes states mergeable by summation, at the cost
+    of only sweeping the bin edges.
+
+    :param bins: number of histogram bins, or ``None`` for an exact sweep
+    """
+
+    input_validator_config = {
+        "y_observed": (Array[float], None),
+        "y_predicted": (Array[float], None),
+        "sample_weights": (Array[float], None),
+        "__validators__": {
+            "labels_must_be_same_shape": labels_must_be_same_shape,
+            "observed_labels_must_be_zero_or_one": (
+                observed_labels_must_be_zero_or_one
+            ),
+            "scores_must_be_probabilities": scores_must_be_probabilities,
+            "sample_weights_must_be_same_len": sample_weights_must_be_same_len,
+            "sample_weights_must_sum_to_one": sample_weights_must_sum_to_one,
+        },
+    }
+
+    dataset_validators = ("sample_weights_must_sum_to_one",)
+
+    def __init__(self, *args, bins: int = None, **kwargs):
+        self.bins = bins
+        super().__init__(*args, val_config=self.input_validator_config, **kwargs)
+
+    def reset(self):
+        if self.bins is None:
+            self.state = MetricState(scores=[], positives=[], negatives=[])
+        else:
+            self.state = MetricState(
+                positives=np.zeros(self.bins), negatives=np.zeros(self.bins)
+            )
+
+    def update(
+        self,
+        y_observed: np.ndarray = None,
+        y_predicted: np.ndarray = None,
+        sample_weights: np.ndarray = None,
+    ):
+        scores = y_predicted.reshape(-1)
+        observed = y_observed.reshape(-1) == 1
+        weights = (
+            np.ones(scores.size)
+            if sample_weights is None
+            else np.asarray(sample_weights, dtype=float).reshape(-1)
+        )
+        positives = np.where(observed, weights, 0.0)
+        negatives = weights - positives
+        if self.bins is None:
+            # scores are copied, as inputs may be reused by the caller
+            self.state.scores.append(np.array(scores, dtype=float))
+            self.state.positives.append(positives)
+            self.state.negatives.append(negatives)
+            return
+        # scores of 1 fall in the last bin, and the bins of positive samples
+        # follow those of negative samples, so both are counted in one pass
+        indices = np.minimum((scores * self.bins).astype(np.intp), self.bins - 1)
+        indices[observed] += self.bins
+        counts = np.bincount(indices, weights=weights, minlength=2 * self.bins)
+        negatives, positives = counts.reshape(2, self.bins)
+        self.state.negatives += negatives
+        self.state.positives += positives
+
+    def curve(self) -> tuple:
+        """
+        Sweep the thresholds of the scores seen since the last reset, from
+        the highest to the lowest.
+
+        :return: arrays of the thresholds, and of the true and false positive
+            counts (or weight sums) of predicting scores at or above each
+            threshold as positive
+        """
+        if self.bins is not None:
+            thresholds = np.arange(self.bins - 1, -1, -1) / self.bins
+            return (
+                thresholds,
+                np.cumsum(self.state.positives[::-1]),
+                np.cumsum(self.state.negatives[::-1]),
+            )
+        return self._sweep(
+            *(
+                np.concatenate(values) if values else np.zeros(0)
+                for values in (
+                    self.state.scores,
+                    self.state.positives,
+                    self.state.negatives,
+                )
+            )
+        )
+
+    @staticmethod
+    def _sweep(scores, positives, negatives) -> tuple:
+        order = np.argsort(scores, kind="stable")[::-1]
+        scores = scores[order]
+        tps = np.cumsum(positives[order])
+        fps = np.cumsum(negatives[order])
+        # the counts of a threshold include every sample with an equal score
+        last = np.flatnonzero(np.diff(scores, append=-np.inf))
+        return scores[last], tps[last], fps[last]
+
+    def compute(self) -> float:
+        _, tps, fps = self.curve()
+        # the sweep starts from predicting every sample as negative
+        tps = np.concatenate([[0.0], tps])
+        fps = np.concatenate([[0.0], fps])
+        return float(self._compute_from_curve(tps, fps))
+
+    @staticmethod
+    @abstractmethod
+    def _compute_from_curve(tps: np.ndarray, fps: np.ndarray):
+        """
+        Compute the metric from the true and false positive counts of a sweep
+        of decreasing thresholds, starting from no positive predictions.
+        """
+
+
+class BinaryROCAUC(BinaryThresholdMetric):
+    """
+    The Numpy Binary ROC AUC Metric provides a score that represents the area
+    under the receiver operating characteristic curve of a binary classifier,
+    i.e. the probability that a random positive sample is scored above a
+    random negative sample
+    """
+
+    @staticmethod
+    def _compute_from_curve(tps, fps):
+        tpr = BinaryROCAUC._safe_divide(tps, tps[-1])
+        fpr = BinaryROCAUC._safe_divide(fps, fps[-1])
+        return np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2)
+
+    def compute_bounds(self) -> tuple:
+        """
+        Bound the ROC AUC of the scores seen since the last reset.
+
+        With ``bins``, the order of a positive and a negative sample in the
+        same bin is unknown, and the trapezoidal AUC counts each such pair as
+        half ranked correctly. The exact AUC then lies within half the
+        proportion of these pairs of the computed AUC, so the bounds tighten
+        as bins are added. Without ``bins`` both bounds are the exact AUC.
+
+        :return: the lower and upper bounds of the ROC AUC
+        """
+        value = self.compute()
+        if self.bins is None:
+            return value, value
+        positives, negatives = self.state.positives, self.state.negatives
+        tied = self._safe_divide(
+            np.dot(positives, negatives), positives.sum() * negatives.sum()
+        )
+        return max(value - tied / 2, 0.0), min(value + tied / 2, 1.0)
+
+
+class BinaryPRAUC(BinaryThresholdMetric):
+    """
+    The Numpy Binary PR AUC Metric provides a score that represents the area
+    under the precision-recall curve of a binary classifier, computed as its
+    average precision over the recall of each threshold
+    """
+
+    @staticmethod
+    def _compute_from_curve(tps, fps):
+        precision = BinaryPRAUC._safe_divide(tps, tps + fps)
+        recall = BinaryPRAUC._safe_divide(tps, tps[-1])
+        return np.sum(np.diff(recall) * precision[1:])
+
+
+class BinaryBestThresholdAccuracy(BinaryThresholdMetric):
+    """
+    The Numpy Binary Best Threshold Accuracy Metric provides a score that
+    represents the highest proportion of a dataset that can be correctly
+    labeled by thresholding the scores of a binary classifier
+    """
+
+    @staticmethod
+    def _compute_from_curve(tps, fps):
+        # true negatives are the negatives not predicted as positive
+        correct = tps + fps[-1] - fps
+        return np.max(
+            BinaryBestThresholdAccuracy._safe_divide(correct, tps[-1] + fps[-1])
+        )
@@ -0,0 +1,304 @@
+from abc import ABC
+
+import numpy as np
+
+from otito.metrics._state import MetricState
+from otito.metrics.numpy.base_numpy_metric import NumpyBaseMetric
+from otito.metrics.numpy.classification.binary_classification import (
+    BinaryF1Score,
+    BinaryPrecision,
+    BinaryRecall,
+)
+from otito.metrics.numpy.sparse import SparseCounts
+from otito.metrics.numpy.validation.custom_types import Array
+from otito.metrics.numpy.validation.conditions import (
+    labels_must_be_same_len,
+    observed_labels_must_be_class_indices,
+    predicted_labels_must_be_class_indices,
+    sample_weights_must_be_same_len,
+    sample_weights_must_sum_to_one,
+)
+
+AVERAGES = ("micro", "macro")
+
+
+class MulticlassAccuracy(NumpyBaseMetric):
+    """
+    The Numpy Multiclass Classification Accuracy Metric provides a score that
+    represents the proportion of a dataset that was correctly labeled by a
+    multiclass classifier.
+
+    Observed labels are class indices. Predictions are either class indices,
+    or a ``(samples, classes)`` matrix of scores (e.g. logits or
+    probabilities), in which case a sample is correct when its observed class
+    is among the ``top_k`` highest scores. Ties with the k-th highest score
+    count as correct for ``top_k > 1``, while for ``top_k=1`` the predicted
+    class is the argmax of the scores, a single one of any tied classes, as
+    for the confusion metrics. Predictions are compared with the observed
+    classes directly, without one-hot encoding either of them.
+
+    :param top_k: number of highest scoring classes a sample may be found in
+    :param average: ``"micro"`` for the accuracy over all samples, or
+        ``"macro"`` for the mean of the accuracy of each observed class
+        (i.e. balanced accuracy)
+    :param num_classes: number of classes, required for ``"macro"``. Larger
+        observed labels raise a ``ValueError``, even with
+        ``validate_input=False``.
+    """
+
+    input_validator_config = {
+        "y_observed": (Array[float], None),
+        "y_predicted": (Array[float], None),
+        "sample_weights": (Array[float], None),
+        "__validators__": {
+            "labels_must_be_same_len": labels_must_be_same_len,
+            "observed_labels_must_be_class_indices": (
+                observed_labels_must_be_class_indices
+            ),
+            "predicted_labels_must_be_class_indices": (
+                predicted_labels_must_be_class_indices
+            ),
+            "sample_weights_must_be_same_len": sample_weights_must_be_same_len,
+            "sample_weights_must_sum_to_one": sample_weights_must_sum_to_one,
+        },
+    }
+
+    dataset_validators = ("sample_weights_must_sum_to_one",)
+
+    def __init__(
+        self,
+        *args,
+        top_k: int = 1,
+        average: str = "micro",
+        num_classes: int = None,
+        **kwargs,
+    ):
+        if average not in AVERAGES:
+            raise ValueError(f"average must be one of {AVERAGES}: {average}")
+        if average == "macro" and num_classes is None:
+            raise ValueError("num_classes is required for average='macro'")
+        self.top_k = top_k
+        self.average = average
+        self.num_classes = num_classes
+        super().__init__(*args, val_config=self.input_validator_config, **kwargs)
+
+    def reset(self):
+        # correct and total counts (or weight sums), per class for "macro"
+        shape = () if self.average == "micro" else (self.num_classes,)
+        self.state = MetricState(correct=np.zeros(shape), total=np.zeros(shape))
+
+    def update(
+        self,
+        y_observed: np.ndarray = None,
+        y_predicted: np.ndarray = None,
+        sample_weights: np.ndarray = None,
+    ):
+        observed = y_observed.reshape(-1).astype(np.intp)
+        if self.validate_input and self.average == "macro" and observed.size:
+            self._check_num_classes(observed.max())
+        correct = self._multiclass_correct(observed, y_predicted, self.top_k)
+        weights = None if sample_weights is None else sample_weights.reshape(-1)
+        if self.average == "micro":
+            if weights is None:
+                self.state.correct += np.count_nonzero(correct)
+                self.state.total += observed.size
+            else:
+                self.state.correct += np.dot(correct, weights)
+                self.state.total += weights.sum()
+            return
+        class_correct = np.bincount(
+            observed,
+            weights=correct if weights is None else correct * weights,
+            minlength=self.num_classes,
+        )
+        if class_correct.size > self.num_classes:
+            # larger labels lengthen the counts, so are caught without
+            # validation at no extra cost
+            self._check_num_classes(observed.max())
+        self.state.correct += class_correct
+        self.state.total += np.bincount(
+            observed, weights=weights, minlength=self.num_classes
+        )
+
+    def _check_num_classes(self, high):
+        # the validators are shared by every instance, so the number of
+        # classes of this one is checked on update
+        if high >= self.num_classes:
+            raise ValueError(
+                f"Observed labels must be class indices in [0, {self.num_classes}): "
+                f"found label {high}"
+            )
+
+    @staticmethod
+    def _multiclass_correct(
+        observed: np.ndarray, y_predicted: np.ndarray, top_k: int
+    ) -> np.ndarray:
+        """
+        Whether the observed class of each sample is predicted, as a float
+        array.
+        """
+        if y_predicted.ndim == 1:
+            if top_k != 1:
+                raise ValueError(
+                    "top_k requires predicted scores of shape (samples, classes)"
+                )
+            return (y_predicted.astype(np.intp) == observed).astype(float)
+        if top_k == 1:
+            return (np.argmax(y_predicted, axis=1) == observed).astype(float)
+        # the observed class is in the top k when fewer than k classes score
+        # higher, which needs no sort or partition of the scores
+        observed_scores = y_predicted[np.arange(observed.size), observed]
+        higher = np.count_nonzero(y_predicted > observed_scores[:, None], axis=1)
+        return (higher < top_k).astype(float)
+
+    def compute(self) -> float:
+        accuracy = self._safe_divide(self.state.correct, self.state.total)
+        if self.average == "micro":
+            return accuracy
+        # classes without observed samples are left out of the mean
+        observed = self.state.total > 0
+        return self._safe_divide(accuracy[observed].sum(), np.count_nonzero(observed))
+
+
+class MulticlassConfusionMetric(NumpyBaseMetric, ABC):
+    """
+    Base class of the Numpy Multiclass Classification Metrics derived from a
+    confusion matrix, for any number of classes.
+
+    The state is a sparse confusion matrix: the counts (or weight sums) of
+    only the (observed, predicted) class pairs that occur, keyed by a single
+    int64 per pair and held sorted (see ``SparseCounts``). Memory is
+    O(distinct pairs) rather than O(classes²), so that metrics of models with
+    hundreds of thousands of classes can be accumulated and merged across
+    workers.
+
+    Observed labels are class indices below ``2**31``. Predictions are class
+    indices below ``2**32``, or a ``(samples, classes)`` matrix of scores of
+    which the highest is predicted. The metric of each class is computed
+    one-vs-rest as that of the binary metric of the same name.
+
+    :param average: ``"macro"`` for the mean of the metric of each class that
+        is observed or predicted, or ``"micro"`` to compute the metric from
+        the confusion counts summed over classes
+    """
+
+    input_validator_config = {
+        "y_observed": (Array[float], None),
+        "y_predicted": (Array[float], None),
+        "sample_weights": (Array[float], None),
+        "__validators__": {
+            "labels_must_be_same_len": labels_must_be_same_len,
+            "observed_labels_must_be_class_indices": (
+                observed_labels_must_be_class_indices
+            ),
+            "predicted_labels_must_be_class_indices": (
+                predicted_labels_must_be_class_indices
+            ),
+            "sample_weights_must_be_same_len": sample_weights_must_be_same_len,
+            "sample_weights_must_sum_to_one": sample_weights_must_sum_to_one,
+        },
+    }
+
+    dataset_validators = ("sample_weights_must_sum_to_one",)
+
+    def __init__(self, *args, average: str = "macro", **kwargs):
+        if average not in AVERAGES:
+            raise ValueError(f"average must be one of {AVERAGES}: {average}")
+        self.average = average
+        super().__init__(*args, val_config=self.input_validator_config, **kwargs)
+
+    def reset(self):
+        self.state = MetricState(confusion=SparseCounts())
+
+    def update(
+        self,
+        y_observed: np.ndarray = None,
+        y_predicted: np.ndarray = None,
+        sample_weights: np.ndarray = None,
+    ):
+        if y_predicted.ndim == 2:
+            y_predicted = np.argmax(y_predicted, axis=1)
+        # each pair is keyed by the observed class in the high 32 bits and
+        # the predicted class in the low 32 bits
+        keys = np.left_shift(y_observed.reshape(-1).astype(np.int64), 32)
+        keys |= y_predicted.reshape(-1).astype(np.int64)
+        self.state.confusion += SparseCounts.from_keys(
+            keys, None if sample_weights is None else sample_weights.reshape(-1)
+        )
+
+    def confusion(self) -> tuple:
+        """
+        The non-zero cells of the confusion matrix of the inputs seen since
+        the last reset, in coordinate format.
+
+        :return: arrays of the observed and predicted class of each cell, and
+            of its count (or weight sum)
+        """
+        keys = self.state.confusion.keys
+        return keys >> 32, keys & 0xFFFFFFFF, self.state.confusion.counts
+
+    def _class_confusion(self) -> tuple:
+        """
+        The classes that are observed or predicted, and the true/false
+        positive/negative counts of each of them.
+        """
+        observed, predicted, counts = self.confusion()
+        classes, inverse = np.unique(
+            np.concatenate([observed, predicted]), return_inverse=True
+        )
+        observed_index, predicted_index = np.split(inverse.reshape(-1), 2)
+        correct = observed == predicted
+        tp = np.bincount(
+            observed_index[correct], weights=counts[correct], minlength=classes.size
+        )
+        fn = np.bincount(observed_index, weights=counts, minlength=classes.size) - tp
+        fp = np.bincount(predicted_index, weights=counts, minlength=classes.size) - tp
+        tn = counts.sum() - tp - fp - fn
+        return classes, tp, fp, tn, fn
+
+    def compute(self) -> float:
+        _, *confusion = self._class_confusion()
+        if self.average == "micro":
+            return self._compute_from_confusion(*(count.sum() for count in confusion))
+        scores = self._compute_from_confusion(*confusion)
+        return self._safe_divide(np.sum(scores), np.size(scores))
+
+    def compute_per_class(self) -> dict:
+        """
+        Compute the metric of each class that is observed or predicted.
+
+        :return: mapping of each class to its metric
+        """
+        classes, *confusion = self._class_confusion()
+        scores = self._compute_from_confusion(*confusion)
+        return dict(zip(classes.tolist(), np.atleast_1d(scores).tolist()))
+
+
+class MulticlassPrecision(MulticlassConfusionMetric):
+    """
+    The Numpy Multiclass Classification Precision Metric provides a score
+    that represents the proportion of the predictions of each class by a
+    multiclass classifier that were correct
+    """
+
+    _compute_from_confusion = staticmethod(BinaryPrecision._compute_from_confusion)
+
+
+class MulticlassRecall(MulticlassConfusionMetric):
+    """
+    The Numpy Multiclass Classification Recall Metric provides a score that
+    represents the proportion of the samples of each class that were
+    identified by a multiclass classifier
+    """
+
+    _compute_from_confusion = staticmethod(BinaryRecall._compute_from_confusion)
+
+
+class MulticlassF1Score(MulticlassConfusionMetric):
+    """
+    The Numpy Multiclass Classification F1 Score Metric provides a score that
+    represents the harmonic mean of the precision and recall of each class
+    predicted by a multiclass classifier
+    """
+
+    _compute_from_confusion = staticmethod(BinaryF1Score._compute_from_confusion)
@@ -0,0 +1,190 @@
+from abc import ABC
+
+import numpy as np
+
+from otito.metrics._state import MetricState
+from otito.metrics.numpy.base_numpy_metric import NumpyBaseMetric
+from otito.metrics.numpy.classification.binary_classification import (
+    BinaryAccuracy,
+    BinaryF1Score,
+    BinaryPrecision,
+    BinaryRecall,
+)
+from otito.metrics.numpy.validation.custom_types import Array
+from otito.metrics.numpy.validation.conditions import (
+    labels_must_be_same_shape,
+    observed_labels_must_be_binary,
+    sample_weights_must_be_same_len,
+    sample_weights_must_sum_to_one,
+)
+
+AVERAGES = ("micro", "macro")
+
+
+class MultilabelMetric(NumpyBaseMetric, ABC):
+    """
+    Base class of the Numpy Multilabel Classification Metrics, of which each
+    sample may have any number of labels.
+
+    Observed labels are a ``(samples, labels)`` matrix of binary labels.
+    Predictions are a matrix of the same shape of binary labels or of scores,
+    of which those at or above ``threshold`` are predicted as positive.
+
+    :param threshold: smallest score predicted as positive
+    """
+
+    input_validator_config = {
+        "y_observed": (Array[float], None),
+        "y_predicted": (Array[float], None),
+        "sample_weights": (Array[float], None),
+        "__validators__": {
+            "labels_must_be_same_shape": labels_must_be_same_shape,
+            "observed_labels_must_be_binary": observed_labels_must_be_binary,
+            "sample_weights_must_be_same_len": sample_weights_must_be_same_len,
+            "sample_weights_must_sum_to_one": sample_weights_must_sum_to_one,
+        },
+    }
+
+    dataset_validators = ("sample_weights_must_sum_to_one",)
+
+    def __init__(self, *args, threshold: float = 0.5, **kwargs):
+        self.threshold = threshold
+        super().__init__(*args, val_config=self.input_validator_config, **kwargs)
+
+    def _binarize(self, y_observed: np.ndarray, y_predicted: np.ndarray) -> tuple:
+        samples = len(y_observed)
+        return (
+            y_observed.reshape(samples, -1) == 1,
+            y_predicted.reshape(samples, -1) >= self.threshold,
+        )
+
+
+class MultilabelConfusionMetric(MultilabelMetric, ABC):
+    """
+    Base class of the Numpy Multilabel Classification Metrics derived from the
+    confusion counts of each label. The state holds the true/false
+    positive/negative counts (or weight sums) of every label, so memory is
+    O(labels) whatever the number of samples.
+
+    The metric of each label is computed as that of the binary metric of the
+    same name.
+
+    :param num_labels: number of labels of each sample
+    :param average: ``"micro"`` to compute the metric from the confusion
+        counts summed over labels, or ``"macro"`` for the mean of the metric
+        of each label
+    """
+
+    def __init__(self, *args, num_labels: int, average: str = "micro", **kwargs):
+        if average not in AVERAGES:
+            raise ValueError(f"average must be one of {AVERAGES}: {average}")
+        self.num_labels = num_labels
+        self.average = average
+        super().__init__(*args, **kwargs)
+
+    def reset(self):
+        self.state = MetricState(
+            **{name: np.zeros(self.num_labels) for name in ("tp", "fp", "tn", "fn")}
+        )
+
+    def update(
+        self,
+        y_observed: np.ndarray = None,
+        y_predicted: np.ndarray = None,
+        sample_weights: np.ndarray = None,
+    ):
+        observed, predicted = self._binarize(y_observed, y_predicted)
+        if sample_weights is None:
+            tp = np.count_nonzero(observed & predicted, axis=0)
+            observed_positive = np.count_nonzero(observed, axis=0)
+            predicted_positive = np.count_nonzero(predicted, axis=0)
+            total = len(observed)
+        else:
+            # the weights of the samples are summed per label by a product
+            weights = sample_weights.reshape(-1)
+            tp = weights @ (observed & predicted)
+            observed_positive = weights @ observed
+            predicted_positive = weights @ predicted
+            total = weights.sum()
+        fp = predicted_positive - tp
+        fn = observed_positive - tp
+        self.state.tp += tp
+        self.state.fp += fp
+        self.state.tn += total - tp - fp - fn
+        self.state.fn += fn
+
+    def compute(self) -> float:
+        counts = (self.state.tp, self.state.fp, self.state.tn, self.state.fn)
+        if self.average == "micro":
+            return self._compute_from_confusion(*(count.sum() for count in counts))
+        return np.mean(self._compute_from_confusion(*counts))
+
+
+class MultilabelAccuracy(MultilabelConfusionMetric):
+    """
+    The Numpy Multilabel Classification Accuracy Metric provides a score that
+    represents the proportion of the labels of a dataset that were correctly
+    predicted by a multilabel classifier
+    """
+
+    _compute_from_confusion = staticmethod(BinaryAccuracy._compute_from_confusion)
+
+
+class MultilabelPrecision(MultilabelConfusionMetric):
+    """
+    The Numpy Multilabel Classification Precision Metric provides a score that
+    represents the proportion of positive label predictions of a multilabel
+    classifier that were correct
+    """
+
+    _compute_from_confusion = staticmethod(BinaryPrecision._compute_from_confusion)
+
+
+class MultilabelRecall(MultilabelConfusionMetric):
+    """
+    The Numpy Multilabel Classification Recall Metric provides a score that
+    represents the proportion of positive labels that were identified by a
+    multilabel classifier
+    """
+
+    _compute_from_confusion = staticmethod(BinaryRecall._compute_from_confusion)
+
+
+class MultilabelF1Score(MultilabelConfusionMetric):
+    """
+    The Numpy Multilabel Classification F1 Score Metric provides a score that
+    represents the harmonic mean of the precision and recall of the labels
+    predicted by a multilabel classifier
+    """
+
+    _compute_from_confusion = staticmethod(BinaryF1Score._compute_from_confusion)
+
+
+class MultilabelExactMatch(MultilabelMetric):
+    """
+    The Numpy Multilabel Classification Exact Match Metric provides a score
+    that represents the proportion of a dataset of which every label was
+    correctly predicted by a multilabel classifier (i.e. subset accuracy)
+    """
+
+    def reset(self):
+        self.state = MetricState(matched=0, total=0)
+
+    def update(
+        self,
+        y_observed: np.ndarray = None,
+        y_predicted: np.ndarray = None,
+        sample_weights: np.ndarray = None,
+    ):
+        observed, predicted = self._binarize(y_observed, y_predicted)
+        matched = np.all(observed == predicted, axis=1)
+        if sample_weights is None:
+            self.state.matched += np.count_nonzero(matched)
+            self.state.total += matched.size
+        else:
+            weights = sample_weights.reshape(-1)
+            self.state.matched += np.dot(matched, weights)
+            self.state.total += weights.sum()
+
+    def compute(self) -> float:
+        return self._safe_divide(self.state.matched, self.state.total)
@@ -0,0 +1,79 @@
+import os
+
+import numpy as np
+
+DEFAULT_WINDOW_SIZE = 1 << 20
+
+
+def load_memmap(path, dtype=None, shape=None) -> np.ndarray:
+    """
+    Open an array file as a read-only memory map, so that its contents are
+    only paged in as they are read.
+
+    :param path: path to a ``.npy`` file, or to a raw binary dump
+    :param dtype: dtype of a raw binary dump, ignored for ``.npy`` files
+    :param shape: shape of a raw binary dump, inferred as 1d when omitted
+    :return: a read-only view of the file contents
+    """
+    if os.fspath(path).endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+    if dtype is None:
+        raise ValueError(f"A 'dtype' is required to open raw binary file: {path}")
+    return np.memmap(path, dtype=dtype, mode="r", shape=shape)
+
+
+def iter_windows(*arrays, window_size: int = DEFAULT_WINDOW_SIZE):
+    """
+    Yield aligned, fixed size windows over the leading axis of ``arrays``.
+    ``None`` entries are passed through unchanged.
+    """
+    length = len(arrays[0])
+    for start in range(0, length, window_size):
+        stop = start + window_size
+        yield tuple(None if array is None else array[start:stop] for array in arrays)
+
+
+def evaluate_memmap(
+    metric,
+    y_observed,
+    y_predicted,
+    sample_weights=None,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+    dtype=None,
+):
+    """
+    Evaluate a numpy metric over arrays stored on disk, bounding memory use
+    by the window size rather than the size of the files.
+
+    Inputs may be paths (opened with :func:`load_memmap`) or array-likes
+    such as existing memory maps. Windows are fed to
+    ``metric.update_from_iterable``, so each window is validated and
+    accumulated before the next one is read.
+
+    :param metric: a numpy metric, e.g. ``BinaryAccuracy()``
+    :param y_observed: observed labels, or a path to them
+    :param y_predicted: predicted labels, or a path to them
+    :param sample_weights: optional sample weights, or a path to them
+    :param window_size: number of samples per window
+    :param dtype: dtype of any raw binary dumps
+    :return: the metric computed over the whole of the inputs
+    """
+    arrays = [
+        (
+            load_memmap(source, dtype=dtype)
+            if isinstance(source, (str, os.PathLike))
+            else source
+        )
+        for source in (y_observed, y_predicted, sample_weights)
+    ]
+    if len(arrays[0]) != len(arrays[1]):
+        raise ValueError(
+            f"Shape of inputs mismatched: {len(arrays[0])} "
+            f"(observed) != {len(arrays[1])} (predicted)"
+        )
+    if arrays[2] is not None and len(arrays[2]) != len(arrays[0]):
+        raise ValueError(
+            "'sample_weights' is not the same length as input. "
+            f"Lengths (sample_weights:{len(arrays[2])}, input:{len(arrays[0])})"
+        )
+    return metric.update_from_iterable(iter_windows(*arrays, window_size=window_size))
@@ -0,0 +1,108 @@
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+def _to_shared_memory(array: np.ndarray):
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    try:
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def _update_shard(metric, descriptors, start, stop):
+    blocks, shard = [], []
+    try:
+        for descriptor in descriptors:
+            if descriptor is None:
+                shard.append(None)
+                continue
+            name, shape, dtype = descriptor
+            block = shared_memory.SharedMemory(name=name)
+            blocks.append(block)
+            shard.append(np.ndarray(shape, dtype=dtype, buffer=block.buf)[start:stop])
+        metric.update(*shard)
+        return metric.state
+    except BaseException as error:
+        # the frames of the traceback hold views of the shared memory, which
+        # would keep it from being closed and hide the error
+        traceback.clear_frames(error.__traceback__)
+        raise
+    finally:
+        # views must be released before the shared memory can be closed
+        del shard
+        for block in blocks:
+            block.close()
+
+
+def evaluate_parallel(
+    metric,
+    y_observed,
+    y_predicted,
+    sample_weights=None,
+    n_workers: int = None,
+    n_shards: int = None,
+):
+    """
+    Evaluate a numpy metric by sharding its inputs across worker processes.
+
+    Inputs are validated once, copied once into shared memory and split into
+    contiguous shards. Each worker runs ``update`` on its shards, with an
+    empty copy of ``metric`` that keeps its configuration, and returns its
+    :class:`~otito.metrics._state.MetricState`, and the partial states are
+    merged before ``compute`` is run, into ``metric`` itself when it is
+    ``stateful``.
+
+    :param metric: a numpy metric, e.g. ``BinaryAccuracy()``
+    :param y_observed: observed labels
+    :param y_predicted: predicted labels
+    :param sample_weights: optional sample weights
+    :param n_workers: number of worker processes, defaults to the cpu count
+    :param n_shards: number of shards, defaults to the number of workers
+    :return: the metric computed over the whole of the inputs
+    """
+    n_workers = n_workers or os.cpu_count()
+    n_shards = n_shards or n_workers
+    inputs = metric._parse_input(
+        y_observed=y_observed, y_predicted=y_predicted, sample_weights=sample_weights
+    )
+    arrays = [inputs[name] for name in metric.metric_args]
+
+    blocks, descriptors = [], []
+    try:
+        for array in arrays:
+            if array is None:
+                descriptors.append(None)
+                continue
+            block, descriptor = _to_shared_memory(np.asarray(array))
+            blocks.append(block)
+            descriptors.append(descriptor)
+
+        bounds = np.linspace(0, len(arrays[0]), n_shards + 1).astype(int)
+        # the states of a stateful metric are accumulated, while those of
+        # others are merged into an empty copy, e.g. rather than into the
+        # shard of the calling thread of a thread safe metric
+        target = metric if metric.stateful else metric._empty_copy()
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            states = executor.map(
+                _update_shard,
+                [metric._empty_copy()] * n_shards,
+                [descriptors] * n_shards,
+                bounds[:-1],
+                bounds[1:],
+            )
+            for state in states:
+                target.merge_state(state)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    return target._finalize()
@@ -0,0 +1,15 @@
+from otito.metrics.numpy.regression.regression_metrics import (
+    ExplainedVariance,
+    MeanAbsoluteError,
+    MeanSquaredError,
+    R2Score,
+    RootMeanSquaredError,
+)
+
+__all__ = [
+    "ExplainedVariance",
+    "MeanAbsoluteError",
+    "MeanSquaredError",
+    "R2Score",
+    "RootMeanSquaredError",
+]
@@ -0,0 +1,172 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from otito.metrics._state import MetricState
+from otito.metrics.numpy.base_numpy_metric import NumpyBaseMetric
+from otito.metrics.numpy.validation.custom_types import Array
+from otito.metrics.numpy.validation.conditions import (
+    labels_must_be_same_shape,
+    sample_weights_must_be_same_len,
+    sample_weights_must_sum_to_one,
+)
+
+
+class RegressionMetric(NumpyBaseMetric, ABC):
+    """
+    Base class of the Numpy Regression Metrics. The state of these metrics is
+    the running (weighted) count, means and centred second moments of the
+    observed values, of the residuals and of the absolute residuals, rather
+    than the inputs themselves, so that every metric derived from it shares
+    the same single pass update and memory is O(1) whatever the number of
+    samples.
+
+    The moments of each batch are computed in float64 and combined with the
+    running moments by the parallel update of Chan et al., which does not
+    lose precision as the count grows, unlike sums of squares. States are
+    combined by the same update in ``merge_state``.
+    """
+
+    input_validator_config = {
+        "y_observed": (Array[float], None),
+        "y_predicted": (Array[float], None),
+        "sample_weights": (Array[float], None),
+        "__validators__": {
+            "labels_must_be_same_shape": labels_must_be_same_shape,
+            "sample_weights_must_be_same_len": sample_weights_must_be_same_len,
+            "sample_weights_must_sum_to_one": sample_weights_must_sum_to_one,
+        },
+    }
+
+    dataset_validators = ("sample_weights_must_sum_to_one",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, val_config=self.input_validator_config, **kwargs)
+
+    def reset(self):
+        # moments of [observed, residual, absolute residual]
+        self.state = MetricState(weight=0.0, mean=np.zeros(3), m2=np.zeros(3))
+
+    def update(
+        self,
+        y_observed: np.ndarray = None,
+        y_predicted: np.ndarray = None,
+        sample_weights: np.ndarray = None,
+    ):
+        # the rows are filled and centred in place, in a single float64
+        # buffer, so that the batch costs no temporaries of its size
+        values = np.empty((3, y_observed.size))
+        observed, residual, absolute = values
+        observed[:] = y_observed.reshape(-1)
+        np.subtract(observed, y_predicted.reshape(-1), out=residual)
+        np.abs(residual, out=absolute)
+        if sample_weights is None:
+            weight = float(observed.size)
+            mean = values.mean(axis=1) if observed.size else np.zeros(3)
+            values -= mean[:, None]
+            m2 = np.einsum("ij,ij->i", values, values)
+        else:
+            weights = sample_weights.reshape(-1).astype(np.float64)
+            weight = weights.sum()
+            mean = self._safe_divide(values @ weights, weight)
+            values -= mean[:, None]
+            m2 = np.square(values, out=values) @ weights
+        self._combine(weight, mean, m2)
+
+    def merge_state(self, state: MetricState):
+        self._combine(state.weight, state.mean, state.m2)
+
+    def _combine(self, weight, mean, m2):
+        total = self.state.weight + weight
+        if total == 0:
+            return
+        delta = mean - self.state.mean
+        self.state.mean = self.state.mean + delta * (weight / total)
+        self.state.m2 = (
+            self.state.m2 + m2 + np.square(delta) * (self.state.weight * weight / total)
+        )
+        self.state.weight = total
+
+    def compute(self) -> float:
+        return self._compute_from_moments(
+            self.state.weight, self.state.mean, self.state.m2
+        )
+
+    @staticmethod
+    @abstractmethod
+    def _compute_from_moments(weight, mean, m2):
+        """
+        Compute the metric from the weight, means and centred second moments
+        of the observed values, residuals and absolute residuals.
+        """
+
+    @staticmethod
+    def _sum_squared_error(weight, mean, m2):
+        return m2[1] + weight * np.square(mean[1])
+
+    @staticmethod
+    def _explained(unexplained, total):
+        # a constant target is perfectly explained only without any error
+        if total == 0:
+            return 1.0 if unexplained == 0 else 0.0
+        return 1.0 - unexplained / total
+
+
+class MeanSquaredError(RegressionMetric):
+    """
+    The Numpy Mean Squared Error Metric provides a score that represents the
+    mean of the squared differences between observed and predicted values
+    """
+
+    @staticmethod
+    def _compute_from_moments(weight, mean, m2):
+        return MeanSquaredError._safe_divide(
+            MeanSquaredError._sum_squared_error(weight, mean, m2), weight
+        )
+
+
+class RootMeanSquaredError(RegressionMetric):
+    """
+    The Numpy Root Mean Squared Error Metric provides a score that represents
+    the square root of the mean of the squared differences between observed
+    and predicted values
+    """
+
+    @staticmethod
+    def _compute_from_moments(weight, mean, m2):
+        return np.sqrt(MeanSquaredError._compute_from_moments(weight, mean, m2))
+
+
+class MeanAbsoluteError(RegressionMetric):
+    """
+    The Numpy Mean Absolute Error Metric provides a score that represents the
+    mean of the absolute differences between observed and predicted values
+    """
+
+    @staticmethod
+    def _compute_from_moments(weight, mean, m2):
+        return mean[2]
+
+
+class R2Score(RegressionMetric):
+    """
+    The Numpy R² Score Metric provides a score that represents the proportion
+    of the variance of the observed values that is explained by the
+    predictions, i.e. the coefficient of determination
+    """
+
+    @staticmethod
+    def _compute_from_moments(weight, mean, m2):
+        return R2Score._explained(R2Score._sum_squared_error(weight, mean, m2), m2[0])
+
+
+class ExplainedVariance(RegressionMetric):
+    """
+    The Numpy Explained Variance Metric provides a score that represents the
+    proportion of the variance of the observed values that is explained by
+    the predictions, ignoring any constant bias of the predictions
+    """
+
+    @staticmethod
+    def _compute_from_moments(weight, mean, m2):
+        return ExplainedVariance._explained(m2[1], m2[0])
@@ -0,0 +1,53 @@
+import numpy as np
+
+
+class SparseCounts:
+    """
+    Counts (or weight sums) of int64 keys, of which only the keys that were
+    seen are held, as a sorted array of unique keys and an array of their
+    counts. Memory is O(distinct keys) however large the key space.
+
+    Counts are added with ``+``, so they can be the counter of a
+    ``MetricState`` and be merged across workers like dense counters.
+
+    :param keys: sorted unique keys
+    :param counts: count of each key
+    """
+
+    def __init__(self, keys: np.ndarray = None, counts: np.ndarray = None):
+        self.keys = np.zeros(0, dtype=np.int64) if keys is None else keys
+        self.counts = np.zeros(0) if counts is None else counts
+
+    @classmethod
+    def from_keys(cls, keys: np.ndarray, weights: np.ndarray = None):
+        """
+        Count the occurrences (or sum the ``weights``) of each key.
+        """
+        unique, inverse = np.unique(keys, return_inverse=True)
+        counts = np.bincount(
+            inverse.reshape(-1), weights=weights, minlength=unique.size
+        )
+        return cls(unique, counts.astype(float))
+
+    def __add__(self, other: "SparseCounts") -> "SparseCounts":
+        if not other.keys.size:
+            return SparseCounts(self.keys, self.counts.copy())
+        positions = np.searchsorted(self.keys, other.keys)
+        found = positions < self.keys.size
+        found[found] = self.keys[positions[found]] == other.keys[found]
+        if found.all():
+            # every key is already held, e.g. once the classes of a stream
+            # have been seen, so counts are added without re-sorting the keys
+            counts = self.counts.copy()
+            counts[positions] += other.counts
+            return SparseCounts(self.keys, counts)
+        return SparseCounts.from_keys(
+            np.concatenate([self.keys, other.keys]),
+            np.concatenate([self.counts, other.counts]),
+        )
+
+    def __len__(self):
+        return self.keys.size
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(keys={len(self)})"
@@ -3,6 +3,47 @@ import numpy as np
 
 from pydantic import validator
 
+BLOCK_SIZE = 1 << 16
+
+# Bounds of the class indices, so that a pair of an observed and a predicted
+# class fits in the high and low 32 bits of an int64 key
+OBSERVED_CLASS_LIMIT = 1 << 31
+PREDICTED_CLASS_LIMIT = 1 << 32
+
+
+def count_distinct_labels(*arrays: np.ndarray, limit: int = 2) -> int:
+    """
+    Count the distinct labels found across ``arrays``.
+
+    The arrays are scanned once in cache-sized blocks, tracking the block
+    minimum and maximum and checking that every element matches one of them,
+    so no concatenated copy or sort of the inputs is needed. A full
+    ``np.unique`` is only performed once more than ``limit`` labels are seen,
+    to report the exact count.
+    """
+    found = set()
+    for array in arrays:
+        flat = array.reshape(-1)
+        for start in range(0, flat.size, BLOCK_SIZE):
+            stop = start + BLOCK_SIZE
+            block = flat[start:stop]
+            low, high = block.min(), block.max()
+            if low != high and (
+                np.count_nonzero(block == low) + np.count_nonzero(block == high)
+                != block.size
+            ):
+                return _count_unique(*arrays)
+            found.update((low, high))
+            if len(found) > limit:
+                return _count_unique(*arrays)
+    if any(label != label for label in found):
+        return _count_unique(*arrays)
+    return len(found)
+
+
+def _count_unique(*arrays: np.ndarray) -> int:
+    return len(np.unique(np.concatenate([array.reshape(-1) for array in arrays])))
+
 
 @validator("y_predicted")
 def labels_must_be_same_shape(cls, v, values):
@@ -17,11 +58,9 @@ def labels_must_be_same_shape(cls, v, values):
 
 @validator("y_predicted")
 def labels_must_be_binary(cls, v, values):
-    found_classes = np.unique(np.concatenate((v, values.get("y_observed"))))
-    if len(found_classes) > 2:
-        raise ValueError(
-            f"Input is not binary: '{len(found_classes)}' class labels found"
-        )
+    found_classes = count_distinct_labels(v, values.get("y_observed"))
+    if found_classes > 2:
+        raise ValueError(f"Input is not binary: '{found_classes}' class labels found")
     return v
 
 
@@ -40,9 +79,88 @@ def sample_weights_must_be_same_len(cls, v, values):
 @validator("sample_weights")
 def sample_weights_must_sum_to_one(cls, v):
     if v is not None:
-        if not isclose(sum(v), 1.0, abs_tol=1e-7):
+        weight_sum = np.sum(v)
+        if not isclose(weight_sum, 1.0, abs_tol=1e-7):
             raise ValueError(
                 "'sample_weights' do not sum to one. "
-                f"Sum of `sample_weights`:{sum(v)}"
+                f"Sum of `sample_weights`:{weight_sum}"
             )
     return v
+
+
+@validator("y_predicted")
+def observed_labels_must_be_binary(cls, v, values):
+    observed = values.get("y_observed")
+    found_classes = count_distinct_labels(observed)
+    if found_classes > 2:
+        raise ValueError(
+            f"Observed labels are not binary: '{found_classes}' class labels found"
+        )
+    return v
+
+
+@validator("y_predicted")
+def observed_labels_must_be_zero_or_one(cls, v, values):
+    observed = values.get("y_observed")
+    invalid = (observed != 0) & (observed != 1)
+    if invalid.any():
+        label = observed[invalid].flat[0]
+        raise ValueError(
+            "Observed labels are not binary: labels must be 0 or 1, "
+            f"found label {label}"
+        )
+    return v
+
+
+@validator("y_predicted")
+def scores_must_be_probabilities(cls, v):
+    if np.isnan(v).any():
+        raise ValueError(
+            "Predicted scores must be probabilities between 0 and 1: found NaN"
+        )
+    if v.size and (v.min() < 0 or v.max() > 1):
+        raise ValueError(
+            "Predicted scores must be probabilities between 0 and 1: "
+            f"found scores in [{v.min()}, {v.max()}]"
+        )
+    return v
+
+
+@validator("y_predicted")
+def labels_must_be_same_len(cls, v, values):
+    if len(v) != len(values.get("y_observed")):
+        raise ValueError(
+            f"Shape of inputs mismatched: {len(values.get('y_observed'))} "
+            f"(observed) != {len(v)} (predicted)"
+        )
+    return v
+
+
+@validator("y_predicted")
+def observed_labels_must_be_class_indices(cls, v, values):
+    observed = values.get("y_observed")
+    if observed.size == 0:
+        return v
+    low, high = observed.min(), observed.max()
+    # scores have a column per class, which bounds the class indices
+    classes = v.shape[1] if v.ndim == 2 else OBSERVED_CLASS_LIMIT
+    if low < 0 or high >= classes or np.any(observed != np.floor(observed)):
+        raise ValueError(
+            "Observed labels must be class indices in [0, "
+            f"{classes}): found labels in [{low}, {high}]"
+        )
+    return v
+
+
+@validator("y_predicted")
+def predicted_labels_must_be_class_indices(cls, v):
+    # scores are checked against the observed labels instead
+    if v.ndim == 2 or v.size == 0:
+        return v
+    low, high = v.min(), v.max()
+    if low < 0 or high >= PREDICTED_CLASS_LIMIT or np.any(v != np.floor(v)):
+        raise ValueError(
+            "Predicted labels must be class indices in "
+            f"[0, {PREDICTED_CLASS_LIMIT}): found labels in [{low}, {high}]"
+        )
+    return v
@@ -8,7 +8,9 @@ class TypedArray(np.ndarray):
 
     @classmethod
     def validate_type(cls, val):
-        return np.array(val, dtype=cls.inner_type)
+        # np.asarray only copies when a dtype conversion is required, so
+        # ndarrays (and memmaps) of the right dtype are passed through as views
+        return np.asarray(val, dtype=cls.inner_type)
 
 
 class ArrayMeta(type):
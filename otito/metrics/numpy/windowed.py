@@ -0,0 +1,237 @@
+import numpy as np
+
+
+class _ConfusionStream:
+    """
+    Base class of the numpy streaming metrics, which keep the binary confusion
+    counts of a numpy binary metric over a moving part of a stream rather
+    than since the last ``reset``.
+
+    Batches are validated with the chunk validator of ``metric``, so weights
+    are not required to sum to one per batch.
+    """
+
+    def __init__(self, metric):
+        self.metric = metric
+        self.reset()
+
+    def reset(self):
+        # counts (or weight sums) of each confusion cell: tn, fp, fn, tp
+        self.counts = np.zeros(4)
+
+    def _parse_batch(self, y_observed, y_predicted, sample_weights):
+        inputs = self.metric._parse(
+            self.metric.chunk_validator,
+            y_observed=y_observed,
+            y_predicted=y_predicted,
+            sample_weights=sample_weights,
+        )
+        cells = self.metric._confusion_cells(
+            inputs["y_observed"], inputs["y_predicted"]
+        )
+        weights = inputs["sample_weights"]
+        if weights is not None:
+            weights = np.asarray(weights, dtype=float).reshape(-1)
+        return cells, weights
+
+    @staticmethod
+    def _timestamps(timestamps, size):
+        timestamps = np.asarray(timestamps, dtype=float).reshape(-1)
+        if timestamps.shape != (size,):
+            raise ValueError(
+                f"Shape of inputs mismatched: {timestamps.shape[0]} (timestamps) "
+                f"!= {size} (observed)"
+            )
+        return timestamps
+
+    def compute(self) -> float:
+        tn, fp, fn, tp = self.counts
+        return self.metric._compute_from_confusion(tp, fp, tn, fn)
+
+    def __call__(self, *args, **kwargs) -> float:
+        self.update(*args, **kwargs)
+        return self.compute()
+
+
+class SlidingWindowMetric(_ConfusionStream):
+    """
+    A numpy binary metric over the latest samples of a stream, e.g. the
+    accuracy of the last 10,000 predictions or of the last 5 minutes.
+
+    The confusion cell, weight and timestamp of each sample in the window are
+    held in preallocated ring buffers, and the confusion counts of the window
+    are kept up to date by adding each batch and subtracting the samples it
+    evicts, so updates cost O(1) per sample regardless of the window size.
+
+    :param metric: a numpy binary metric, e.g. ``BinaryAccuracy()``
+    :param window_size: maximum number of samples in the window
+    :param window_duration: when set, samples older than ``window_duration``
+        before the latest timestamp are also evicted. Timestamps must then be
+        passed to ``update`` and must not decrease along the stream
+    """
+
+    def __init__(self, metric, window_size: int, window_duration: float = None):
+        if window_size < 1:
+            raise ValueError(f"window_size must be positive: {window_size}")
+        self.window_size = window_size
+        self.window_duration = window_duration
+        super().__init__(metric)
+
+    def reset(self):
+        super().reset()
+        self._cells = np.zeros(self.window_size, dtype=np.uint8)
+        self._weights = np.zeros(self.window_size)
+        self._timestamps_buffer = np.zeros(self.window_size)
+        # position of the oldest sample, and number of samples held
+        self._start = 0
+        self._size = 0
+        self._weighted = False
+        self._evicted = 0
+
+    def __len__(self):
+        return self._size
+
+    def _segments(self, count):
+        # the oldest ``count`` samples, as at most two slices of the buffers
+        stop = self._start + count
+        if stop <= self.window_size:
+            return [slice(self._start, stop)]
+        return [slice(self._start, None), slice(0, stop - self.window_size)]
+
+    def _evict(self, count):
+        if count <= 0:
+            return
+        for segment in self._segments(count):
+            self.counts -= np.bincount(
+                self._cells[segment],
+                weights=self._weights[segment] if self._weighted else None,
+                minlength=4,
+            )
+        self._start = (self._start + count) % self.window_size
+        self._size -= count
+        self._evicted += count
+        if self._weighted and self._evicted >= self.window_size:
+            # sums of weights drift as weights are subtracted, so they are
+            # recounted from the buffers once per window of evictions
+            self._recount()
+
+    def _recount(self):
+        self.counts = np.zeros(4)
+        for segment in self._segments(self._size):
+            self.counts += np.bincount(
+                self._cells[segment], weights=self._weights[segment], minlength=4
+            )
+        self._evicted = 0
+
+    def _count_expired(self, cutoff):
+        # timestamps increase along the buffer, so each segment is searched
+        expired = 0
+        for segment in self._segments(self._size):
+            block = self._timestamps_buffer[segment]
+            found = np.searchsorted(block, cutoff)
+            expired += found
+            if found < block.size:
+                break
+        return expired
+
+    def update(
+        self,
+        y_observed: np.ndarray = None,
+        y_predicted: np.ndarray = None,
+        sample_weights: np.ndarray = None,
+        timestamps: np.ndarray = None,
+    ):
+        cells, weights = self._parse_batch(y_observed, y_predicted, sample_weights)
+        if self.window_duration is not None:
+            if timestamps is None:
+                raise ValueError("timestamps are required with a window_duration")
+            timestamps = self._timestamps(timestamps, cells.size)
+        if weights is not None and not self._weighted:
+            # samples seen so far had unit weights
+            self._weights[:] = 1.0
+            self._weighted = True
+
+        # only the latest window_size samples of a batch can stay in the window
+        keep = slice(max(cells.size - self.window_size, 0), None)
+        cells = cells[keep].astype(np.uint8)
+        if weights is not None:
+            weights = weights[keep]
+        elif self._weighted:
+            weights = np.ones(cells.size)
+        if timestamps is not None:
+            timestamps = timestamps[keep]
+
+        self._evict(self._size + cells.size - self.window_size)
+        self._append(cells, weights, timestamps)
+        if self.window_duration is not None and cells.size:
+            self._evict(self._count_expired(timestamps[-1] - self.window_duration))
+
+    def _append(self, cells, weights, timestamps):
+        # the buffers must have room for the batch
+        end = (self._start + self._size) % self.window_size
+        first = min(cells.size, self.window_size - end)
+        for target, source in (
+            (slice(end, end + first), slice(0, first)),
+            (slice(0, cells.size - first), slice(first, None)),
+        ):
+            self._cells[target] = cells[source]
+            if weights is not None:
+                self._weights[target] = weights[source]
+            if timestamps is not None:
+                self._timestamps_buffer[target] = timestamps[source]
+        self._size += cells.size
+        self.counts += np.bincount(cells, weights=weights, minlength=4)
+
+
+class DecayedMetric(_ConfusionStream):
+    """
+    A numpy binary metric over a stream in which the weight of each sample
+    decays exponentially with its age, so that recent samples dominate.
+
+    Ages are counted in samples, or in time when ``half_life`` is given with
+    timestamps. Each batch decays the confusion counts once and adds the
+    decayed weights of its samples with a single ``np.bincount``, so no
+    history is kept.
+
+    :param metric: a numpy binary metric, e.g. ``BinaryAccuracy()``
+    :param half_life: number of samples, or duration when timestamps are
+        passed to ``update``, after which the weight of a sample is halved
+    """
+
+    def __init__(self, metric, half_life: float):
+        if half_life <= 0:
+            raise ValueError(f"half_life must be positive: {half_life}")
+        self.half_life = half_life
+        super().__init__(metric)
+
+    def reset(self):
+        super().reset()
+        self.latest = None
+
+    def update(
+        self,
+        y_observed: np.ndarray = None,
+        y_predicted: np.ndarray = None,
+        sample_weights: np.ndarray = None,
+        timestamps: np.ndarray = None,
+    ):
+        cells, weights = self._parse_batch(y_observed, y_predicted, sample_weights)
+        if timestamps is None:
+            # the latest sample has age 0, and the state ages by the batch size
+            ages = np.arange(cells.size - 1, -1, -1, dtype=float)
+            elapsed = cells.size
+        else:
+            timestamps = self._timestamps(timestamps, cells.size)
+            latest = timestamps.max(initial=-np.inf)
+            elapsed = 0.0
+            if self.latest is not None:
+                elapsed = max(latest - self.latest, 0.0)
+                latest = max(latest, self.latest)
+            ages = latest - timestamps
+            self.latest = latest
+
+        decay = np.exp2(-ages / self.half_life)
+        if weights is not None:
+            decay *= weights
+        self.counts *= 2.0 ** (-elapsed / self.half_life)
+        self.counts += np.bincount(cells, weights=decay, minlength=4)
@@ -0,0 +1,262 @@
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import NamedTuple
+
+from pydantic import validator as pydantic_validator
+
+# The profiler recording the stages of metric calls, if any. Metrics check
+# this once per call, so profiling costs nothing more while it is disabled.
+active = None
+
+
+class StageRecord(NamedTuple):
+    metric: str
+    stage: str
+    start: int
+    duration: int
+    nbytes: int
+    allocated: int
+    thread: int
+
+
+class Profiler:
+    """
+    Records the time spent in each stage of the metric calls made while it is
+    active: ``_parse_input``, each validator of the metric, ``update`` and
+    ``compute``, along with the bytes of input each stage processed.
+
+    Stages are timed on the host, so the asynchronous kernels of e.g. a GPU
+    are attributed to the stage that first waits on them.
+
+    Usage::
+
+        with Profiler() as profiler:
+            metric(y_observed, y_predicted)
+        print(profiler.table())
+        profiler.save_chrome_trace("trace.json")
+
+    :param trace_memory: whether to record the peak bytes allocated in each
+        stage with ``tracemalloc``. This slows down the profiled calls, and
+        only sees allocations made through the python allocators (e.g. numpy,
+        but not pytorch or tensorflow tensors).
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.records = []
+        self._open_stages = threading.local()
+        self._previous = None
+        self._started_tracing = False
+
+    def __enter__(self):
+        global active
+        self._previous, active = active, self
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc_info):
+        global active
+        active = self._previous
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def stage(self, stage, metric=None, nbytes=0):
+        """
+        Record the time spent in the body of the context as a ``stage`` of
+        ``metric``. Stages opened within another stage are nested in it, and
+        are attributed to its metric unless ``metric`` is given.
+        """
+        open_stages = self._open_stages.__dict__.setdefault("stack", [])
+        if metric is None:
+            metric = open_stages[-1][0] if open_stages else ""
+        # [metric, peak traced memory of nested stages]
+        frame = [metric, 0]
+        open_stages.append(frame)
+        memory_start = 0
+        if self.trace_memory:
+            memory_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter_ns() - start
+            allocated = 0
+            open_stages.pop()
+            if self.trace_memory:
+                # nested stages reset the peak, so the largest of their peaks
+                # is carried up to this stage
+                peak = max(tracemalloc.get_traced_memory()[1], frame[1])
+                allocated = max(peak - memory_start, 0)
+                if open_stages:
+                    open_stages[-1][1] = max(open_stages[-1][1], peak)
+            self.records.append(
+                StageRecord(
+                    metric,
+                    stage,
+                    start,
+                    duration,
+                    nbytes,
+                    allocated,
+                    threading.get_ident(),
+                )
+            )
+
+    def summary(self):
+        """
+        Aggregate the recorded stages per metric and stage.
+
+        :return: a list of rows, in order of first call, each with the number
+            of ``calls``, the ``total_ms`` and ``mean_us`` time spent, the
+            ``nbytes`` of input processed, the throughput in ``mb_per_s`` and
+            the largest ``peak_allocated`` bytes of the stage
+        """
+        rows = {}
+        for record in self.records:
+            row = rows.setdefault(
+                (record.metric, record.stage),
+                {
+                    "metric": record.metric,
+                    "stage": record.stage,
+                    "calls": 0,
+                    "total_ms": 0.0,
+                    "nbytes": 0,
+                    "peak_allocated": 0,
+                },
+            )
+            row["calls"] += 1
+            row["total_ms"] += record.duration / 1e6
+            row["nbytes"] += record.nbytes
+            row["peak_allocated"] = max(row["peak_allocated"], record.allocated)
+        for row in rows.values():
+            row["mean_us"] = row["total_ms"] * 1e3 / row["calls"]
+            row["mb_per_s"] = (
+                row["nbytes"] / 1e3 / row["total_ms"] if row["total_ms"] else 0.0
+            )
+        return list(rows.values())
+
+    def table(self):
+        """
+        Format the :meth:`summary` of the recorded stages as a text table.
+        """
+        columns = (
+            "metric",
+            "stage",
+            "calls",
+            "total_ms",
+            "mean_us",
+            "nbytes",
+            "mb_per_s",
+            "peak_allocated",
+        )
+        rows = [
+            [
+                (
+                    f"{row[column]:.3f}"
+                    if isinstance(row[column], float)
+                    else str(row[column])
+                )
+                for column in columns
+            ]
+            for row in self.summary()
+        ]
+        widths = [
+            max(len(column), *(len(row[i]) for row in rows)) if rows else len(column)
+            for i, column in enumerate(columns)
+        ]
+        lines = [
+            "  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip()
+            for line in [list(columns), *rows]
+        ]
+        lines.insert(1, "  ".join("-" * width for width in widths))
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        """
+        The recorded stages as a Chrome trace, which can be opened in
+        ``chrome://tracing`` or Perfetto.
+        """
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": record.stage,
+                    "cat": record.metric,
+                    "ph": "X",
+                    "ts": record.start / 1e3,
+                    "dur": record.duration / 1e3,
+                    "pid": pid,
+                    "tid": record.thread,
+                    "args": {
+                        "metric": record.metric,
+                        "nbytes": record.nbytes,
+                        "allocated": record.allocated,
+                    },
+                }
+                for record in self.records
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def save_chrome_trace(self, path):
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+def input_nbytes(*values) -> int:
+    """
+    The total size in bytes of the array or tensor ``values``.
+    """
+    total = 0
+    for value in values:
+        nbytes = getattr(value, "nbytes", None)
+        if nbytes is None and hasattr(value, "dtype") and hasattr(value, "shape"):
+            # e.g. tf.Tensor
+            try:
+                nbytes = value.dtype.size * value.shape.num_elements()
+            except (AttributeError, TypeError):
+                nbytes = 0
+        total += int(nbytes or 0)
+    return total
+
+
+def profiled_conditions(conditions):
+    """
+    Wrap the pydantic validators ``conditions``, a mapping of names to
+    validators, so that each one is recorded as a stage of the active
+    profiler.
+    """
+    return {
+        name: _profiled_condition(name, condition)
+        for name, condition in conditions.items()
+    }
+
+
+def _profiled_condition(name, condition):
+    fields, config = condition.__validator_config__
+    func = config.func
+
+    @functools.wraps(func)
+    def profiled(cls, v, *args, **kwargs):
+        if active is None:
+            return func(cls, v, *args, **kwargs)
+        with active.stage(f"validator:{name}", nbytes=input_nbytes(v)):
+            return func(cls, v, *args, **kwargs)
+
+    return pydantic_validator(
+        *fields,
+        pre=config.pre,
+        each_item=config.each_item,
+        always=config.always,
+        check_fields=config.check_fields,
+        allow_reuse=True,
+    )(profiled)
@@ -1,3 +1,51 @@
-from otito.metrics.pytorch.classification.binary_classification import BinaryAccuracy
+from otito.metrics.pytorch.classification.binary_classification import (
+    BinaryAccuracy,
+    BinaryF1Score,
+    BinaryPrecision,
+    BinaryRecall,
+    BinarySpecificity,
+)
+from otito.metrics.pytorch.classification.binary_threshold import (
+    BinaryBestThresholdAccuracy,
+    BinaryPRAUC,
+    BinaryROCAUC,
+)
+from otito.metrics.pytorch.classification.multiclass_classification import (
+    MulticlassAccuracy,
+)
+from otito.metrics.pytorch.classification.multilabel_classification import (
+    MultilabelAccuracy,
+    MultilabelExactMatch,
+    MultilabelF1Score,
+    MultilabelPrecision,
+    MultilabelRecall,
+)
+from otito.metrics.pytorch.regression.regression_metrics import (
+    ExplainedVariance,
+    MeanAbsoluteError,
+    MeanSquaredError,
+    R2Score,
+    RootMeanSquaredError,
+)
 
-__all__ = ["BinaryAccuracy"]
+__all__ = [
+    "BinaryAccuracy",
+    "BinaryBestThresholdAccuracy",
+    "BinaryF1Score",
+    "BinaryPRAUC",
+    "BinaryPrecision",
+    "BinaryROCAUC",
+    "BinaryRecall",
+    "BinarySpecificity",
+    "ExplainedVariance",
+    "MeanAbsoluteError",
+    "MeanSquaredError",
+    "MulticlassAccuracy",
+    "MultilabelAccuracy",
+    "MultilabelExactMatch",
+    "MultilabelF1Score",
+    "MultilabelPrecision",
+    "MultilabelRecall",
+    "R2Score",
+    "RootMeanSquaredError",
+]
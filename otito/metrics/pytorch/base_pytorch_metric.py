@@ -1,15 +1,87 @@
 from abc import ABC
 
 import torch as pt
+from pydantic import create_model
 
+from otito.metrics import profiling
 from otito.metrics._base_metric import BaseMetric
+from otito.metrics.pytorch.functional import binary_confusion
+from otito.metrics.pytorch.validation.deferred import (
+    DEFERRABLE_VALIDATORS,
+    DeferredChecks,
+)
 
 
 class PyTorchBaseMetric(BaseMetric, ABC):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, validation_interval: int = None, **kwargs):
+        """
+        :param validation_interval: when set, validation checks that need a
+            device sync (e.g. that labels are binary) are deferred and run
+            once every ``validation_interval`` updates and in ``compute``,
+            instead of syncing on every update
+        """
+        if validation_interval and kwargs.get("thread_safe"):
+            raise ValueError("validation_interval is not supported with thread_safe")
+        self.validation_interval = validation_interval
+        self.deferred_checks = DeferredChecks(validation_interval or 1)
         super().__init__(*args, **kwargs)
         self.reset()
 
+    def _get_deferred_validator(self, validator):
+        """
+        Fetch a variant of ``validator`` without its deferrable validators,
+        along with the names of the validators it defers.
+        """
+        key = (self.package, self.__class__, validator)
+        if key not in BaseMetric._validator_registry:
+            names = {
+                check.func.__name__
+                for checks in validator.__validators__.values()
+                for check in checks
+            }
+            config = self.input_validator_config
+            validators = {
+                name: condition
+                for name, condition in config.get("__validators__", {}).items()
+                if name in names and name not in DEFERRABLE_VALIDATORS
+            }
+            BaseMetric._validator_registry[key] = (
+                create_model(
+                    f"{validator.__name__}Deferred",
+                    **{**config, "__validators__": validators},
+                ),
+                names.intersection(DEFERRABLE_VALIDATORS),
+            )
+        return BaseMetric._validator_registry[key]
+
+    def _parse(self, validator, *args, **kwargs):
+        if not (self.validate_input and self.validation_interval):
+            return super()._parse(validator, *args, **kwargs)
+        deferred_validator, checks = self._get_deferred_validator(validator)
+        if profiling.active is not None:
+            deferred_validator = self._get_profiled_validator(deferred_validator)
+        metric_arguments = dict(
+            deferred_validator(**self._merge_args_kwargs(*args, **kwargs))
+        )
+        self.deferred_checks.record(checks, **metric_arguments)
+        return metric_arguments
+
+    def _finalize(self):
+        try:
+            return super()._finalize()
+        except ValueError:
+            # a deferred check failed in compute, after the invalid updates
+            # were accumulated, so they are discarded as a failed parse would
+            if not self.stateful:
+                self.reset()
+            raise
+
+    @staticmethod
+    def _concatenate(tensors: list) -> pt.Tensor:
+        return pt.cat(tensors)
+
     @staticmethod
     def _tensor_equality(left_tensor: pt.Tensor, right_tensor: pt.Tensor) -> pt.Tensor:
         return (left_tensor == right_tensor).float()
+
+    _binary_confusion = staticmethod(binary_confusion)
@@ -0,0 +1,39 @@
+from otito.metrics.pytorch.classification.binary_classification import (
+    BinaryAccuracy,
+    BinaryF1Score,
+    BinaryPrecision,
+    BinaryRecall,
+    BinarySpecificity,
+)
+from otito.metrics.pytorch.classification.binary_threshold import (
+    BinaryBestThresholdAccuracy,
+    BinaryPRAUC,
+    BinaryROCAUC,
+)
+from otito.metrics.pytorch.classification.multiclass_classification import (
+    MulticlassAccuracy,
+)
+from otito.metrics.pytorch.classification.multilabel_classification import (
+    MultilabelAccuracy,
+    MultilabelExactMatch,
+    MultilabelF1Score,
+    MultilabelPrecision,
+    MultilabelRecall,
+)
+
+__all__ = [
+    "BinaryAccuracy",
+    "BinaryBestThresholdAccuracy",
+    "BinaryF1Score",
+    "BinaryPRAUC",
+    "BinaryPrecision",
+    "BinaryROCAUC",
+    "BinaryRecall",
+    "BinarySpecificity",
+    "MulticlassAccuracy",
+    "MultilabelAccuracy",
+    "MultilabelExactMatch",
+    "MultilabelF1Score",
+    "MultilabelPrecision",
+    "MultilabelRecall",
+]
@@ -1,5 +1,9 @@
+from abc import ABC, abstractmethod
+
 import torch as pt
 
+from otito.metrics._state import MetricState
+from otito.metrics.pytorch import functional as F
 from otito.metrics.pytorch.base_pytorch_metric import PyTorchBaseMetric
 from otito.metrics.pytorch.validation.conditions import (
     labels_must_be_same_shape,
@@ -9,11 +13,12 @@ from otito.metrics.pytorch.validation.conditions import (
 )
 
 
-class BinaryAccuracy(PyTorchBaseMetric):
+class BinaryConfusionMetric(PyTorchBaseMetric, ABC):
     """
-    The Pytorch Binary Classification Accuracy Metric provides a score that
-    represents the proportion of a dataset that was correctly labeled by a
-    binary classifier
+    Base class of the Pytorch Binary Classification Metrics. The state of these
+    metrics is a binary confusion matrix of true/false positive/negative
+    counts (or weight sums), accumulated in a single pass over the inputs, so
+    that every metric derived from it shares the same update.
     """
 
     class Config:
@@ -32,29 +37,15 @@ class BinaryAccuracy(PyTorchBaseMetric):
         "__config__": Config,
     }
 
-    correct: pt.Tensor
-    total: float
+    dataset_validators = ("sample_weights_must_sum_to_one",)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, val_config=self.input_validator_config, **kwargs)
 
     def reset(self):
-        self.correct: pt.Tensor = pt.tensor(0.0, dtype=pt.float32)
-        self.total: float = 0.0
-
-    def _update_binary_accuracy(
-        self, y_observed: pt.Tensor, y_predicted: pt.Tensor
-    ) -> pt.Tensor:
-        self.correct += pt.sum(self._tensor_equality(y_observed, y_predicted))
-        self.total += y_observed.numel()
-
-    def _update_weighted_binary_accuracy(
-        self, y_observed: pt.Tensor, y_predicted: pt.Tensor, sample_weights: pt.Tensor
-    ) -> pt.Tensor:
-        self.correct += pt.sum(
-            pt.dot(self._tensor_equality(y_observed, y_predicted), sample_weights)
-        )
-        self.total = 1.0
+        # the confusion counts [tp, fp, tn, fn], see pytorch.functional
+        self.state = MetricState(confusion=pt.zeros(4, dtype=pt.int64))
+        self.deferred_checks.reset()
 
     def update(
         self,
@@ -62,15 +53,74 @@ class BinaryAccuracy(PyTorchBaseMetric):
         y_predicted: pt.Tensor = None,
         sample_weights: pt.Tensor = None,
     ):
-        if sample_weights is None:
-            self._update_binary_accuracy(y_observed=y_observed, y_predicted=y_predicted)
-
-        else:
-            self._update_weighted_binary_accuracy(
-                y_observed=y_observed,
-                y_predicted=y_predicted,
-                sample_weights=sample_weights,
-            )
-
-    def compute(self) -> float:
-        return self.correct.float() / self.total
+        confusion = self._shared(
+            "binary_confusion",
+            self._binary_confusion,
+            y_observed,
+            y_predicted,
+            sample_weights,
+        )
+        # the state moves to the device of the inputs on the first update
+        self.state.confusion = self.state.confusion.to(confusion.device) + confusion
+
+    def compute(self) -> pt.Tensor:
+        self.deferred_checks.flush()
+        return self._compute_kernel(self.state.confusion)
+
+    @staticmethod
+    @abstractmethod
+    def _compute_kernel(state: pt.Tensor) -> pt.Tensor:
+        """
+        Compute the metric from a state of confusion counts, see the compute
+        kernels of pytorch.functional.
+        """
+
+
+class BinaryAccuracy(BinaryConfusionMetric):
+    """
+    The Pytorch Binary Classification Accuracy Metric provides a score that
+    represents the proportion of a dataset that was correctly labeled by a
+    binary classifier
+    """
+
+    _compute_kernel = staticmethod(F.binary_accuracy_compute)
+
+
+class BinaryPrecision(BinaryConfusionMetric):
+    """
+    The Pytorch Binary Classification Precision Metric provides a score that
+    represents the proportion of positive predictions of a binary classifier
+    that were correct
+    """
+
+    _compute_kernel = staticmethod(F.binary_precision_compute)
+
+
+class BinaryRecall(BinaryConfusionMetric):
+    """
+    The Pytorch Binary Classification Recall Metric provides a score that
+    represents the proportion of positive samples that were identified by a
+    binary classifier
+    """
+
+    _compute_kernel = staticmethod(F.binary_recall_compute)
+
+
+class BinarySpecificity(BinaryConfusionMetric):
+    """
+    The Pytorch Binary Classification Specificity Metric provides a score that
+    represents the proportion of negative samples that were identified by a
+    binary classifier
+    """
+
+    _compute_kernel = staticmethod(F.binary_specificity_compute)
+
+
+class BinaryF1Score(BinaryConfusionMetric):
+    """
+    The Pytorch Binary Classification F1 Score Metric provides a score that
+    represents the harmonic mean of the precision and recall of a binary
+    classifier
+    """
+
+    _compute_kernel = staticmethod(F.binary_f1_score_compute)
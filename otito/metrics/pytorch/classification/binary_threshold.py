@@ -0,0 +1,180 @@
+from abc import ABC, abstractmethod
+
+import torch as pt
+
+from otito.metrics._state import MetricState
+from otito.metrics.pytorch import functional as F
+from otito.metrics.pytorch.base_pytorch_metric import PyTorchBaseMetric
+from otito.metrics.pytorch.validation.conditions import (
+    labels_must_be_same_shape,
+    observed_labels_must_be_zero_or_one,
+    sample_weights_must_be_same_len,
+    sample_weights_must_sum_to_one,
+    scores_must_be_probabilities,
+)
+
+
+class BinaryThresholdMetric(PyTorchBaseMetric, ABC):
+    """
+    Base class of the Pytorch Binary Classification Metrics of probability
+    scores, which sweep every threshold at which the scores can be turned
+    into binary predictions. Observed labels are 1 for positive and 0 for
+    negative samples.
+
+    The confusion counts at every threshold are found with a single sort of
+    the scores and a cumulative sum of the positive and negative weights,
+    see ``functional.binary_threshold_sweep``.
+
+    By default the scores and weights of every update are held in the state,
+    so that the sweep is exact. With ``bins``, the state is instead a
+    ``[2, bins]`` tensor of the negative and positive weights of the scores
+    over ``bins`` equal width bins of ``[0, 1]``, which bounds the memory of
+    streaming updates and makes states mergeable by summation, at the cost
+    of only sweeping the bin edges.
+
+    :param bins: number of histogram bins, or ``None`` for an exact sweep
+    """
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    input_validator_config = {
+        "y_observed": (pt.Tensor, None),
+        "y_predicted": (pt.Tensor, None),
+        "sample_weights": (pt.Tensor, None),
+        "__validators__": {
+            "labels_must_be_same_shape": labels_must_be_same_shape,
+            "observed_labels_must_be_zero_or_one": (
+                observed_labels_must_be_zero_or_one
+            ),
+            "scores_must_be_probabilities": scores_must_be_probabilities,
+            "sample_weights_must_be_same_len": sample_weights_must_be_same_len,
+            "sample_weights_must_sum_to_one": sample_weights_must_sum_to_one,
+        },
+        "__config__": Config,
+    }
+
+    dataset_validators = ("sample_weights_must_sum_to_one",)
+
+    def __init__(self, *args, bins: int = None, **kwargs):
+        self.bins = bins
+        super().__init__(*args, val_config=self.input_validator_config, **kwargs)
+
+    def reset(self):
+        if self.bins is None:
+            self.state = MetricState(scores=[], positives=[], negatives=[])
+        else:
+            self.state = MetricState(histogram=pt.zeros(2, self.bins, dtype=pt.float64))
+        self.deferred_checks.reset()
+
+    def update(
+        self,
+        y_observed: pt.Tensor = None,
+        y_predicted: pt.Tensor = None,
+        sample_weights: pt.Tensor = None,
+    ):
+        if self.bins is not None:
+            # the state moves to the device of the inputs on the first update
+            self.state.histogram = F.binary_histogram_update(
+                self.state.histogram.to(y_predicted.device),
+                y_observed,
+                y_predicted,
+                sample_weights,
+            )
+            return
+        scores = y_predicted.reshape(-1)
+        weights = (
+            pt.ones_like(scores, dtype=pt.float64)
+            if sample_weights is None
+            else sample_weights.reshape(-1).double()
+        )
+        positives = pt.where(y_observed.reshape(-1) == 1, weights, 0.0)
+        # scores are copied, as inputs may be reused by the caller
+        self.state.scores.append(scores.clone())
+        self.state.positives.append(positives)
+        self.state.negatives.append(weights - positives)
+
+    def curve(self) -> tuple:
+        """
+        Sweep the thresholds of the scores seen since the last reset, from
+        the highest to the lowest.
+
+        :return: tensors of the thresholds, and of the true and false positive
+            counts (or weight sums) of predicting scores at or above each
+            threshold as positive
+        """
+        self.deferred_checks.flush()
+        if self.bins is not None:
+            return F.binary_histogram_sweep(self.state.histogram)
+        if not self.state.scores:
+            return (pt.zeros(0),) * 3
+        return F.binary_threshold_sweep(
+            pt.cat(self.state.scores),
+            pt.cat(self.state.positives),
+            pt.cat(self.state.negatives),
+        )
+
+    def compute(self) -> pt.Tensor:
+        _, tps, fps = self.curve()
+        return self._compute_kernel(tps, fps)
+
+    @staticmethod
+    @abstractmethod
+    def _compute_kernel(tps: pt.Tensor, fps: pt.Tensor) -> pt.Tensor:
+        """
+        Compute the metric from the true and false positive counts of a sweep
+        of decreasing thresholds, see the compute kernels of
+        pytorch.functional.
+        """
+
+
+class BinaryROCAUC(BinaryThresholdMetric):
+    """
+    The Pytorch Binary ROC AUC Metric provides a score that represents the
+    area under the receiver operating characteristic curve of a binary
+    classifier, i.e. the probability that a random positive sample is scored
+    above a random negative sample
+    """
+
+    _compute_kernel = staticmethod(F.binary_roc_auc_compute)
+
+    def compute_bounds(self) -> tuple:
+        """
+        Bound the ROC AUC of the scores seen since the last reset.
+
+        With ``bins``, the order of a positive and a negative sample in the
+        same bin is unknown, and the trapezoidal AUC counts each such pair as
+        half ranked correctly. The exact AUC then lies within half the
+        proportion of these pairs of the computed AUC, so the bounds tighten
+        as bins are added. Without ``bins`` both bounds are the exact AUC.
+
+        :return: tensors of the lower and upper bounds of the ROC AUC
+        """
+        value = self.compute()
+        if self.bins is None:
+            return value, value
+        negatives, positives = self.state.histogram
+        tied = F.safe_divide(
+            pt.dot(positives, negatives), positives.sum() * negatives.sum()
+        )
+        return (value - tied / 2).clamp(min=0.0), (value + tied / 2).clamp(max=1.0)
+
+
+class BinaryPRAUC(BinaryThresholdMetric):
+    """
+    The Pytorch Binary PR AUC Metric provides a score that represents the area
+    under the precision-recall curve of a binary classifier, computed as its
+    average precision over the recall of each threshold
+    """
+
+    _compute_kernel = staticmethod(F.binary_pr_auc_compute)
+
+
+class BinaryBestThresholdAccuracy(BinaryThresholdMetric):
+    """
+    The Pytorch Binary Best Threshold Accuracy Metric provides a score that
+    represents the highest proportion of a dataset that can be correctly
+    labeled by thresholding the scores of a binary classifier
+    """
+
+    _compute_kernel = staticmethod(F.binary_best_threshold_accuracy_compute)
@@ -0,0 +1,120 @@
+import torch as pt
+
+from otito.metrics._state import MetricState
+from otito.metrics.pytorch import functional as F
+from otito.metrics.pytorch.base_pytorch_metric import PyTorchBaseMetric
+from otito.metrics.pytorch.sync import to_host
+from otito.metrics.pytorch.validation.conditions import (
+    labels_must_be_same_len,
+    observed_labels_must_be_class_indices,
+    predicted_labels_must_be_class_indices,
+    sample_weights_must_be_same_len,
+    sample_weights_must_sum_to_one,
+)
+
+AVERAGES = ("micro", "macro")
+
+
+class MulticlassAccuracy(PyTorchBaseMetric):
+    """
+    The Pytorch Multiclass Classification Accuracy Metric provides a score
+    that represents the proportion of a dataset that was correctly labeled by
+    a multiclass classifier.
+
+    Observed labels are class indices. Predictions are either class indices,
+    or a ``[samples, classes]`` tensor of scores (e.g. logits or
+    probabilities), in which case a sample is correct when its observed class
+    is among the ``top_k`` highest scores. Ties with the k-th highest score
+    count as correct for ``top_k > 1``, while for ``top_k=1`` the predicted
+    class is the argmax of the scores, a single one of any tied classes, as
+    for the confusion metrics. Predictions are compared with the observed
+    classes directly, without one-hot encoding either of them, see
+    ``functional.multiclass_correct``.
+
+    :param top_k: number of highest scoring classes a sample may be found in
+    :param average: ``"micro"`` for the accuracy over all samples, or
+        ``"macro"`` for the mean of the accuracy of each observed class
+        (i.e. balanced accuracy)
+    :param num_classes: number of classes, required for ``"macro"``. Larger
+        observed labels raise a ``ValueError`` when ``validate_input`` is set.
+        Otherwise they are not checked on the host, to avoid a device sync,
+        and fail in the ``index_add`` of the update.
+    """
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    input_validator_config = {
+        "y_observed": (pt.Tensor, None),
+        "y_predicted": (pt.Tensor, None),
+        "sample_weights": (pt.Tensor, None),
+        "__validators__": {
+            "labels_must_be_same_len": labels_must_be_same_len,
+            "observed_labels_must_be_class_indices": (
+                observed_labels_must_be_class_indices
+            ),
+            "predicted_labels_must_be_class_indices": (
+                predicted_labels_must_be_class_indices
+            ),
+            "sample_weights_must_be_same_len": sample_weights_must_be_same_len,
+            "sample_weights_must_sum_to_one": sample_weights_must_sum_to_one,
+        },
+        "__config__": Config,
+    }
+
+    dataset_validators = ("sample_weights_must_sum_to_one",)
+
+    def __init__(
+        self,
+        *args,
+        top_k: int = 1,
+        average: str = "micro",
+        num_classes: int = None,
+        **kwargs,
+    ):
+        if average not in AVERAGES:
+            raise ValueError(f"average must be one of {AVERAGES}: {average}")
+        if average == "macro" and num_classes is None:
+            raise ValueError("num_classes is required for average='macro'")
+        self.top_k = top_k
+        self.average = average
+        self.num_classes = num_classes
+        super().__init__(*args, val_config=self.input_validator_config, **kwargs)
+
+    def reset(self):
+        # correct and total counts (or weight sums), per class for "macro"
+        shape = (2,) if self.average == "micro" else (2, self.num_classes)
+        self.state = MetricState(counts=pt.zeros(shape, dtype=pt.float64))
+        self.deferred_checks.reset()
+
+    def update(
+        self,
+        y_observed: pt.Tensor = None,
+        y_predicted: pt.Tensor = None,
+        sample_weights: pt.Tensor = None,
+    ):
+        if y_predicted.dim() == 1 and self.top_k != 1:
+            raise ValueError(
+                "top_k requires predicted scores of shape (samples, classes)"
+            )
+        if self.validate_input and self.average == "macro" and y_observed.numel():
+            # the validators are shared by every instance, so the number of
+            # classes of this one is checked on update, with a sync
+            high = to_host(y_observed.max().double())
+            if high >= self.num_classes:
+                raise ValueError(
+                    "Observed labels must be class indices in "
+                    f"[0, {self.num_classes}): found label {high}"
+                )
+        # the state moves to the device of the inputs on the first update
+        self.state.counts = F.multiclass_accuracy_update(
+            self.state.counts.to(y_predicted.device),
+            y_observed,
+            y_predicted,
+            self.top_k,
+            sample_weights,
+        )
+
+    def compute(self) -> pt.Tensor:
+        self.deferred_checks.flush()
+        return F.multiclass_accuracy_compute(self.state.counts)
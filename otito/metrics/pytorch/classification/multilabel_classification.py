@@ -0,0 +1,178 @@
+from abc import ABC, abstractmethod
+
+import torch as pt
+
+from otito.metrics._state import MetricState
+from otito.metrics.pytorch import functional as F
+from otito.metrics.pytorch.base_pytorch_metric import PyTorchBaseMetric
+from otito.metrics.pytorch.validation.conditions import (
+    labels_must_be_same_shape,
+    observed_labels_must_be_binary,
+    sample_weights_must_be_same_len,
+    sample_weights_must_sum_to_one,
+)
+
+AVERAGES = ("micro", "macro")
+
+
+class MultilabelMetric(PyTorchBaseMetric, ABC):
+    """
+    Base class of the Pytorch Multilabel Classification Metrics, of which each
+    sample may have any number of labels.
+
+    Observed labels are a ``[samples, labels]`` tensor of binary labels.
+    Predictions are a tensor of the same shape of binary labels or of scores,
+    of which those at or above ``threshold`` are predicted as positive.
+
+    :param threshold: smallest score predicted as positive
+    """
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    input_validator_config = {
+        "y_observed": (pt.Tensor, None),
+        "y_predicted": (pt.Tensor, None),
+        "sample_weights": (pt.Tensor, None),
+        "__validators__": {
+            "labels_must_be_same_shape": labels_must_be_same_shape,
+            "observed_labels_must_be_binary": observed_labels_must_be_binary,
+            "sample_weights_must_be_same_len": sample_weights_must_be_same_len,
+            "sample_weights_must_sum_to_one": sample_weights_must_sum_to_one,
+        },
+        "__config__": Config,
+    }
+
+    dataset_validators = ("sample_weights_must_sum_to_one",)
+
+    def __init__(self, *args, threshold: float = 0.5, **kwargs):
+        self.threshold = threshold
+        super().__init__(*args, val_config=self.input_validator_config, **kwargs)
+
+
+class MultilabelConfusionMetric(MultilabelMetric, ABC):
+    """
+    Base class of the Pytorch Multilabel Classification Metrics derived from
+    the confusion counts of each label. The state is a ``[4, labels]`` tensor
+    of the true/false positive/negative counts (or weight sums) of every
+    label, so memory is O(labels) whatever the number of samples.
+
+    The metric of each label is computed by the compute kernel of the binary
+    metric of the same name.
+
+    :param num_labels: number of labels of each sample
+    :param average: ``"micro"`` to compute the metric from the confusion
+        counts summed over labels, or ``"macro"`` for the mean of the metric
+        of each label
+    """
+
+    def __init__(self, *args, num_labels: int, average: str = "micro", **kwargs):
+        if average not in AVERAGES:
+            raise ValueError(f"average must be one of {AVERAGES}: {average}")
+        self.num_labels = num_labels
+        self.average = average
+        super().__init__(*args, **kwargs)
+
+    def reset(self):
+        self.state = MetricState(confusion=pt.zeros(4, self.num_labels, dtype=pt.int64))
+        self.deferred_checks.reset()
+
+    def update(
+        self,
+        y_observed: pt.Tensor = None,
+        y_predicted: pt.Tensor = None,
+        sample_weights: pt.Tensor = None,
+    ):
+        # the state moves to the device of the inputs on the first update
+        self.state.confusion = F.multilabel_confusion_update(
+            self.state.confusion.to(y_predicted.device),
+            y_observed,
+            y_predicted,
+            self.threshold,
+            sample_weights,
+        )
+
+    def compute(self) -> pt.Tensor:
+        self.deferred_checks.flush()
+        if self.average == "micro":
+            return self._compute_kernel(self.state.confusion.sum(1))
+        return self._compute_kernel(self.state.confusion).mean()
+
+    @staticmethod
+    @abstractmethod
+    def _compute_kernel(state: pt.Tensor) -> pt.Tensor:
+        """
+        Compute the metric from a state of confusion counts, see the compute
+        kernels of pytorch.functional.
+        """
+
+
+class MultilabelAccuracy(MultilabelConfusionMetric):
+    """
+    The Pytorch Multilabel Classification Accuracy Metric provides a score
+    that represents the proportion of the labels of a dataset that were
+    correctly predicted by a multilabel classifier
+    """
+
+    _compute_kernel = staticmethod(F.binary_accuracy_compute)
+
+
+class MultilabelPrecision(MultilabelConfusionMetric):
+    """
+    The Pytorch Multilabel Classification Precision Metric provides a score
+    that represents the proportion of positive label predictions of a
+    multilabel classifier that were correct
+    """
+
+    _compute_kernel = staticmethod(F.binary_precision_compute)
+
+
+class MultilabelRecall(MultilabelConfusionMetric):
+    """
+    The Pytorch Multilabel Classification Recall Metric provides a score that
+    represents the proportion of positive labels that were identified by a
+    multilabel classifier
+    """
+
+    _compute_kernel = staticmethod(F.binary_recall_compute)
+
+
+class MultilabelF1Score(MultilabelConfusionMetric):
+    """
+    The Pytorch Multilabel Classification F1 Score Metric provides a score
+    that represents the harmonic mean of the precision and recall of the
+    labels predicted by a multilabel classifier
+    """
+
+    _compute_kernel = staticmethod(F.binary_f1_score_compute)
+
+
+class MultilabelExactMatch(MultilabelMetric):
+    """
+    The Pytorch Multilabel Classification Exact Match Metric provides a score
+    that represents the proportion of a dataset of which every label was
+    correctly predicted by a multilabel classifier (i.e. subset accuracy)
+    """
+
+    def reset(self):
+        # the counts (or weight sums) [matched, total]
+        self.state = MetricState(counts=pt.zeros(2, dtype=pt.float64))
+        self.deferred_checks.reset()
+
+    def update(
+        self,
+        y_observed: pt.Tensor = None,
+        y_predicted: pt.Tensor = None,
+        sample_weights: pt.Tensor = None,
+    ):
+        self.state.counts = F.multilabel_exact_match_update(
+            self.state.counts.to(y_predicted.device),
+            y_observed,
+            y_predicted,
+            self.threshold,
+            sample_weights,
+        )
+
+    def compute(self) -> pt.Tensor:
+        self.deferred_checks.flush()
+        return F.safe_divide(self.state.counts[0], self.state.counts[1])
@@ -0,0 +1,371 @@
+"""
+Functional kernels of the PyTorch metrics.
+
+Each metric is a pair of pure functions: an update that maps a state tensor
+and a batch of inputs to a new state, and a compute that maps a state to
+the metric. The kernels have no python side effects or data dependent
+control flow, so they can be compiled with ``torch.jit.script`` or
+``torch.compile`` and fused into evaluation loops. The metric classes wrap
+these kernels.
+
+The binary classification state is a tensor of confusion counts (or weight
+sums) ordered as ``[tp, fp, tn, fn]``, and the multilabel state stacks the
+``[tp, fp, tn, fn]`` of each label into a ``[4, labels]`` tensor, so the
+binary compute kernels apply to both.
+
+The regression state is a tensor of the running weight, then the means and
+then the centred second moments of the observed values, residuals and
+absolute residuals, i.e. ``[weight, mean x 3, m2 x 3]``.
+"""
+
+from typing import Optional, Tuple
+
+import torch as pt
+
+
+def binary_confusion(
+    y_observed: pt.Tensor,
+    y_predicted: pt.Tensor,
+    sample_weights: Optional[pt.Tensor] = None,
+) -> pt.Tensor:
+    """
+    Count the ``[tp, fp, tn, fn]`` of binary labels in one pass, treating
+    ``1`` as the positive label, or sum the ``sample_weights`` of each cell.
+
+    A sample is a true positive or negative exactly when its labels are
+    equal, so that the accuracy of any two labels is their agreement: the
+    observed label counts as positive when it equals a positive prediction or
+    differs from a negative one, which for labels in ``{0, 1}`` is
+    ``y_observed == 1``.
+    """
+    predicted = y_predicted.reshape(-1) == 1
+    observed = (y_observed.reshape(-1) == y_predicted.reshape(-1)) == predicted
+    if sample_weights is None:
+        tp = (observed & predicted).sum()
+        fp = predicted.sum() - tp
+        fn = observed.sum() - tp
+        tn = observed.numel() - tp - fp - fn
+        return pt.stack([tp, fp, tn, fn])
+
+    # cells are indexed as 2 * observed + predicted, i.e. [tn, fp, fn, tp]
+    cells = observed.long() * 2 + predicted.long()
+    counts = pt.zeros(4, dtype=sample_weights.dtype, device=sample_weights.device)
+    counts = counts.index_add(0, cells, sample_weights.reshape(-1))
+    return counts[[3, 1, 0, 2]]
+
+
+def binary_confusion_update(
+    state: pt.Tensor,
+    y_observed: pt.Tensor,
+    y_predicted: pt.Tensor,
+    sample_weights: Optional[pt.Tensor] = None,
+) -> pt.Tensor:
+    return state + binary_confusion(y_observed, y_predicted, sample_weights)
+
+
+def safe_divide(numerator: pt.Tensor, denominator: pt.Tensor) -> pt.Tensor:
+    """
+    Divide elementwise, returning ``0.0`` wherever the denominator is zero.
+    """
+    numerator = numerator.double()
+    denominator = denominator.double()
+    return pt.where(denominator != 0, numerator / denominator, pt.zeros_like(numerator))
+
+
+def binary_accuracy_compute(state: pt.Tensor) -> pt.Tensor:
+    return safe_divide(state[0] + state[2], state.sum(0))
+
+
+def binary_precision_compute(state: pt.Tensor) -> pt.Tensor:
+    return safe_divide(state[0], state[0] + state[1])
+
+
+def binary_recall_compute(state: pt.Tensor) -> pt.Tensor:
+    return safe_divide(state[0], state[0] + state[3])
+
+
+def binary_specificity_compute(state: pt.Tensor) -> pt.Tensor:
+    return safe_divide(state[2], state[2] + state[1])
+
+
+def binary_f1_score_compute(state: pt.Tensor) -> pt.Tensor:
+    return safe_divide(2 * state[0], 2 * state[0] + state[1] + state[3])
+
+
+def binary_threshold_sweep(
+    scores: pt.Tensor, positives: pt.Tensor, negatives: pt.Tensor
+) -> Tuple[pt.Tensor, pt.Tensor, pt.Tensor]:
+    """
+    Sweep the thresholds of probability ``scores`` from the highest to the
+    lowest with one sort and a cumulative sum, returning the thresholds and
+    the true and false positive weight sums of predicting scores at or above
+    each threshold as positive.
+    """
+    order = pt.argsort(scores, descending=True, stable=True)
+    scores = scores[order]
+    tps = pt.cumsum(positives[order], 0)
+    fps = pt.cumsum(negatives[order], 0)
+    # the counts of a threshold include every sample with an equal score
+    last = pt.ones_like(scores, dtype=pt.bool)
+    last[:-1] = scores[1:] != scores[:-1]
+    return scores[last], tps[last], fps[last]
+
+
+def binary_histogram_update(
+    state: pt.Tensor,
+    y_observed: pt.Tensor,
+    y_predicted: pt.Tensor,
+    sample_weights: Optional[pt.Tensor] = None,
+) -> pt.Tensor:
+    """
+    Add the positive and negative weights of the scores ``y_predicted`` to a
+    ``[2, bins]`` state of histograms over equal width bins of ``[0, 1]``.
+    """
+    bins = state.shape[1]
+    scores = y_predicted.reshape(-1)
+    if sample_weights is None:
+        weights = pt.ones_like(scores, dtype=state.dtype)
+    else:
+        weights = sample_weights.reshape(-1).to(state.dtype)
+    observed = (y_observed.reshape(-1) == 1).long()
+    # scores of 1 fall in the last bin
+    indices = pt.clamp((scores * bins).long(), max=bins - 1)
+    return (
+        state.reshape(-1)
+        .index_add(0, observed * bins + indices, weights)
+        .reshape(2, bins)
+    )
+
+
+def binary_histogram_sweep(state: pt.Tensor) -> Tuple[pt.Tensor, pt.Tensor, pt.Tensor]:
+    """
+    Sweep the bin edges of a ``[2, bins]`` state of negative and positive
+    histograms from the highest to the lowest.
+    """
+    bins = state.shape[1]
+    thresholds = pt.arange(bins - 1, -1, -1, device=state.device).double() / bins
+    counts = pt.cumsum(pt.flip(state, [1]), 1)
+    return thresholds, counts[1], counts[0]
+
+
+def _with_origin(tps: pt.Tensor, fps: pt.Tensor) -> Tuple[pt.Tensor, pt.Tensor]:
+    # the sweep starts from predicting every sample as negative
+    zero = pt.zeros(1, dtype=pt.float64, device=tps.device)
+    return pt.cat([zero, tps.double()]), pt.cat([zero, fps.double()])
+
+
+def binary_roc_auc_compute(tps: pt.Tensor, fps: pt.Tensor) -> pt.Tensor:
+    tps, fps = _with_origin(tps, fps)
+    tpr = safe_divide(tps, tps[-1])
+    fpr = safe_divide(fps, fps[-1])
+    return pt.sum((fpr[1:] - fpr[:-1]) * (tpr[1:] + tpr[:-1]) / 2)
+
+
+def binary_pr_auc_compute(tps: pt.Tensor, fps: pt.Tensor) -> pt.Tensor:
+    tps, fps = _with_origin(tps, fps)
+    precision = safe_divide(tps, tps + fps)
+    recall = safe_divide(tps, tps[-1])
+    return pt.sum((recall[1:] - recall[:-1]) * precision[1:])
+
+
+def binary_best_threshold_accuracy_compute(tps: pt.Tensor, fps: pt.Tensor) -> pt.Tensor:
+    tps, fps = _with_origin(tps, fps)
+    # true negatives are the negatives not predicted as positive
+    correct = tps + fps[-1] - fps
+    return pt.max(safe_divide(correct, tps[-1] + fps[-1]))
+
+
+def multiclass_correct(
+    y_observed: pt.Tensor, y_predicted: pt.Tensor, top_k: int = 1
+) -> pt.Tensor:
+    """
+    Whether the observed class of each sample is predicted, given predicted
+    class indices or a ``[samples, classes]`` tensor of scores, in which case
+    the observed class must be among the ``top_k`` highest scores. Ties with
+    the k-th highest score count as correct for ``top_k > 1``, while for
+    ``top_k=1`` the predicted class is the argmax of the scores.
+    """
+    observed = y_observed.reshape(-1).long()
+    if y_predicted.dim() == 1:
+        return y_predicted.long() == observed
+    if top_k == 1:
+        return pt.argmax(y_predicted, 1) == observed
+    # the observed class is in the top k when fewer than k classes score
+    # higher, which needs no sort of the scores
+    observed_scores = y_predicted.gather(1, observed.unsqueeze(1))
+    return (y_predicted > observed_scores).sum(1) < top_k
+
+
+def multiclass_accuracy_update(
+    state: pt.Tensor,
+    y_observed: pt.Tensor,
+    y_predicted: pt.Tensor,
+    top_k: int = 1,
+    sample_weights: Optional[pt.Tensor] = None,
+) -> pt.Tensor:
+    """
+    Add the correct and total counts (or weight sums) of a batch to a state
+    ``[correct, total]``, or to a ``[2, classes]`` state of the counts of
+    each observed class.
+    """
+    correct = multiclass_correct(y_observed, y_predicted, top_k).to(state.dtype)
+    if sample_weights is None:
+        weights = pt.ones_like(correct)
+    else:
+        weights = sample_weights.reshape(-1).to(state.dtype)
+    counts = pt.stack([correct * weights, weights])
+    if state.dim() == 1:
+        return state + counts.sum(1)
+    return state.index_add(1, y_observed.reshape(-1).long(), counts)
+
+
+def multiclass_accuracy_compute(state: pt.Tensor) -> pt.Tensor:
+    """
+    The accuracy of a ``[correct, total]`` state, or the mean accuracy of the
+    observed classes of a ``[2, classes]`` state.
+    """
+    accuracy = safe_divide(state[0], state[1])
+    if state.dim() == 1:
+        return accuracy
+    observed = (state[1] > 0).double()
+    return safe_divide((accuracy * observed).sum(), observed.sum())
+
+
+def multilabel_confusion(
+    y_observed: pt.Tensor,
+    y_predicted: pt.Tensor,
+    threshold: float = 0.5,
+    sample_weights: Optional[pt.Tensor] = None,
+) -> pt.Tensor:
+    """
+    Count the ``[tp, fp, tn, fn]`` of each label of ``[samples, labels]``
+    tensors of binary labels, predicting scores at or above ``threshold`` as
+    positive, or sum the ``sample_weights`` of each cell.
+    """
+    samples = y_observed.shape[0]
+    observed = y_observed.reshape(samples, -1) == 1
+    predicted = y_predicted.reshape(samples, -1) >= threshold
+    if sample_weights is None:
+        tp = (observed & predicted).sum(0)
+        fp = predicted.sum(0) - tp
+        fn = observed.sum(0) - tp
+        tn = samples - tp - fp - fn
+        return pt.stack([tp, fp, tn, fn])
+
+    # the weights of the samples are summed per label by a product
+    weights = sample_weights.reshape(-1).double()
+    tp = weights @ (observed & predicted).double()
+    fp = weights @ predicted.double() - tp
+    fn = weights @ observed.double() - tp
+    tn = weights.sum() - tp - fp - fn
+    return pt.stack([tp, fp, tn, fn])
+
+
+def multilabel_confusion_update(
+    state: pt.Tensor,
+    y_observed: pt.Tensor,
+    y_predicted: pt.Tensor,
+    threshold: float = 0.5,
+    sample_weights: Optional[pt.Tensor] = None,
+) -> pt.Tensor:
+    return state + multilabel_confusion(
+        y_observed, y_predicted, threshold, sample_weights
+    )
+
+
+def multilabel_exact_match_update(
+    state: pt.Tensor,
+    y_observed: pt.Tensor,
+    y_predicted: pt.Tensor,
+    threshold: float = 0.5,
+    sample_weights: Optional[pt.Tensor] = None,
+) -> pt.Tensor:
+    """
+    Add the counts (or weight sums) of the samples of which every label is
+    predicted correctly, and of all samples, to a ``[matched, total]`` state.
+    """
+    samples = y_observed.shape[0]
+    observed = y_observed.reshape(samples, -1) == 1
+    predicted = y_predicted.reshape(samples, -1) >= threshold
+    matched = (observed == predicted).all(1).to(state.dtype)
+    if sample_weights is None:
+        weights = pt.ones_like(matched)
+    else:
+        weights = sample_weights.reshape(-1).to(state.dtype)
+    return state + pt.stack([(matched * weights).sum(), weights.sum()])
+
+
+def regression_moments(
+    y_observed: pt.Tensor,
+    y_predicted: pt.Tensor,
+    sample_weights: Optional[pt.Tensor] = None,
+) -> pt.Tensor:
+    """
+    The float64 weight, means and centred second moments of a batch of
+    observed values, residuals and absolute residuals.
+    """
+    observed = y_observed.reshape(-1).double()
+    residual = observed - y_predicted.reshape(-1).double()
+    values = pt.stack([observed, residual, residual.abs()])
+    if sample_weights is None:
+        weights = pt.ones_like(observed)
+    else:
+        weights = sample_weights.reshape(-1).double()
+    weight = weights.sum()
+    mean = safe_divide(values @ weights, weight)
+    m2 = (values - mean.unsqueeze(1)).square() @ weights
+    return pt.cat([weight.unsqueeze(0), mean, m2])
+
+
+def moments_combine(state: pt.Tensor, other: pt.Tensor) -> pt.Tensor:
+    """
+    Combine two states of moments with the parallel update of Chan et al.
+    """
+    weight = state[0] + other[0]
+    delta = other[1:4] - state[1:4]
+    mean = state[1:4] + delta * safe_divide(other[0], weight)
+    m2 = (
+        state[4:]
+        + other[4:]
+        + delta.square() * safe_divide(state[0] * other[0], weight)
+    )
+    return pt.cat([weight.unsqueeze(0), mean, m2])
+
+
+def regression_update(
+    state: pt.Tensor,
+    y_observed: pt.Tensor,
+    y_predicted: pt.Tensor,
+    sample_weights: Optional[pt.Tensor] = None,
+) -> pt.Tensor:
+    return moments_combine(
+        state, regression_moments(y_observed, y_predicted, sample_weights)
+    )
+
+
+def _explained(unexplained: pt.Tensor, total: pt.Tensor) -> pt.Tensor:
+    # a constant target is perfectly explained only without any error
+    explained = 1.0 - safe_divide(unexplained, total)
+    return pt.where(
+        (total == 0) & (unexplained != 0), pt.zeros_like(explained), explained
+    )
+
+
+def mean_squared_error_compute(state: pt.Tensor) -> pt.Tensor:
+    return safe_divide(state[5] + state[0] * state[2].square(), state[0])
+
+
+def root_mean_squared_error_compute(state: pt.Tensor) -> pt.Tensor:
+    return mean_squared_error_compute(state).sqrt()
+
+
+def mean_absolute_error_compute(state: pt.Tensor) -> pt.Tensor:
+    return state[3]
+
+
+def r2_score_compute(state: pt.Tensor) -> pt.Tensor:
+    return _explained(state[5] + state[0] * state[2].square(), state[4])
+
+
+def explained_variance_compute(state: pt.Tensor) -> pt.Tensor:
+    return _explained(state[5], state[4])
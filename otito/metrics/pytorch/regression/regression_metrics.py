@@ -0,0 +1,132 @@
+from abc import ABC, abstractmethod
+
+import torch as pt
+
+from otito.metrics._state import MetricState
+from otito.metrics.pytorch import functional as F
+from otito.metrics.pytorch.base_pytorch_metric import PyTorchBaseMetric
+from otito.metrics.pytorch.validation.conditions import (
+    labels_must_be_same_shape,
+    sample_weights_must_be_same_len,
+    sample_weights_must_sum_to_one,
+)
+
+
+class RegressionMetric(PyTorchBaseMetric, ABC):
+    """
+    Base class of the Pytorch Regression Metrics. The state of these metrics
+    is the running (weighted) count, means and centred second moments of the
+    observed values, of the residuals and of the absolute residuals, rather
+    than the inputs themselves, so that every metric derived from it shares
+    the same single pass update and memory is O(1) whatever the number of
+    samples.
+
+    The moments of each batch are computed in float64 and combined with the
+    running moments by the parallel update of Chan et al., see
+    ``functional.moments_combine``. States are combined by the same update
+    in ``merge_state``.
+    """
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    input_validator_config = {
+        "y_observed": (pt.Tensor, None),
+        "y_predicted": (pt.Tensor, None),
+        "sample_weights": (pt.Tensor, None),
+        "__validators__": {
+            "labels_must_be_same_shape": labels_must_be_same_shape,
+            "sample_weights_must_be_same_len": sample_weights_must_be_same_len,
+            "sample_weights_must_sum_to_one": sample_weights_must_sum_to_one,
+        },
+        "__config__": Config,
+    }
+
+    dataset_validators = ("sample_weights_must_sum_to_one",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, val_config=self.input_validator_config, **kwargs)
+
+    def reset(self):
+        # [weight, mean x 3, m2 x 3], see pytorch.functional
+        self.state = MetricState(moments=pt.zeros(7, dtype=pt.float64))
+        self.deferred_checks.reset()
+
+    def update(
+        self,
+        y_observed: pt.Tensor = None,
+        y_predicted: pt.Tensor = None,
+        sample_weights: pt.Tensor = None,
+    ):
+        # the state moves to the device of the inputs on the first update
+        self.state.moments = F.regression_update(
+            self.state.moments.to(y_predicted.device),
+            y_observed,
+            y_predicted,
+            sample_weights,
+        )
+
+    def merge_state(self, state: MetricState):
+        moments = state.moments.to(self.state.moments.device)
+        self.state.moments = F.moments_combine(self.state.moments, moments)
+
+    def compute(self) -> pt.Tensor:
+        self.deferred_checks.flush()
+        return self._compute_kernel(self.state.moments)
+
+    @staticmethod
+    @abstractmethod
+    def _compute_kernel(state: pt.Tensor) -> pt.Tensor:
+        """
+        Compute the metric from a state of moments, see the compute kernels
+        of pytorch.functional.
+        """
+
+
+class MeanSquaredError(RegressionMetric):
+    """
+    The Pytorch Mean Squared Error Metric provides a score that represents the
+    mean of the squared differences between observed and predicted values
+    """
+
+    _compute_kernel = staticmethod(F.mean_squared_error_compute)
+
+
+class RootMeanSquaredError(RegressionMetric):
+    """
+    The Pytorch Root Mean Squared Error Metric provides a score that
+    represents the square root of the mean of the squared differences
+    between observed and predicted values
+    """
+
+    _compute_kernel = staticmethod(F.root_mean_squared_error_compute)
+
+
+class MeanAbsoluteError(RegressionMetric):
+    """
+    The Pytorch Mean Absolute Error Metric provides a score that represents
+    the mean of the absolute differences between observed and predicted
+    values
+    """
+
+    _compute_kernel = staticmethod(F.mean_absolute_error_compute)
+
+
+class R2Score(RegressionMetric):
+    """
+    The Pytorch R² Score Metric provides a score that represents the
+    proportion of the variance of the observed values that is explained by
+    the predictions, i.e. the coefficient of determination
+    """
+
+    _compute_kernel = staticmethod(F.r2_score_compute)
+
+
+class ExplainedVariance(RegressionMetric):
+    """
+    The Pytorch Explained Variance Metric provides a score that represents the
+    proportion of the variance of the observed values that is explained by
+    the predictions, ignoring any constant bias of the predictions
+    """
+
+    _compute_kernel = staticmethod(F.explained_variance_compute)
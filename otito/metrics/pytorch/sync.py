@@ -0,0 +1,39 @@
+import torch as pt
+
+_sync_hooks = []
+
+
+class SyncHookHandle:
+    """
+    Handle returned by :func:`register_sync_hook`, used to remove the hook.
+    """
+
+    def __init__(self, hook):
+        self.hook = hook
+
+    def remove(self):
+        if self.hook in _sync_hooks:
+            _sync_hooks.remove(self.hook)
+
+
+def register_sync_hook(hook) -> SyncHookHandle:
+    """
+    Register a callable that is called with the tensor being copied whenever
+    the PyTorch metrics copy a tensor to the host, i.e. whenever they force a
+    device synchronisation. Useful to count or trace syncs in update loops.
+
+    :param hook: callable taking the tensor being copied
+    :return: a handle whose ``remove`` method unregisters the hook
+    """
+    _sync_hooks.append(hook)
+    return SyncHookHandle(hook)
+
+
+def to_host(tensor: pt.Tensor):
+    """
+    Copy a tensor to the host as python scalars, notifying any sync hooks.
+    All device synchronisation in the PyTorch metrics goes through here.
+    """
+    for hook in _sync_hooks:
+        hook(tensor)
+    return tensor.tolist()
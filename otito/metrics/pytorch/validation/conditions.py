@@ -3,6 +3,26 @@ import torch as pt
 
 from pydantic import validator
 
+from otito.metrics.pytorch.sync import to_host
+
+
+def binary_label_summary(*tensors: pt.Tensor) -> pt.Tensor:
+    """
+    Summarise the labels of ``tensors`` on their device, without syncing, as
+    ``[low, high, not_binary]``: the smallest and largest labels, and whether
+    any label differs from both of them.
+    """
+    low = pt.stack([tensor.min() for tensor in tensors]).min()
+    high = pt.stack([tensor.max() for tensor in tensors]).max()
+    not_binary = pt.stack(
+        [((tensor != low) & (tensor != high)).any() for tensor in tensors]
+    ).any()
+    return pt.stack([low.double(), high.double(), not_binary.double()])
+
+
+def count_unique_labels(*tensors: pt.Tensor) -> int:
+    return pt.unique(pt.cat([tensor.reshape(-1) for tensor in tensors], 0)).numel()
+
 
 @validator("y_predicted")
 def labels_must_be_same_shape(cls, v, values):
@@ -17,10 +37,13 @@ def labels_must_be_same_shape(cls, v, values):
 
 @validator("y_predicted")
 def labels_must_be_binary(cls, v, values):
-    found_classes = pt.unique(pt.cat((v, values.get("y_observed")), 0))
-    if list(found_classes.size())[0] > 2:
+    if v.numel() == 0:
+        return v
+    low, high, not_binary = to_host(binary_label_summary(v, values.get("y_observed")))
+    if not_binary:
         raise ValueError(
-            f"Input is not binary: '{found_classes.size()[0]}' class labels found"
+            "Input is not binary: "
+            f"'{count_unique_labels(v, values.get('y_observed'))}' class labels found"
         )
     return v
 
@@ -40,9 +63,119 @@ def sample_weights_must_be_same_len(cls, v, values):
 @validator("sample_weights")
 def sample_weights_must_sum_to_one(cls, v):
     if v is not None:
-        if not isclose(v.sum().item(), 1.0, abs_tol=1e-7):
+        weight_sum = to_host(v.sum())
+        if not isclose(weight_sum, 1.0, abs_tol=1e-7):
             raise ValueError(
                 "'sample_weights' do not sum to one. "
-                f"Sum of `sample_weights`:{v.sum().item()}"
+                f"Sum of `sample_weights`:{weight_sum}"
             )
     return v
+
+
+@validator("y_predicted")
+def observed_labels_must_be_binary(cls, v, values):
+    observed = values.get("y_observed")
+    if observed.numel() == 0:
+        return v
+    _, _, not_binary = to_host(binary_label_summary(observed))
+    if not_binary:
+        raise ValueError(
+            "Observed labels are not binary: "
+            f"'{count_unique_labels(observed)}' class labels found"
+        )
+    return v
+
+
+@validator("y_predicted")
+def observed_labels_must_be_zero_or_one(cls, v, values):
+    observed = values.get("y_observed")
+    invalid = (observed != 0) & (observed != 1)
+    if to_host(invalid.any()):
+        label = observed[invalid].reshape(-1)[0].item()
+        raise ValueError(
+            "Observed labels are not binary: labels must be 0 or 1, "
+            f"found label {label}"
+        )
+    return v
+
+
+@validator("y_predicted")
+def scores_must_be_probabilities(cls, v):
+    if v.numel() == 0:
+        return v
+    low, high, nan = to_host(
+        pt.stack([v.min().double(), v.max().double(), v.isnan().any().double()])
+    )
+    if nan:
+        raise ValueError(
+            "Predicted scores must be probabilities between 0 and 1: found NaN"
+        )
+    if low < 0 or high > 1:
+        raise ValueError(
+            "Predicted scores must be probabilities between 0 and 1: "
+            f"found scores in [{low}, {high}]"
+        )
+    return v
+
+
+@validator("y_predicted")
+def labels_must_be_same_len(cls, v, values):
+    if v.shape[0] != values.get("y_observed").shape[0]:
+        raise ValueError(
+            f"Shape of inputs mismatched: {values.get('y_observed').shape[0]} "
+            f"(observed) != {v.shape[0]} (predicted)"
+        )
+    return v
+
+
+@validator("y_predicted")
+def observed_labels_must_be_class_indices(cls, v, values):
+    observed = values.get("y_observed")
+    if observed.numel() == 0:
+        return v
+    low, high, fractional = to_host(
+        pt.stack(
+            [
+                observed.min().double(),
+                observed.max().double(),
+                (
+                    (observed != observed.floor()).any().double()
+                    if observed.is_floating_point()
+                    else pt.zeros((), dtype=pt.float64, device=observed.device)
+                ),
+            ]
+        )
+    )
+    # scores have a column per class, which bounds the class indices
+    classes = v.shape[1] if v.dim() == 2 else float("inf")
+    if low < 0 or high >= classes or fractional:
+        raise ValueError(
+            "Observed labels must be class indices in [0, "
+            f"{classes}): found labels in [{low}, {high}]"
+        )
+    return v
+
+
+@validator("y_predicted")
+def predicted_labels_must_be_class_indices(cls, v):
+    # scores are checked against the observed labels instead
+    if v.dim() == 2 or v.numel() == 0:
+        return v
+    low, high, fractional = to_host(
+        pt.stack(
+            [
+                v.min().double(),
+                v.max().double(),
+                (
+                    (v != v.floor()).any().double()
+                    if v.is_floating_point()
+                    else pt.zeros((), dtype=pt.float64, device=v.device)
+                ),
+            ]
+        )
+    )
+    if low < 0 or fractional:
+        raise ValueError(
+            f"Predicted labels must be class indices: found labels in [{low}, {high}]"
+        )
+    return v
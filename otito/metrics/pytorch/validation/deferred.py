@@ -0,0 +1,76 @@
+from math import isclose
+
+import torch as pt
+
+from otito.metrics.pytorch.sync import to_host
+from otito.metrics.pytorch.validation.conditions import binary_label_summary
+
+# Validators that need a host sync, and so can be deferred
+DEFERRABLE_VALIDATORS = ("labels_must_be_binary", "sample_weights_must_sum_to_one")
+
+
+class DeferredChecks:
+    """
+    Checks of the PyTorch metric inputs that need a device synchronisation.
+
+    Rather than syncing on every update, each update records a small summary
+    tensor of its inputs on their device, and the summaries of all pending
+    updates are copied to the host and checked in one sync every
+    ``interval`` updates, or when ``flush`` is called.
+
+    :param interval: number of updates between syncs
+    """
+
+    def __init__(self, interval: int):
+        self.interval = interval
+        self.reset()
+
+    def reset(self):
+        self._pending = []
+        self._labels = set()
+
+    def record(self, checks, y_observed, y_predicted, sample_weights=None):
+        """
+        Record the summary of an update's inputs for the deferred ``checks``,
+        a subset of ``DEFERRABLE_VALIDATORS``.
+        """
+        nan = pt.tensor(float("nan"), dtype=pt.float64, device=y_observed.device)
+        summary = [nan, nan, nan, nan]
+        if "labels_must_be_binary" in checks and y_observed.numel():
+            summary[:3] = binary_label_summary(y_observed, y_predicted).unbind()
+        if "sample_weights_must_sum_to_one" in checks and sample_weights is not None:
+            summary[3] = sample_weights.sum().double()
+        self._pending.append(pt.stack(summary))
+        if len(self._pending) >= self.interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Check all pending summaries with a single sync, raising a
+        ``ValueError`` on the first failed check. The checks are cleared when
+        one fails, so that later updates are not checked against the labels
+        of the failed ones.
+        """
+        if not self._pending:
+            return
+        summaries = to_host(pt.stack(self._pending))
+        self._pending = []
+        try:
+            self._check(summaries)
+        except ValueError:
+            self.reset()
+            raise
+
+    def _check(self, summaries):
+        for low, high, not_binary, weight_sum in summaries:
+            if low == low:
+                self._labels.update((low, high))
+                if not_binary or len(self._labels) > 2:
+                    raise ValueError(
+                        "Input is not binary: more than '2' class labels found"
+                    )
+            if weight_sum == weight_sum and not isclose(weight_sum, 1.0, abs_tol=1e-7):
+                raise ValueError(
+                    "'sample_weights' do not sum to one. "
+                    f"Sum of `sample_weights`:{weight_sum}"
+                )
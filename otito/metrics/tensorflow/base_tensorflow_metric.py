@@ -6,10 +6,59 @@ from otito.metrics._base_metric import BaseMetric
 
 
 class TensorflowBaseMetric(BaseMetric, ABC):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, thread_safe=False, **kwargs):
+        if thread_safe:
+            raise ValueError(
+                "Tensorflow metrics do not support thread_safe: their state is "
+                "held in variables updated by compiled functions"
+            )
         super().__init__(*args, **kwargs)
         self.reset()
 
+    @staticmethod
+    def _concatenate(tensors: list) -> tf.Tensor:
+        return tf.concat(tensors, axis=0)
+
     @staticmethod
     def _tensor_equality(left_tensor: tf.Tensor, right_tensor: tf.Tensor) -> tf.Tensor:
         return tf.cast(tf.math.equal(left_tensor, right_tensor), tf.float32)
+
+    @staticmethod
+    @tf.function(reduce_retracing=True)
+    def _binary_confusion(
+        y_observed: tf.Tensor,
+        y_predicted: tf.Tensor,
+        sample_weights: tf.Tensor = None,
+    ) -> tuple:
+        """
+        Count the true positives, false positives, true negatives and false
+        negatives of binary labels in one pass, treating ``1`` as the
+        positive label. With ``sample_weights`` the weights of each cell are
+        summed instead. Compiled into a graph, traced once per input signature.
+
+        A sample is a true positive or negative exactly when its labels are
+        equal, so that the accuracy of any two labels is their agreement: the
+        observed label counts as positive when it equals a positive
+        prediction or differs from a negative one, which for labels in
+        ``{0, 1}`` is ``y_observed == 1``.
+        """
+        y_predicted = tf.reshape(y_predicted, [-1])
+        predicted = y_predicted == 1
+        observed = (tf.reshape(y_observed, [-1]) == y_predicted) == predicted
+        cells = 2 * tf.cast(observed, tf.int32) + tf.cast(predicted, tf.int32)
+        if sample_weights is not None:
+            sample_weights = tf.cast(tf.reshape(sample_weights, [-1]), tf.float64)
+        counts = tf.math.bincount(
+            cells, weights=sample_weights, minlength=4, maxlength=4, dtype=tf.float64
+        )
+        tn, fp, fn, tp = tf.unstack(counts, num=4)
+        return tp, fp, tn, fn
+
+    @staticmethod
+    def _safe_divide(numerator, denominator) -> tf.Tensor:
+        """
+        Divide elementwise, returning ``0.0`` wherever the denominator is zero.
+        """
+        return tf.math.divide_no_nan(
+            tf.cast(numerator, tf.float64), tf.cast(denominator, tf.float64)
+        )
@@ -1,8 +1,12 @@
+from abc import ABC, abstractmethod
+
 import tensorflow as tf
 
+from otito.metrics._state import MetricState
 from otito.metrics.tensorflow.base_tensorflow_metric import TensorflowBaseMetric
 
 from otito.metrics.tensorflow.validation.conditions import (
+    assert_valid_inputs,
     labels_must_be_same_shape,
     labels_must_be_binary,
     sample_weights_must_be_same_len,
@@ -10,11 +14,12 @@ from otito.metrics.tensorflow.validation.conditions import (
 )
 
 
-class BinaryAccuracy(TensorflowBaseMetric):
+class BinaryConfusionMetric(TensorflowBaseMetric, ABC):
     """
-    The Tensorflow Binary Classification Accuracy Metric provides a score that
-    represents the proportion of a dataset that was correctly labeled by a
-    binary classifier
+    Base class of the Tensorflow Binary Classification Metrics. The state of these
+    metrics is a binary confusion matrix of true/false positive/negative
+    counts (or weight sums), accumulated in a single pass over the inputs, so
+    that every metric derived from it shares the same update.
     """
 
     class Config:
@@ -33,31 +38,34 @@ class BinaryAccuracy(TensorflowBaseMetric):
         "__config__": Config,
     }
 
-    correct: tf.Tensor
-    total: float
+    dataset_validators = ("sample_weights_must_sum_to_one",)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, val_config=self.input_validator_config, **kwargs)
 
     def reset(self):
-        self.correct: tf.Tensor = tf.constant(0.0, dtype=tf.float32)
-        self.total: float = 0.0
-
-    def _update_binary_accuracy(
-        self, y_observed: tf.Tensor, y_predicted: tf.Tensor
-    ) -> float:
-        self.correct += tf.reduce_sum(self._tensor_equality(y_observed, y_predicted))
-        self.total += tf.size(y_observed).numpy()
-
-    def _update_weighted_binary_accuracy(
-        self, y_observed: tf.Tensor, y_predicted: tf.Tensor, sample_weights: tf.Tensor
-    ) -> float:
-        self.correct += tf.tensordot(
-            self._tensor_equality(y_observed, y_predicted),
-            sample_weights,
-            axes=1,
-        )
-        self.total = 1.0
+        # counters are tf.Variables, zeroed in place once created so that
+        # functions traced with them stay valid
+        if hasattr(self, "state"):
+            self._zero_state()
+        else:
+            self.state = MetricState(
+                **{
+                    name: tf.Variable(0.0, dtype=tf.float64, trainable=False)
+                    for name in ("tp", "fp", "tn", "fn")
+                }
+            )
+
+    @tf.function
+    def _zero_state(self):
+        for counter in vars(self.state).values():
+            counter.assign(tf.zeros_like(counter))
+
+    def _accumulate(self, tp, fp, tn, fn):
+        self.state.tp.assign_add(tp)
+        self.state.fp.assign_add(fp)
+        self.state.tn.assign_add(tn)
+        self.state.fn.assign_add(fn)
 
     def update(
         self,
@@ -65,15 +73,119 @@ class BinaryAccuracy(TensorflowBaseMetric):
         y_predicted: tf.Tensor = None,
         sample_weights: tf.Tensor = None,
     ):
-        if sample_weights is None:
-            self._update_binary_accuracy(y_observed=y_observed, y_predicted=y_predicted)
-
+        if self._intermediates is None:
+            self._update_variables(y_observed, y_predicted, sample_weights)
         else:
-            self._update_weighted_binary_accuracy(
-                y_observed=y_observed,
-                y_predicted=y_predicted,
-                sample_weights=sample_weights,
+            self._accumulate(
+                *self._shared(
+                    "binary_confusion",
+                    self._binary_confusion,
+                    y_observed,
+                    y_predicted,
+                    sample_weights,
+                )
             )
 
+    @tf.function(reduce_retracing=True)
+    def _update_variables(self, y_observed, y_predicted, sample_weights=None):
+        self._accumulate(
+            *self._binary_confusion(y_observed, y_predicted, sample_weights)
+        )
+
+    @tf.function(reduce_retracing=True)
+    def update_state(
+        self,
+        y_observed: tf.Tensor,
+        y_predicted: tf.Tensor,
+        sample_weights: tf.Tensor = None,
+    ):
+        """
+        Graph compiled update, traced once per input signature, that can be
+        called inside a ``tf.function`` or ``tf.data`` pipeline. Inputs are
+        validated with ``tf.debugging`` assertions when ``validate_input`` is
+        set, instead of the eager pydantic validators.
+        """
+        assertions = (
+            assert_valid_inputs(y_observed, y_predicted, sample_weights)
+            if self.validate_input
+            else []
+        )
+        with tf.control_dependencies(assertions):
+            self._update_variables(y_observed, y_predicted, sample_weights)
+
     def compute(self) -> float:
-        return self.correct.numpy() / self.total
+        return self._compute_state().numpy()
+
+    @tf.function
+    def _compute_state(self):
+        return self._compute_from_confusion(
+            self.state.tp, self.state.fp, self.state.tn, self.state.fn
+        )
+
+    @staticmethod
+    @abstractmethod
+    def _compute_from_confusion(tp, fp, tn, fn):
+        """
+        Compute the metric from confusion counts. Counts may be scalars or
+        arrays of counts, in which case the metric is computed elementwise.
+        """
+
+
+class BinaryAccuracy(BinaryConfusionMetric):
+    """
+    The Tensorflow Binary Classification Accuracy Metric provides a score that
+    represents the proportion of a dataset that was correctly labeled by a
+    binary classifier
+    """
+
+    @staticmethod
+    def _compute_from_confusion(tp, fp, tn, fn):
+        return BinaryAccuracy._safe_divide(tp + tn, tp + fp + tn + fn)
+
+
+class BinaryPrecision(BinaryConfusionMetric):
+    """
+    The Tensorflow Binary Classification Precision Metric provides a score that
+    represents the proportion of positive predictions of a binary classifier
+    that were correct
+    """
+
+    @staticmethod
+    def _compute_from_confusion(tp, fp, tn, fn):
+        return BinaryPrecision._safe_divide(tp, tp + fp)
+
+
+class BinaryRecall(BinaryConfusionMetric):
+    """
+    The Tensorflow Binary Classification Recall Metric provides a score that
+    represents the proportion of positive samples that were identified by a
+    binary classifier
+    """
+
+    @staticmethod
+    def _compute_from_confusion(tp, fp, tn, fn):
+        return BinaryRecall._safe_divide(tp, tp + fn)
+
+
+class BinarySpecificity(BinaryConfusionMetric):
+    """
+    The Tensorflow Binary Classification Specificity Metric provides a score that
+    represents the proportion of negative samples that were identified by a
+    binary classifier
+    """
+
+    @staticmethod
+    def _compute_from_confusion(tp, fp, tn, fn):
+        return BinarySpecificity._safe_divide(tn, tn + fp)
+
+
+class BinaryF1Score(BinaryConfusionMetric):
+    """
+    The Tensorflow Binary Classification F1 Score Metric provides a score that
+    represents the harmonic mean of the precision and recall of a binary
+    classifier
+    """
+
+    @staticmethod
+    def _compute_from_confusion(tp, fp, tn, fn):
+        return BinaryF1Score._safe_divide(2 * tp, 2 * tp + fp + fn)
@@ -0,0 +1,224 @@
+from abc import ABC, abstractmethod
+
+import tensorflow as tf
+
+from otito.metrics._state import MetricState
+from otito.metrics.tensorflow.base_tensorflow_metric import TensorflowBaseMetric
+
+from otito.metrics.tensorflow.validation.conditions import (
+    labels_must_be_same_shape,
+    observed_labels_must_be_zero_or_one,
+    sample_weights_must_be_same_len,
+    sample_weights_must_sum_to_one,
+    scores_must_be_probabilities,
+)
+
+
+class BinaryThresholdMetric(TensorflowBaseMetric, ABC):
+    """
+    Base class of the Tensorflow Binary Classification Metrics of probability
+    scores, which sweep every threshold at which the scores can be turned
+    into binary predictions. Observed labels are 1 for positive and 0 for
+    negative samples.
+
+    The confusion counts at every threshold are found with a single sort of
+    the scores and a cumulative sum of the positive and negative weights,
+    rather than by thresholding the scores once per threshold.
+
+    By default the scores and weights of every update are held in the state,
+    so that the sweep is exact. With ``bins``, the state is instead a
+    ``[2, bins]`` variable of the negative and positive weights of the scores
+    over ``bins`` equal width bins of ``[0, 1]``, which bounds the memory of
+    streaming updates and makes states mergeable by summation, at the cost
+    of only sweeping the bin edges.
+
+    :param bins: number of histogram bins, or ``None`` for an exact sweep
+    """
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    input_validator_config = {
+        "y_observed": (tf.Tensor, None),
+        "y_predicted": (tf.Tensor, None),
+        "sample_weights": (tf.Tensor, None),
+        "__validators__": {
+            "labels_must_be_same_shape": labels_must_be_same_shape,
+            "observed_labels_must_be_zero_or_one": (
+                observed_labels_must_be_zero_or_one
+            ),
+            "scores_must_be_probabilities": scores_must_be_probabilities,
+            "sample_weights_must_be_same_len": sample_weights_must_be_same_len,
+            "sample_weights_must_sum_to_one": sample_weights_must_sum_to_one,
+        },
+        "__config__": Config,
+    }
+
+    dataset_validators = ("sample_weights_must_sum_to_one",)
+
+    def __init__(self, *args, bins: int = None, **kwargs):
+        self.bins = bins
+        super().__init__(*args, val_config=self.input_validator_config, **kwargs)
+
+    def reset(self):
+        if self.bins is None:
+            self.state = MetricState(scores=[], positives=[], negatives=[])
+        elif hasattr(self, "state"):
+            self.state.histogram.assign(tf.zeros_like(self.state.histogram))
+        else:
+            self.state = MetricState(
+                histogram=tf.Variable(
+                    tf.zeros([2, self.bins], dtype=tf.float64), trainable=False
+                )
+            )
+
+    def update(
+        self,
+        y_observed: tf.Tensor = None,
+        y_predicted: tf.Tensor = None,
+        sample_weights: tf.Tensor = None,
+    ):
+        scores = tf.reshape(y_predicted, [-1])
+        weights = (
+            tf.ones_like(scores, dtype=tf.float64)
+            if sample_weights is None
+            else tf.cast(tf.reshape(sample_weights, [-1]), tf.float64)
+        )
+        observed = tf.reshape(y_observed, [-1]) == 1
+        if self.bins is not None:
+            self.state.histogram.assign_add(
+                self._histogram(observed, scores, weights, self.bins)
+            )
+            return
+        positives = tf.where(observed, weights, tf.zeros_like(weights))
+        self.state.scores.append(tf.cast(scores, tf.float64))
+        self.state.positives.append(positives)
+        self.state.negatives.append(weights - positives)
+
+    @staticmethod
+    def _histogram(observed, scores, weights, bins):
+        # scores of 1 fall in the last bin
+        indices = tf.minimum(
+            tf.cast(tf.cast(scores, tf.float64) * bins, tf.int32), bins - 1
+        )
+        indices += tf.cast(observed, tf.int32) * bins
+        counts = tf.math.unsorted_segment_sum(weights, indices, 2 * bins)
+        return tf.reshape(counts, [2, bins])
+
+    def curve(self) -> tuple:
+        """
+        Sweep the thresholds of the scores seen since the last reset, from
+        the highest to the lowest.
+
+        :return: tensors of the thresholds, and of the true and false positive
+            counts (or weight sums) of predicting scores at or above each
+            threshold as positive
+        """
+        if self.bins is not None:
+            thresholds = tf.range(self.bins - 1, -1, -1, dtype=tf.float64) / self.bins
+            counts = tf.cumsum(tf.reverse(self.state.histogram, [1]), axis=1)
+            return thresholds, counts[1], counts[0]
+        if not self.state.scores:
+            return (tf.zeros([0], dtype=tf.float64),) * 3
+        return self._sweep(
+            tf.concat(self.state.scores, 0),
+            tf.concat(self.state.positives, 0),
+            tf.concat(self.state.negatives, 0),
+        )
+
+    @staticmethod
+    def _sweep(scores, positives, negatives) -> tuple:
+        order = tf.argsort(scores, direction="DESCENDING", stable=True)
+        scores = tf.gather(scores, order)
+        tps = tf.cumsum(tf.gather(positives, order))
+        fps = tf.cumsum(tf.gather(negatives, order))
+        # the counts of a threshold include every sample with an equal score
+        last = tf.concat([scores[1:] != scores[:-1], [True]], 0)
+        return (
+            tf.boolean_mask(scores, last),
+            tf.boolean_mask(tps, last),
+            tf.boolean_mask(fps, last),
+        )
+
+    def compute(self) -> float:
+        _, tps, fps = self.curve()
+        # the sweep starts from predicting every sample as negative
+        zero = tf.zeros([1], dtype=tf.float64)
+        tps = tf.concat([zero, tps], 0)
+        fps = tf.concat([zero, fps], 0)
+        return self._compute_from_curve(tps, fps).numpy()
+
+    @staticmethod
+    @abstractmethod
+    def _compute_from_curve(tps: tf.Tensor, fps: tf.Tensor) -> tf.Tensor:
+        """
+        Compute the metric from the true and false positive counts of a sweep
+        of decreasing thresholds, starting from no positive predictions.
+        """
+
+
+class BinaryROCAUC(BinaryThresholdMetric):
+    """
+    The Tensorflow Binary ROC AUC Metric provides a score that represents the
+    area under the receiver operating characteristic curve of a binary
+    classifier, i.e. the probability that a random positive sample is scored
+    above a random negative sample
+    """
+
+    @staticmethod
+    def _compute_from_curve(tps, fps):
+        tpr = BinaryROCAUC._safe_divide(tps, tps[-1])
+        fpr = BinaryROCAUC._safe_divide(fps, fps[-1])
+        return tf.reduce_sum((fpr[1:] - fpr[:-1]) * (tpr[1:] + tpr[:-1]) / 2)
+
+    def compute_bounds(self) -> tuple:
+        """
+        Bound the ROC AUC of the scores seen since the last reset.
+
+        With ``bins``, the order of a positive and a negative sample in the
+        same bin is unknown, and the trapezoidal AUC counts each such pair as
+        half ranked correctly. The exact AUC then lies within half the
+        proportion of these pairs of the computed AUC, so the bounds tighten
+        as bins are added. Without ``bins`` both bounds are the exact AUC.
+
+        :return: the lower and upper bounds of the ROC AUC
+        """
+        value = self.compute()
+        if self.bins is None:
+            return value, value
+        negatives, positives = tf.unstack(self.state.histogram, num=2)
+        tied = self._safe_divide(
+            tf.reduce_sum(positives * negatives),
+            tf.reduce_sum(positives) * tf.reduce_sum(negatives),
+        ).numpy()
+        return max(value - tied / 2, 0.0), min(value + tied / 2, 1.0)
+
+
+class BinaryPRAUC(BinaryThresholdMetric):
+    """
+    The Tensorflow Binary PR AUC Metric provides a score that represents the
+    area under the precision-recall curve of a binary classifier, computed as
+    its average precision over the recall of each threshold
+    """
+
+    @staticmethod
+    def _compute_from_curve(tps, fps):
+        precision = BinaryPRAUC._safe_divide(tps, tps + fps)
+        recall = BinaryPRAUC._safe_divide(tps, tps[-1])
+        return tf.reduce_sum((recall[1:] - recall[:-1]) * precision[1:])
+
+
+class BinaryBestThresholdAccuracy(BinaryThresholdMetric):
+    """
+    The Tensorflow Binary Best Threshold Accuracy Metric provides a score that
+    represents the highest proportion of a dataset that can be correctly
+    labeled by thresholding the scores of a binary classifier
+    """
+
+    @staticmethod
+    def _compute_from_curve(tps, fps):
+        # true negatives are the negatives not predicted as positive
+        correct = tps + fps[-1] - fps
+        return tf.reduce_max(
+            BinaryBestThresholdAccuracy._safe_divide(correct, tps[-1] + fps[-1])
+        )
@@ -0,0 +1,182 @@
+import tensorflow as tf
+
+from otito.metrics._state import MetricState
+from otito.metrics.tensorflow.base_tensorflow_metric import TensorflowBaseMetric
+
+from otito.metrics.tensorflow.validation.conditions import (
+    labels_must_be_same_len,
+    observed_labels_must_be_class_indices,
+    predicted_labels_must_be_class_indices,
+    sample_weights_must_be_same_len,
+    sample_weights_must_sum_to_one,
+)
+
+AVERAGES = ("micro", "macro")
+
+
+class MulticlassAccuracy(TensorflowBaseMetric):
+    """
+    The Tensorflow Multiclass Classification Accuracy Metric provides a score
+    that represents the proportion of a dataset that was correctly labeled by
+    a multiclass classifier.
+
+    Observed labels are class indices. Predictions are either class indices,
+    or a ``[samples, classes]`` tensor of scores (e.g. logits or
+    probabilities), in which case a sample is correct when its observed class
+    is among the ``top_k`` highest scores. Ties with the k-th highest score
+    count as correct for ``top_k > 1``, while for ``top_k=1`` the predicted
+    class is the argmax of the scores, a single one of any tied classes, as
+    for the confusion metrics. Predictions are compared with the observed
+    classes directly, without one-hot encoding either of them.
+
+    :param top_k: number of highest scoring classes a sample may be found in
+    :param average: ``"micro"`` for the accuracy over all samples, or
+        ``"macro"`` for the mean of the accuracy of each observed class
+        (i.e. balanced accuracy)
+    :param num_classes: number of classes, required for ``"macro"``. Larger
+        observed labels raise a ``ValueError`` when ``validate_input`` is set,
+        and an ``InvalidArgumentError`` from the compiled update otherwise.
+    """
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    input_validator_config = {
+        "y_observed": (tf.Tensor, None),
+        "y_predicted": (tf.Tensor, None),
+        "sample_weights": (tf.Tensor, None),
+        "__validators__": {
+            "labels_must_be_same_len": labels_must_be_same_len,
+            "observed_labels_must_be_class_indices": (
+                observed_labels_must_be_class_indices
+            ),
+            "predicted_labels_must_be_class_indices": (
+                predicted_labels_must_be_class_indices
+            ),
+            "sample_weights_must_be_same_len": sample_weights_must_be_same_len,
+            "sample_weights_must_sum_to_one": sample_weights_must_sum_to_one,
+        },
+        "__config__": Config,
+    }
+
+    dataset_validators = ("sample_weights_must_sum_to_one",)
+
+    def __init__(
+        self,
+        *args,
+        top_k: int = 1,
+        average: str = "micro",
+        num_classes: int = None,
+        **kwargs,
+    ):
+        if average not in AVERAGES:
+            raise ValueError(f"average must be one of {AVERAGES}: {average}")
+        if average == "macro" and num_classes is None:
+            raise ValueError("num_classes is required for average='macro'")
+        self.top_k = top_k
+        self.average = average
+        self.num_classes = num_classes
+        super().__init__(*args, val_config=self.input_validator_config, **kwargs)
+
+    def reset(self):
+        # correct and total counts (or weight sums), per class for "macro";
+        # the variables are zeroed in place once created so that functions
+        # traced with them stay valid
+        if hasattr(self, "state"):
+            self.state.counts.assign(tf.zeros_like(self.state.counts))
+            return
+        shape = [2] if self.average == "micro" else [2, self.num_classes]
+        self.state = MetricState(
+            counts=tf.Variable(tf.zeros(shape, dtype=tf.float64), trainable=False)
+        )
+
+    def update(
+        self,
+        y_observed: tf.Tensor = None,
+        y_predicted: tf.Tensor = None,
+        sample_weights: tf.Tensor = None,
+    ):
+        if y_predicted.shape.rank == 1 and self.top_k != 1:
+            raise ValueError(
+                "top_k requires predicted scores of shape (samples, classes)"
+            )
+        if self.validate_input and self.average == "macro" and tf.size(y_observed):
+            # the validators are shared by every instance, so the number of
+            # classes of this one is checked on update
+            high = tf.reduce_max(y_observed).numpy()
+            if high >= self.num_classes:
+                raise ValueError(
+                    "Observed labels must be class indices in "
+                    f"[0, {self.num_classes}): found label {high}"
+                )
+        self._update_variables(y_observed, y_predicted, sample_weights)
+
+    @tf.function(reduce_retracing=True)
+    def _update_variables(self, y_observed, y_predicted, sample_weights=None):
+        observed = tf.cast(tf.reshape(y_observed, [-1]), tf.int64)
+        correct = tf.cast(
+            self._multiclass_correct(observed, y_predicted, self.top_k), tf.float64
+        )
+        if sample_weights is None:
+            weights = tf.ones_like(correct)
+        else:
+            weights = tf.cast(tf.reshape(sample_weights, [-1]), tf.float64)
+        counts = tf.stack([correct * weights, weights])
+        if self.average == "micro":
+            self.state.counts.assign_add(tf.reduce_sum(counts, axis=1))
+            return
+        observed = tf.cast(observed, tf.int32)
+        # bincount would drop larger labels silently
+        in_range = tf.debugging.assert_less(
+            observed,
+            self.num_classes,
+            message=(
+                f"Observed labels must be class indices in [0, {self.num_classes})"
+            ),
+        )
+        with tf.control_dependencies([in_range]):
+            self.state.counts.assign_add(
+                tf.stack(
+                    [
+                        tf.math.bincount(
+                            observed,
+                            weights=class_counts,
+                            minlength=self.num_classes,
+                            maxlength=self.num_classes,
+                            dtype=tf.float64,
+                        )
+                        for class_counts in tf.unstack(counts, num=2)
+                    ]
+                )
+            )
+
+    @staticmethod
+    def _multiclass_correct(observed, y_predicted, top_k):
+        """
+        Whether the observed class of each sample is predicted.
+        """
+        if y_predicted.shape.rank == 1:
+            return tf.cast(y_predicted, tf.int64) == observed
+        if top_k == 1:
+            return tf.argmax(y_predicted, axis=1) == observed
+        # the observed class is in the top k when fewer than k classes score
+        # higher, which needs no sort of the scores
+        observed_scores = tf.gather(y_predicted, observed, axis=1, batch_dims=1)
+        higher = tf.reduce_sum(
+            tf.cast(y_predicted > observed_scores[:, None], tf.int32), axis=1
+        )
+        return higher < top_k
+
+    def compute(self) -> float:
+        return self._compute_state().numpy()
+
+    @tf.function
+    def _compute_state(self):
+        accuracy = self._safe_divide(self.state.counts[0], self.state.counts[1])
+        if self.average == "micro":
+            return accuracy
+        # classes without observed samples are left out of the mean
+        observed = tf.cast(self.state.counts[1] > 0, tf.float64)
+        return self._safe_divide(
+            tf.reduce_sum(accuracy * observed), tf.reduce_sum(observed)
+        )
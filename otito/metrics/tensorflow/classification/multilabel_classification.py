@@ -0,0 +1,213 @@
+from abc import ABC
+
+import tensorflow as tf
+
+from otito.metrics._state import MetricState
+from otito.metrics.tensorflow.base_tensorflow_metric import TensorflowBaseMetric
+from otito.metrics.tensorflow.classification.binary_classification import (
+    BinaryAccuracy,
+    BinaryF1Score,
+    BinaryPrecision,
+    BinaryRecall,
+)
+
+from otito.metrics.tensorflow.validation.conditions import (
+    labels_must_be_same_shape,
+    observed_labels_must_be_binary,
+    sample_weights_must_be_same_len,
+    sample_weights_must_sum_to_one,
+)
+
+AVERAGES = ("micro", "macro")
+
+
+class MultilabelMetric(TensorflowBaseMetric, ABC):
+    """
+    Base class of the Tensorflow Multilabel Classification Metrics, of which
+    each sample may have any number of labels.
+
+    Observed labels are a ``[samples, labels]`` tensor of binary labels.
+    Predictions are a tensor of the same shape of binary labels or of scores,
+    of which those at or above ``threshold`` are predicted as positive.
+
+    :param threshold: smallest score predicted as positive
+    """
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    input_validator_config = {
+        "y_observed": (tf.Tensor, None),
+        "y_predicted": (tf.Tensor, None),
+        "sample_weights": (tf.Tensor, None),
+        "__validators__": {
+            "labels_must_be_same_shape": labels_must_be_same_shape,
+            "observed_labels_must_be_binary": observed_labels_must_be_binary,
+            "sample_weights_must_be_same_len": sample_weights_must_be_same_len,
+            "sample_weights_must_sum_to_one": sample_weights_must_sum_to_one,
+        },
+        "__config__": Config,
+    }
+
+    dataset_validators = ("sample_weights_must_sum_to_one",)
+
+    def __init__(self, *args, threshold: float = 0.5, **kwargs):
+        self.threshold = threshold
+        super().__init__(*args, val_config=self.input_validator_config, **kwargs)
+
+    def reset(self):
+        # counters are tf.Variables, zeroed in place once created so that
+        # functions traced with them stay valid
+        if hasattr(self, "state"):
+            for counter in vars(self.state).values():
+                counter.assign(tf.zeros_like(counter))
+        else:
+            self.state = MetricState(
+                **{
+                    name: tf.Variable(
+                        tf.zeros(shape, dtype=tf.float64), trainable=False
+                    )
+                    for name, shape in self._state_shapes().items()
+                }
+            )
+
+    def update(
+        self,
+        y_observed: tf.Tensor = None,
+        y_predicted: tf.Tensor = None,
+        sample_weights: tf.Tensor = None,
+    ):
+        self._update_variables(y_observed, y_predicted, sample_weights)
+
+    def _binarize(self, y_observed, y_predicted):
+        samples = tf.shape(y_observed)[0]
+        observed = tf.reshape(y_observed, [samples, -1]) == 1
+        predicted = tf.reshape(y_predicted, [samples, -1]) >= tf.cast(
+            self.threshold, y_predicted.dtype
+        )
+        return observed, predicted
+
+    def compute(self) -> float:
+        return self._compute_state().numpy()
+
+
+class MultilabelConfusionMetric(MultilabelMetric, ABC):
+    """
+    Base class of the Tensorflow Multilabel Classification Metrics derived
+    from the confusion counts of each label. The state holds the true/false
+    positive/negative counts (or weight sums) of every label, so memory is
+    O(labels) whatever the number of samples.
+
+    The metric of each label is computed as that of the binary metric of the
+    same name.
+
+    :param num_labels: number of labels of each sample
+    :param average: ``"micro"`` to compute the metric from the confusion
+        counts summed over labels, or ``"macro"`` for the mean of the metric
+        of each label
+    """
+
+    def __init__(self, *args, num_labels: int, average: str = "micro", **kwargs):
+        if average not in AVERAGES:
+            raise ValueError(f"average must be one of {AVERAGES}: {average}")
+        self.num_labels = num_labels
+        self.average = average
+        super().__init__(*args, **kwargs)
+
+    def _state_shapes(self):
+        return {name: [self.num_labels] for name in ("tp", "fp", "tn", "fn")}
+
+    @tf.function(reduce_retracing=True)
+    def _update_variables(self, y_observed, y_predicted, sample_weights=None):
+        observed, predicted = self._binarize(y_observed, y_predicted)
+        if sample_weights is None:
+            weights = tf.ones([tf.shape(observed)[0]], dtype=tf.float64)
+        else:
+            weights = tf.cast(tf.reshape(sample_weights, [-1]), tf.float64)
+
+        # the weights of the samples are summed per label by a product
+        def weighted_sum(mask):
+            return tf.linalg.matvec(tf.cast(mask, tf.float64), weights, True)
+
+        tp = weighted_sum(observed & predicted)
+        fp = weighted_sum(predicted) - tp
+        fn = weighted_sum(observed) - tp
+        self.state.tp.assign_add(tp)
+        self.state.fp.assign_add(fp)
+        self.state.tn.assign_add(tf.reduce_sum(weights) - tp - fp - fn)
+        self.state.fn.assign_add(fn)
+
+    @tf.function
+    def _compute_state(self):
+        counts = (self.state.tp, self.state.fp, self.state.tn, self.state.fn)
+        if self.average == "micro":
+            return self._compute_from_confusion(
+                *(tf.reduce_sum(count) for count in counts)
+            )
+        return tf.reduce_mean(self._compute_from_confusion(*counts))
+
+
+class MultilabelAccuracy(MultilabelConfusionMetric):
+    """
+    The Tensorflow Multilabel Classification Accuracy Metric provides a score
+    that represents the proportion of the labels of a dataset that were
+    correctly predicted by a multilabel classifier
+    """
+
+    _compute_from_confusion = staticmethod(BinaryAccuracy._compute_from_confusion)
+
+
+class MultilabelPrecision(MultilabelConfusionMetric):
+    """
+    The Tensorflow Multilabel Classification Precision Metric provides a score
+    that represents the proportion of positive label predictions of a
+    multilabel classifier that were correct
+    """
+
+    _compute_from_confusion = staticmethod(BinaryPrecision._compute_from_confusion)
+
+
+class MultilabelRecall(MultilabelConfusionMetric):
+    """
+    The Tensorflow Multilabel Classification Recall Metric provides a score
+    that represents the proportion of positive labels that were identified by
+    a multilabel classifier
+    """
+
+    _compute_from_confusion = staticmethod(BinaryRecall._compute_from_confusion)
+
+
+class MultilabelF1Score(MultilabelConfusionMetric):
+    """
+    The Tensorflow Multilabel Classification F1 Score Metric provides a score
+    that represents the harmonic mean of the precision and recall of the
+    labels predicted by a multilabel classifier
+    """
+
+    _compute_from_confusion = staticmethod(BinaryF1Score._compute_from_confusion)
+
+
+class MultilabelExactMatch(MultilabelMetric):
+    """
+    The Tensorflow Multilabel Classification Exact Match Metric provides a
+    score that represents the proportion of a dataset of which every label
+    was correctly predicted by a multilabel classifier (i.e. subset accuracy)
+    """
+
+    def _state_shapes(self):
+        return {"matched": [], "total": []}
+
+    @tf.function(reduce_retracing=True)
+    def _update_variables(self, y_observed, y_predicted, sample_weights=None):
+        observed, predicted = self._binarize(y_observed, y_predicted)
+        matched = tf.cast(tf.reduce_all(observed == predicted, axis=1), tf.float64)
+        if sample_weights is None:
+            weights = tf.ones_like(matched)
+        else:
+            weights = tf.cast(tf.reshape(sample_weights, [-1]), tf.float64)
+        self.state.matched.assign_add(tf.reduce_sum(matched * weights))
+        self.state.total.assign_add(tf.reduce_sum(weights))
+
+    @tf.function
+    def _compute_state(self):
+        return self._safe_divide(self.state.matched, self.state.total)
@@ -0,0 +1,192 @@
+from abc import ABC, abstractmethod
+
+import tensorflow as tf
+
+from otito.metrics._state import MetricState
+from otito.metrics.tensorflow.base_tensorflow_metric import TensorflowBaseMetric
+
+from otito.metrics.tensorflow.validation.conditions import (
+    labels_must_be_same_shape,
+    sample_weights_must_be_same_len,
+    sample_weights_must_sum_to_one,
+)
+
+
+class RegressionMetric(TensorflowBaseMetric, ABC):
+    """
+    Base class of the Tensorflow Regression Metrics. The state of these
+    metrics is the running (weighted) count, means and centred second moments
+    of the observed values, of the residuals and of the absolute residuals,
+    rather than the inputs themselves, so that every metric derived from it
+    shares the same single pass update and memory is O(1) whatever the
+    number of samples.
+
+    The moments of each batch are computed in float64 and combined with the
+    running moments by the parallel update of Chan et al., which does not
+    lose precision as the count grows, unlike sums of squares. States are
+    combined by the same update in ``merge_state``.
+    """
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    input_validator_config = {
+        "y_observed": (tf.Tensor, None),
+        "y_predicted": (tf.Tensor, None),
+        "sample_weights": (tf.Tensor, None),
+        "__validators__": {
+            "labels_must_be_same_shape": labels_must_be_same_shape,
+            "sample_weights_must_be_same_len": sample_weights_must_be_same_len,
+            "sample_weights_must_sum_to_one": sample_weights_must_sum_to_one,
+        },
+        "__config__": Config,
+    }
+
+    dataset_validators = ("sample_weights_must_sum_to_one",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, val_config=self.input_validator_config, **kwargs)
+
+    def reset(self):
+        # moments of [observed, residual, absolute residual]; the variables
+        # are zeroed in place once created so that functions traced with
+        # them stay valid
+        if hasattr(self, "state"):
+            for counter in vars(self.state).values():
+                counter.assign(tf.zeros_like(counter))
+            return
+        self.state = MetricState(
+            weight=tf.Variable(tf.zeros([], dtype=tf.float64), trainable=False),
+            mean=tf.Variable(tf.zeros([3], dtype=tf.float64), trainable=False),
+            m2=tf.Variable(tf.zeros([3], dtype=tf.float64), trainable=False),
+        )
+
+    def update(
+        self,
+        y_observed: tf.Tensor = None,
+        y_predicted: tf.Tensor = None,
+        sample_weights: tf.Tensor = None,
+    ):
+        self._update_variables(y_observed, y_predicted, sample_weights)
+
+    @tf.function(reduce_retracing=True)
+    def _update_variables(self, y_observed, y_predicted, sample_weights=None):
+        observed = tf.cast(tf.reshape(y_observed, [-1]), tf.float64)
+        residual = observed - tf.cast(tf.reshape(y_predicted, [-1]), tf.float64)
+        values = tf.stack([observed, residual, tf.abs(residual)])
+        if sample_weights is None:
+            weights = tf.ones_like(observed)
+        else:
+            weights = tf.cast(tf.reshape(sample_weights, [-1]), tf.float64)
+        weight = tf.reduce_sum(weights)
+        mean = self._safe_divide(tf.linalg.matvec(values, weights), weight)
+        m2 = tf.linalg.matvec(tf.square(values - mean[:, None]), weights)
+        self._combine(weight, mean, m2)
+
+    def merge_state(self, state: MetricState):
+        self._combine(
+            state.weight.read_value(), state.mean.read_value(), state.m2.read_value()
+        )
+
+    def _combine(self, weight, mean, m2):
+        total = self.state.weight + weight
+        delta = mean - self.state.mean
+        self.state.m2.assign(
+            self.state.m2
+            + m2
+            + tf.square(delta) * self._safe_divide(self.state.weight * weight, total)
+        )
+        self.state.mean.assign_add(delta * self._safe_divide(weight, total))
+        self.state.weight.assign(total)
+
+    def compute(self) -> float:
+        return self._compute_state().numpy()
+
+    @tf.function
+    def _compute_state(self):
+        return self._compute_from_moments(
+            self.state.weight, self.state.mean, self.state.m2
+        )
+
+    @staticmethod
+    @abstractmethod
+    def _compute_from_moments(weight, mean, m2):
+        """
+        Compute the metric from the weight, means and centred second moments
+        of the observed values, residuals and absolute residuals.
+        """
+
+    @staticmethod
+    def _sum_squared_error(weight, mean, m2):
+        return m2[1] + weight * tf.square(mean[1])
+
+    @staticmethod
+    def _explained(unexplained, total):
+        # a constant target is perfectly explained only without any error
+        explained = 1.0 - RegressionMetric._safe_divide(unexplained, total)
+        return tf.where(
+            tf.logical_and(total == 0, unexplained != 0),
+            tf.zeros_like(explained),
+            explained,
+        )
+
+
+class MeanSquaredError(RegressionMetric):
+    """
+    The Tensorflow Mean Squared Error Metric provides a score that represents
+    the mean of the squared differences between observed and predicted values
+    """
+
+    @staticmethod
+    def _compute_from_moments(weight, mean, m2):
+        return MeanSquaredError._safe_divide(
+            MeanSquaredError._sum_squared_error(weight, mean, m2), weight
+        )
+
+
+class RootMeanSquaredError(RegressionMetric):
+    """
+    The Tensorflow Root Mean Squared Error Metric provides a score that
+    represents the square root of the mean of the squared differences between
+    observed and predicted values
+    """
+
+    @staticmethod
+    def _compute_from_moments(weight, mean, m2):
+        return tf.sqrt(MeanSquaredError._compute_from_moments(weight, mean, m2))
+
+
+class MeanAbsoluteError(RegressionMetric):
+    """
+    The Tensorflow Mean Absolute Error Metric provides a score that represents
+    the mean of the absolute differences between observed and predicted
+    values
+    """
+
+    @staticmethod
+    def _compute_from_moments(weight, mean, m2):
+        return tf.identity(mean[2])
+
+
+class R2Score(RegressionMetric):
+    """
+    The Tensorflow R² Score Metric provides a score that represents the
+    proportion of the variance of the observed values that is explained by
+    the predictions, i.e. the coefficient of determination
+    """
+
+    @staticmethod
+    def _compute_from_moments(weight, mean, m2):
+        return R2Score._explained(R2Score._sum_squared_error(weight, mean, m2), m2[0])
+
+
+class ExplainedVariance(RegressionMetric):
+    """
+    The Tensorflow Explained Variance Metric provides a score that represents
+    the proportion of the variance of the observed values that is explained
+    by the predictions, ignoring any constant bias of the predictions
+    """
+
+    @staticmethod
+    def _compute_from_moments(weight, mean, m2):
+        return ExplainedVariance._explained(m2[1], m2[0])
@@ -46,3 +46,130 @@ def sample_weights_must_sum_to_one(cls, v):
                 f"Sum of `sample_weights`:{tf.math.reduce_sum(v).numpy()}"
             )
     return v
+
+
+@validator("y_predicted")
+def observed_labels_must_be_binary(cls, v, values):
+    observed = values.get("y_observed")
+    found_classes = tf.unique(tf.reshape(observed, [-1]))[0].shape.as_list()[0]
+    if found_classes > 2:
+        raise ValueError(
+            f"Observed labels are not binary: '{found_classes}' class labels found"
+        )
+    return v
+
+
+@validator("y_predicted")
+def observed_labels_must_be_zero_or_one(cls, v, values):
+    observed = values.get("y_observed")
+    invalid = tf.logical_and(observed != 0, observed != 1)
+    if bool(tf.reduce_any(invalid)):
+        label = tf.boolean_mask(observed, invalid)[0].numpy()
+        raise ValueError(
+            "Observed labels are not binary: labels must be 0 or 1, "
+            f"found label {label}"
+        )
+    return v
+
+
+@validator("y_predicted")
+def scores_must_be_probabilities(cls, v):
+    if tf.size(v) > 0:
+        if bool(tf.reduce_any(tf.math.is_nan(v))):
+            raise ValueError(
+                "Predicted scores must be probabilities between 0 and 1: found NaN"
+            )
+        low, high = tf.reduce_min(v).numpy(), tf.reduce_max(v).numpy()
+        if low < 0 or high > 1:
+            raise ValueError(
+                "Predicted scores must be probabilities between 0 and 1: "
+                f"found scores in [{low}, {high}]"
+            )
+    return v
+
+
+@validator("y_predicted")
+def labels_must_be_same_len(cls, v, values):
+    if v.shape[0] != values.get("y_observed").shape[0]:
+        raise ValueError(
+            f"Shape of inputs mismatched: {values.get('y_observed').shape[0]} "
+            f"(observed) != {v.shape[0]} (predicted)"
+        )
+    return v
+
+
+@validator("y_predicted")
+def observed_labels_must_be_class_indices(cls, v, values):
+    observed = values.get("y_observed")
+    if tf.size(observed) == 0:
+        return v
+    low, high = tf.reduce_min(observed).numpy(), tf.reduce_max(observed).numpy()
+    fractional = observed.dtype.is_floating and bool(
+        tf.reduce_any(observed != tf.floor(observed))
+    )
+    # scores have a column per class, which bounds the class indices
+    classes = v.shape[1] if v.shape.rank == 2 else float("inf")
+    if low < 0 or high >= classes or fractional:
+        raise ValueError(
+            "Observed labels must be class indices in [0, "
+            f"{classes}): found labels in [{low}, {high}]"
+        )
+    return v
+
+
+@validator("y_predicted")
+def predicted_labels_must_be_class_indices(cls, v):
+    # scores are checked against the observed labels instead
+    if v.shape.rank == 2 or tf.size(v) == 0:
+        return v
+    low, high = tf.reduce_min(v).numpy(), tf.reduce_max(v).numpy()
+    fractional = v.dtype.is_floating and bool(tf.reduce_any(v != tf.floor(v)))
+    if low < 0 or fractional:
+        raise ValueError(
+            f"Predicted labels must be class indices: found labels in [{low}, {high}]"
+        )
+    return v
+
+
+def assert_valid_inputs(y_observed, y_predicted, sample_weights=None):
+    """
+    Graph compatible equivalent of the validators above, expressed as
+    ``tf.debugging`` assertions so that inputs can be validated inside a
+    ``tf.function`` or ``tf.data`` pipeline without leaving the graph.
+
+    Each call checks a batch of a stream, so the validators of the whole
+    dataset, i.e. that the weights sum to one, are left out as they are for
+    the chunks of ``update_from_iterable``.
+
+    Returns the assertion ops, for the caller to run the update under their
+    control dependency.
+    """
+    assertions = [
+        tf.debugging.assert_equal(
+            tf.shape(y_observed),
+            tf.shape(y_predicted),
+            message="Shape of inputs mismatched",
+        )
+    ]
+    low = tf.minimum(tf.reduce_min(y_observed), tf.reduce_min(y_predicted))
+    high = tf.maximum(tf.reduce_max(y_observed), tf.reduce_max(y_predicted))
+    not_binary = tf.reduce_any(
+        [
+            tf.reduce_any(tf.logical_and(labels != low, labels != high))
+            for labels in (y_observed, y_predicted)
+        ]
+    )
+    assertions.append(
+        tf.debugging.assert_equal(
+            not_binary, False, message="Input is not binary: more than 2 class labels"
+        )
+    )
+    if sample_weights is not None:
+        assertions.append(
+            tf.debugging.assert_equal(
+                tf.shape(sample_weights)[0],
+                tf.shape(y_observed)[0],
+                message="'sample_weights' is not the same length as input",
+            )
+        )
+    return assertions
@@ -2,11 +2,36 @@ import inspect
 import importlib
 import functools
 
+# Framework required by each package of metrics, and the extra that installs it
+BACKEND_REQUIREMENTS = {
+    "numpy": ("numpy", None),
+    "pytorch": ("torch", "pytorch"),
+    "tensorflow": ("tensorflow", "tensorflow"),
+}
+
+
+def import_backend(package: str = "numpy"):
+    """
+    Import a package of metrics, e.g. ``otito.metrics.pytorch``, along with
+    the framework it is built on. Frameworks are only imported when their
+    package of metrics is first requested.
+    """
+    try:
+        return importlib.import_module(name=f"otito.metrics.{package}")
+    except ModuleNotFoundError as e:
+        framework, extra = BACKEND_REQUIREMENTS.get(package, (None, None))
+        if extra is None or e.name != framework:
+            raise
+        raise ImportError(
+            f"The '{package}' metrics require '{framework}', which is not "
+            f"installed. Install it with: pip install otito[{extra}]"
+        ) from e
+
 
 def load_metric(
     metric: str = "BinaryAccuracy", package: str = "numpy", *args, **kwargs
 ):
-    metric_module = importlib.import_module(name=f"otito.metrics.{package}")
+    metric_module = import_backend(package)
     callable_metric = getattr(metric_module, metric)
     return callable_metric(*args, package=package, **kwargs)
 
@@ -6,6 +6,10 @@ base_accuracy_data = {
         ([1, 1, 1, 1], [1, 1, 1, 1], 1),
         ([0, 0, 0, 0], [0, 0, 0, 0], 1),
         ([1, 1, 0, 1], [1, 0, 0, 1], 0.75),
+        # labels other than 0 and 1 are compared by equality
+        ([0, 0, 0], [2, 2, 2], 0),
+        ([2, 3], [3, 2], 0),
+        ([2, 3, 3, 2], [2, 3, 2, 2], 0.75),
     ],
 }
 
@@ -15,6 +19,8 @@ weighted_accuracy_data = {
     "values": [
         ([1, 1, 0, 1], [1, 0, 0, 1], [0.25, 0.25, 0.25, 0.25], 0.75),
         ([0, 0, 0, 0], [1, 1, 1, 1], [0.25, 0.25, 0.25, 0.25], 0.0),
+        ([2, 3, 3, 2], [2, 3, 2, 2], [0.25, 0.25, 0.25, 0.25], 0.75),
+        ([0, 0, 0, 0], [2, 2, 2, 2], [0.25, 0.25, 0.25, 0.25], 0.0),
     ],
 }
 
@@ -52,3 +58,51 @@ weights_must_sum_to_one_data = {
         ([1, 0, 0], [0, 1, 1], [0.1, 0.1, 0.1]),
     ],
 }
+
+
+confusion_metrics_data = {
+    "fields": "y_observed,y_predicted,expected",
+    "values": [
+        (
+            [1, 1, 0, 1, 0, 0, 1],
+            [1, 0, 0, 1, 1, 1, 1],
+            {
+                "BinaryAccuracy": 4 / 7,
+                "BinaryPrecision": 3 / 5,
+                "BinaryRecall": 3 / 4,
+                "BinarySpecificity": 1 / 3,
+                "BinaryF1Score": 2 / 3,
+            },
+        ),
+        (
+            [0, 0, 0],
+            [0, 0, 0],
+            {
+                "BinaryAccuracy": 1,
+                "BinaryPrecision": 0,
+                "BinaryRecall": 0,
+                "BinarySpecificity": 1,
+                "BinaryF1Score": 0,
+            },
+        ),
+    ],
+}
+
+
+weighted_confusion_metrics_data = {
+    "fields": "y_observed,y_predicted,sample_weights,expected",
+    "values": [
+        (
+            [1, 1, 0, 1],
+            [1, 0, 0, 1],
+            [0.1, 0.2, 0.3, 0.4],
+            {
+                "BinaryAccuracy": 0.8,
+                "BinaryPrecision": 1,
+                "BinaryRecall": 5 / 7,
+                "BinarySpecificity": 1,
+                "BinaryF1Score": 5 / 6,
+            },
+        ),
+    ],
+}
@@ -0,0 +1,198 @@
+import numpy as np
+import pytest
+import tensorflow as tf
+import torch as pt
+
+from otito.metrics.utils import load_metric
+
+PACKAGES = {
+    "numpy": np.asarray,
+    "pytorch": pt.as_tensor,
+    "tensorflow": tf.convert_to_tensor,
+}
+
+METRICS = ["BinaryROCAUC", "BinaryPRAUC", "BinaryBestThresholdAccuracy"]
+
+
+def brute_force(metric_name, y_observed, y_predicted, sample_weights=None):
+    """
+    Reference values of the threshold metrics, thresholding the scores once
+    per distinct score.
+    """
+    weights = np.ones(len(y_observed)) if sample_weights is None else sample_weights
+    positive = y_observed == 1
+    thresholds = np.unique(y_predicted)[::-1]
+    tps = np.array(
+        [0.0] + [weights[positive & (y_predicted >= t)].sum() for t in thresholds]
+    )
+    fps = np.array(
+        [0.0] + [weights[~positive & (y_predicted >= t)].sum() for t in thresholds]
+    )
+    if metric_name == "BinaryROCAUC":
+        tpr, fpr = tps / tps[-1], fps / fps[-1]
+        return np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2)
+    if metric_name == "BinaryPRAUC":
+        precision = np.divide(
+            tps, tps + fps, out=np.zeros_like(tps), where=tps + fps > 0
+        )
+        return np.sum(np.diff(tps / tps[-1]) * precision[1:])
+    return np.max((tps + fps[-1] - fps) / (tps[-1] + fps[-1]))
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    y_observed = rng.integers(0, 2, 500).astype(float)
+    # rounding creates ties between scores
+    y_predicted = np.round(np.clip(rng.normal(0.3 + 0.4 * y_observed, 0.2), 0, 1), 2)
+    sample_weights = rng.random(500)
+    return y_observed, y_predicted, sample_weights / sample_weights.sum()
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+@pytest.mark.parametrize("metric_name", METRICS)
+class TestBinaryThresholdMetrics:
+    """
+    Class to test the binary threshold metrics of every package
+    """
+
+    def test_matches_brute_force(self, package, metric_name, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(metric=metric_name, package=package)
+        actual = metric(convert(y_observed), convert(y_predicted))
+        assert float(actual) == pytest.approx(
+            brute_force(metric_name, y_observed, y_predicted)
+        )
+
+    def test_weighted_matches_brute_force(self, package, metric_name, data):
+        y_observed, y_predicted, sample_weights = data
+        convert = PACKAGES[package]
+        metric = load_metric(metric=metric_name, package=package)
+        actual = metric(
+            convert(y_observed), convert(y_predicted), convert(sample_weights)
+        )
+        assert float(actual) == pytest.approx(
+            brute_force(metric_name, y_observed, y_predicted, sample_weights)
+        )
+
+    @pytest.mark.parametrize("bins", [None, 100])
+    def test_update_from_iterable(self, package, metric_name, data, bins):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(metric=metric_name, package=package, bins=bins)
+        expected = metric(convert(y_observed), convert(y_predicted))
+        metric.reset()
+        chunks = [
+            {
+                "y_observed": convert(y_observed[chunk]),
+                "y_predicted": convert(y_predicted[chunk]),
+            }
+            for chunk in np.split(np.arange(len(y_observed)), 5)
+        ]
+        assert float(metric.update_from_iterable(chunks)) == pytest.approx(
+            float(expected)
+        )
+
+    @pytest.mark.parametrize("bins", [None, 100])
+    def test_merge_state(self, package, metric_name, data, bins):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(metric=metric_name, package=package, bins=bins)
+        expected = metric(convert(y_observed), convert(y_predicted))
+        first = load_metric(metric=metric_name, package=package, bins=bins)
+        second = load_metric(metric=metric_name, package=package, bins=bins)
+        first.update(convert(y_observed[:200]), convert(y_predicted[:200]))
+        second.update(convert(y_observed[200:]), convert(y_predicted[200:]))
+        first.merge_state(second.state)
+        assert float(first.compute()) == pytest.approx(float(expected))
+
+    def test_bins_approximate_exact_sweep(self, package, metric_name, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(metric=metric_name, package=package, bins=1000)
+        actual = metric(convert(y_observed), convert(y_predicted))
+        assert float(actual) == pytest.approx(
+            brute_force(metric_name, y_observed, y_predicted), abs=1e-2
+        )
+
+    def test_curve(self, package, metric_name, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(metric=metric_name, package=package)
+        metric.update(convert(y_observed), convert(y_predicted))
+        thresholds, tps, fps = (np.asarray(values) for values in metric.curve())
+        np.testing.assert_array_equal(thresholds, np.unique(y_predicted)[::-1])
+        assert tps[-1] == (y_observed == 1).sum()
+        assert fps[-1] == (y_observed == 0).sum()
+        assert np.all(np.diff(tps) >= 0) and np.all(np.diff(fps) >= 0)
+
+    @pytest.mark.parametrize("y_observed", [[0.0, 1.0, 2.0], [0.0, 2.0, 2.0]])
+    def test_observed_labels_must_be_binary(self, package, metric_name, y_observed):
+        # only labels of 1 are counted as positive, so other pairs of labels
+        # are rejected rather than counted as all negative
+        convert = PACKAGES[package]
+        metric = load_metric(metric=metric_name, package=package, validate_input=True)
+        with pytest.raises(ValueError, match="Observed labels are not binary"):
+            metric(convert(y_observed), convert([0.1, 0.9, 0.5]))
+
+    @pytest.mark.parametrize("y_predicted", [[0.1, 1.5], [0.1, np.nan]])
+    def test_scores_must_be_probabilities(self, package, metric_name, y_predicted):
+        convert = PACKAGES[package]
+        metric = load_metric(metric=metric_name, package=package, validate_input=True)
+        with pytest.raises(ValueError, match="must be probabilities"):
+            metric(convert([0.0, 1.0]), convert(y_predicted))
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+class TestStreamingROCAUC:
+    """
+    Class to test the histogram ROC AUC of every package on streams
+    """
+
+    @pytest.mark.parametrize("bins", [10, 100, 1000])
+    def test_bounds_contain_exact_auc(self, package, data, bins):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(metric="BinaryROCAUC", package=package, bins=bins)
+        metric.update(convert(y_observed), convert(y_predicted))
+        low, high = (float(bound) for bound in metric.compute_bounds())
+        exact = brute_force("BinaryROCAUC", y_observed, y_predicted)
+        assert low - 1e-12 <= exact <= high + 1e-12
+
+    def test_bounds_tighten_with_bins(self, package, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        widths = []
+        for bins in (10, 100, 1000):
+            metric = load_metric(metric="BinaryROCAUC", package=package, bins=bins)
+            metric.update(convert(y_observed), convert(y_predicted))
+            low, high = metric.compute_bounds()
+            widths.append(float(high) - float(low))
+        assert widths[0] > widths[1] > widths[2]
+
+    def test_exact_bounds(self, package, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(metric="BinaryROCAUC", package=package)
+        metric.update(convert(y_observed), convert(y_predicted))
+        low, high = metric.compute_bounds()
+        assert (
+            float(low)
+            == float(high)
+            == pytest.approx(brute_force("BinaryROCAUC", y_observed, y_predicted))
+        )
+
+    def test_state_size_is_constant(self, package, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(
+            metric="BinaryROCAUC", package=package, bins=100, stateful=True
+        )
+        metric(convert(y_observed), convert(y_predicted))
+        sizes = {name: tuple(value.shape) for name, value in vars(metric.state).items()}
+        for _ in range(3):
+            metric(convert(y_observed), convert(y_predicted))
+        assert sizes == {
+            name: tuple(value.shape) for name, value in vars(metric.state).items()
+        }
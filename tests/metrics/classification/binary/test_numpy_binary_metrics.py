@@ -2,6 +2,10 @@ import pytest
 import numpy as np
 
 from otito.metrics.utils import load_metric
+from otito.metrics.numpy.validation.conditions import (
+    BLOCK_SIZE,
+    count_distinct_labels,
+)
 
 from tests.test_utils import get_cases
 from tests.metrics.classification.binary.resources import test_data as td
@@ -52,6 +56,54 @@ class TestBinaryAccuracy:
         )
         assert expected == pytest.approx(actual)
 
+    @pytest.mark.usefixtures("metric")
+    @pytest.mark.parametrize(
+        *get_cases(
+            data_module=td,
+            data_name="base_accuracy_data",
+            columns=[0, 1],
+            target_type=target_type,
+        )
+    )
+    def test_update_from_iterable(self, metric, y_observed, y_predicted, expected):
+        chunks = iter(
+            [(y_observed[:3], y_predicted[:3]), (y_observed[3:], y_predicted[3:])]
+        )
+        actual = metric.update_from_iterable(chunks)
+        assert expected == pytest.approx(actual)
+
+    @pytest.mark.usefixtures("metric")
+    @pytest.mark.parametrize(
+        *get_cases(
+            data_module=td,
+            data_name="weighted_accuracy_data",
+            columns=[0, 1, 2],
+            target_type=target_type,
+        )
+    )
+    def test_weighted_update_from_iterable(
+        self, metric, y_observed, y_predicted, sample_weights, expected
+    ):
+        chunks = (
+            {
+                "y_observed": y_observed[chunk],
+                "y_predicted": y_predicted[chunk],
+                "sample_weights": sample_weights[chunk],
+            }
+            for chunk in (slice(None, 2), slice(2, None))
+        )
+        actual = metric.update_from_iterable(chunks)
+        assert expected == pytest.approx(actual)
+
+    @pytest.mark.usefixtures("metric")
+    def test_update_from_iterable_validates_chunks(self, metric):
+        chunks = [
+            (np.array([0.0, 1.0]), np.array([1.0, 1.0])),
+            (np.array([0.0, 2.0]), np.array([1.0, 1.0])),
+        ]
+        with pytest.raises(ValueError, match="Input is not binary"):
+            metric.update_from_iterable(chunks)
+
     @pytest.mark.usefixtures("metric")
     @pytest.mark.parametrize(
         *get_cases(
@@ -149,3 +201,182 @@ class TestBinaryAccuracy:
             )
 
         assert expected_msg == str(e.value)
+
+
+class TestBinaryConfusionMetrics:
+    """
+    Class to test numpy binary metrics derived from the confusion matrix
+    """
+
+    target_type = np.array
+    metric_names = [
+        "BinaryAccuracy",
+        "BinaryPrecision",
+        "BinaryRecall",
+        "BinarySpecificity",
+        "BinaryF1Score",
+    ]
+
+    @pytest.mark.parametrize("metric_name", metric_names)
+    @pytest.mark.parametrize(
+        *get_cases(
+            data_module=td,
+            data_name="confusion_metrics_data",
+            columns=[0, 1],
+            target_type=target_type,
+        )
+    )
+    def test_confusion_metric(self, metric_name, y_observed, y_predicted, expected):
+        metric = load_metric(metric=metric_name, package="numpy")
+        actual = metric(y_observed=y_observed, y_predicted=y_predicted)
+        assert expected[metric_name] == pytest.approx(float(actual))
+
+    @pytest.mark.parametrize("metric_name", metric_names)
+    @pytest.mark.parametrize(
+        *get_cases(
+            data_module=td,
+            data_name="weighted_confusion_metrics_data",
+            columns=[0, 1, 2],
+            target_type=target_type,
+        )
+    )
+    def test_weighted_confusion_metric(
+        self, metric_name, y_observed, y_predicted, sample_weights, expected
+    ):
+        metric = load_metric(metric=metric_name, package="numpy")
+        actual = metric(
+            y_observed=y_observed,
+            y_predicted=y_predicted,
+            sample_weights=sample_weights,
+        )
+        assert expected[metric_name] == pytest.approx(float(actual))
+
+
+class TestCountDistinctLabels:
+    """
+    Class to test the single pass label counting used by the numpy validators
+    """
+
+    @pytest.mark.parametrize(
+        "arrays,expected",
+        [
+            ((np.zeros(10), np.ones(10)), 2),
+            ((np.ones(10), np.ones(10)), 1),
+            ((np.array([]), np.array([])), 0),
+            ((np.array([0.0, 1.0, 2.0]), np.array([0.0, 1.0, 1.0])), 3),
+            ((np.array([0.0, 0.5, 1.0]), np.array([0.0, 1.0, 1.0])), 3),
+            ((np.array([0.0, np.nan]), np.array([0.0, 0.0])), 2),
+        ],
+    )
+    def test_count_distinct_labels(self, arrays, expected):
+        assert count_distinct_labels(*arrays) == expected
+
+    def test_count_distinct_labels_across_blocks(self):
+        y_observed = np.zeros(3 * BLOCK_SIZE)
+        y_predicted = np.ones(3 * BLOCK_SIZE)
+        y_predicted[-1] = 2.0
+
+        assert count_distinct_labels(y_observed, y_observed) == 1
+        assert count_distinct_labels(y_observed, y_predicted[:-1]) == 2
+        assert count_distinct_labels(y_observed, y_predicted) == 3
+
+
+class TestZeroCopyInput:
+    """
+    Class to test that validated numpy inputs are only copied when converted
+    """
+
+    @pytest.fixture
+    def metric(self):
+        return load_metric(
+            metric="BinaryAccuracy", package="numpy", validate_input=True
+        )
+
+    def test_float_arrays_are_not_copied(self, metric):
+        y_observed = np.array([1.0, 0.0, 1.0])
+        y_predicted = np.array([1.0, 1.0, 1.0])
+        parsed = metric._parse_input(y_observed, y_predicted)
+
+        assert parsed["y_observed"] is y_observed
+        assert parsed["y_predicted"] is y_predicted
+
+    def test_other_dtypes_are_converted(self, metric):
+        y_observed = np.array([1, 0, 1])
+        parsed = metric._parse_input(y_observed, [1, 1, 1])
+
+        assert parsed["y_observed"].dtype == np.float64
+        assert not np.shares_memory(parsed["y_observed"], y_observed)
+        assert parsed["y_predicted"].dtype == np.float64
+
+
+class TestGroupBy:
+    """
+    Class to test computing the binary metrics per group of the inputs
+    """
+
+    @pytest.mark.parametrize(
+        "metric", ["BinaryAccuracy", "BinaryPrecision", "BinaryF1Score"]
+    )
+    @pytest.mark.parametrize(
+        "group_by",
+        [
+            np.array([3, 1, 3, 3, 7, 1, 7, 3]),
+            np.array([-2, 0, -2, -2, 10**9, 0, 10**9, -2]),
+            np.array([-(2**63), 0, -(2**63), -(2**63), 2**63 - 1, 0, 2**63 - 1, 0]),
+            np.array(["b", "a", "b", "b", "c", "a", "c", "b"]),
+        ],
+    )
+    @pytest.mark.parametrize("weighted", [False, True])
+    def test_matches_masked_calls(self, metric, group_by, weighted):
+        y_observed = np.array([1.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0])
+        y_predicted = np.array([1.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0])
+        sample_weights = np.arange(1.0, 9.0) / 36 if weighted else None
+        grouped = load_metric(metric=metric, package="numpy")(
+            y_observed, y_predicted, sample_weights, group_by=group_by
+        )
+
+        assert list(grouped) == np.unique(group_by).tolist()
+        for key, value in grouped.items():
+            mask = group_by == key
+            expected = load_metric(metric=metric, package="numpy")(
+                y_observed[mask],
+                y_predicted[mask],
+                (
+                    None
+                    if sample_weights is None
+                    else sample_weights[mask] / sample_weights[mask].sum()
+                ),
+            )
+            assert value == pytest.approx(expected)
+
+    @pytest.mark.filterwarnings("error")
+    @pytest.mark.parametrize(
+        "group_by",
+        [
+            np.arange(1024).astype(np.uint8),
+            (np.arange(1024) - 128).astype(np.int8),
+            np.arange(512).repeat(2) + np.int64(2**63 - 512),
+            np.arange(512, dtype=np.uint64).repeat(2) + np.uint64(2**64 - 512),
+        ],
+    )
+    def test_keys_spanning_their_dtype(self, group_by):
+        rng = np.random.default_rng(0)
+        y_observed = rng.integers(0, 2, group_by.size).astype(float)
+        y_predicted = rng.integers(0, 2, group_by.size).astype(float)
+        metric = load_metric(metric="BinaryAccuracy", package="numpy")
+        grouped = metric(y_observed, y_predicted, group_by=group_by)
+
+        assert list(grouped) == np.unique(group_by).tolist()
+        for key, value in grouped.items():
+            mask = group_by == key
+            assert value == pytest.approx(metric(y_observed[mask], y_predicted[mask]))
+
+    def test_does_not_update_state(self):
+        metric = load_metric(metric="BinaryAccuracy", package="numpy", stateful=True)
+        metric(np.array([1.0, 0.0]), np.array([1.0, 0.0]), group_by=np.array([0, 1]))
+        assert metric.state.tp == metric.state.tn == 0
+
+    def test_mismatched_group_by_raises(self):
+        metric = load_metric(metric="BinaryAccuracy", package="numpy")
+        with pytest.raises(ValueError, match="group_by"):
+            metric(np.array([1.0, 0.0]), np.array([1.0, 0.0]), group_by=np.array([0]))
@@ -53,6 +53,54 @@ class TestBinaryAccuracy:
         )
         assert expected == pytest.approx(actual)
 
+    @pytest.mark.usefixtures("metric")
+    @pytest.mark.parametrize(
+        *get_cases(
+            data_module=td,
+            data_name="base_accuracy_data",
+            columns=[0, 1],
+            target_type=target_type,
+        )
+    )
+    def test_update_from_iterable(self, metric, y_observed, y_predicted, expected):
+        chunks = iter(
+            [(y_observed[:3], y_predicted[:3]), (y_observed[3:], y_predicted[3:])]
+        )
+        actual = metric.update_from_iterable(chunks)
+        assert expected == pytest.approx(actual)
+
+    @pytest.mark.usefixtures("metric")
+    @pytest.mark.parametrize(
+        *get_cases(
+            data_module=td,
+            data_name="weighted_accuracy_data",
+            columns=[0, 1, 2],
+            target_type=target_type,
+        )
+    )
+    def test_weighted_update_from_iterable(
+        self, metric, y_observed, y_predicted, sample_weights, expected
+    ):
+        chunks = (
+            {
+                "y_observed": y_observed[chunk],
+                "y_predicted": y_predicted[chunk],
+                "sample_weights": sample_weights[chunk],
+            }
+            for chunk in (slice(None, 2), slice(2, None))
+        )
+        actual = metric.update_from_iterable(chunks)
+        assert expected == pytest.approx(actual)
+
+    @pytest.mark.usefixtures("metric")
+    def test_update_from_iterable_validates_chunks(self, metric):
+        chunks = [
+            (pt.tensor([0.0, 1.0]), pt.tensor([1.0, 1.0])),
+            (pt.tensor([0.0, 2.0]), pt.tensor([1.0, 1.0])),
+        ]
+        with pytest.raises(ValueError, match="Input is not binary"):
+            metric.update_from_iterable(chunks)
+
     @pytest.mark.usefixtures("metric")
     @pytest.mark.parametrize(
         *get_cases(
@@ -148,3 +196,52 @@ class TestBinaryAccuracy:
             )
 
         assert expected_msg == str(e.value)
+
+
+class TestBinaryConfusionMetrics:
+    """
+    Class to test the pytorch binary metrics derived from the confusion matrix
+    """
+
+    target_type = pt.tensor
+    metric_names = [
+        "BinaryAccuracy",
+        "BinaryPrecision",
+        "BinaryRecall",
+        "BinarySpecificity",
+        "BinaryF1Score",
+    ]
+
+    @pytest.mark.parametrize("metric_name", metric_names)
+    @pytest.mark.parametrize(
+        *get_cases(
+            data_module=td,
+            data_name="confusion_metrics_data",
+            columns=[0, 1],
+            target_type=target_type,
+        )
+    )
+    def test_confusion_metric(self, metric_name, y_observed, y_predicted, expected):
+        metric = load_metric(metric=metric_name, package="pytorch")
+        actual = metric(y_observed=y_observed, y_predicted=y_predicted)
+        assert expected[metric_name] == pytest.approx(float(actual))
+
+    @pytest.mark.parametrize("metric_name", metric_names)
+    @pytest.mark.parametrize(
+        *get_cases(
+            data_module=td,
+            data_name="weighted_confusion_metrics_data",
+            columns=[0, 1, 2],
+            target_type=target_type,
+        )
+    )
+    def test_weighted_confusion_metric(
+        self, metric_name, y_observed, y_predicted, sample_weights, expected
+    ):
+        metric = load_metric(metric=metric_name, package="pytorch")
+        actual = metric(
+            y_observed=y_observed,
+            y_predicted=y_predicted,
+            sample_weights=sample_weights,
+        )
+        assert expected[metric_name] == pytest.approx(float(actual))
@@ -0,0 +1,187 @@
+import numpy as np
+import pytest
+import tensorflow as tf
+import torch as pt
+
+from otito.metrics.utils import load_metric
+
+PACKAGES = {
+    "numpy": np.asarray,
+    "pytorch": pt.as_tensor,
+    "tensorflow": tf.convert_to_tensor,
+}
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    y_observed = rng.integers(0, 20, 1000)
+    y_predicted = rng.normal(size=(1000, 20))
+    y_predicted[np.arange(1000), y_observed] += 1.0
+    sample_weights = rng.random(1000)
+    return y_observed, y_predicted, sample_weights / sample_weights.sum()
+
+
+def top_k_correct(y_observed, y_predicted, top_k):
+    ranks = np.argsort(np.argsort(-y_predicted, axis=1), axis=1)
+    return ranks[np.arange(len(y_observed)), y_observed] < top_k
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+class TestMulticlassAccuracy:
+    """
+    Class to test the multiclass accuracy metric of every package
+    """
+
+    @pytest.mark.parametrize("top_k", [1, 3, 20])
+    def test_top_k_accuracy(self, package, data, top_k):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(
+            metric="MulticlassAccuracy",
+            package=package,
+            validate_input=True,
+            top_k=top_k,
+        )
+        actual = metric(convert(y_observed), convert(y_predicted))
+        expected = top_k_correct(y_observed, y_predicted, top_k).mean()
+        assert float(actual) == pytest.approx(expected)
+
+    def test_weighted_accuracy(self, package, data):
+        y_observed, y_predicted, sample_weights = data
+        convert = PACKAGES[package]
+        metric = load_metric(
+            metric="MulticlassAccuracy", package=package, validate_input=True
+        )
+        actual = metric(
+            convert(y_observed), convert(y_predicted), convert(sample_weights)
+        )
+        expected = np.dot(top_k_correct(y_observed, y_predicted, 1), sample_weights)
+        assert float(actual) == pytest.approx(expected)
+
+    def test_predicted_labels(self, package, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(
+            metric="MulticlassAccuracy", package=package, validate_input=True
+        )
+        actual = metric(convert(y_observed), convert(y_predicted.argmax(axis=1)))
+        assert float(actual) == pytest.approx(
+            np.mean(y_predicted.argmax(axis=1) == y_observed)
+        )
+
+    def test_macro_accuracy(self, package, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        # the last class is never observed, and is left out of the mean
+        metric = load_metric(
+            metric="MulticlassAccuracy",
+            package=package,
+            average="macro",
+            num_classes=21,
+        )
+        actual = metric(convert(y_observed), convert(y_predicted))
+        correct = top_k_correct(y_observed, y_predicted, 1)
+        expected = np.mean([correct[y_observed == c].mean() for c in range(20)])
+        assert float(actual) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("average", ["micro", "macro"])
+    def test_merge_state(self, package, data, average):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        arguments = dict(
+            metric="MulticlassAccuracy",
+            package=package,
+            average=average,
+            num_classes=20,
+            top_k=2,
+        )
+        expected = load_metric(**arguments)(convert(y_observed), convert(y_predicted))
+        first, second = load_metric(**arguments), load_metric(**arguments)
+        first.update(convert(y_observed[:300]), convert(y_predicted[:300]))
+        second.update(convert(y_observed[300:]), convert(y_predicted[300:]))
+        first.merge_state(second.state)
+        assert float(first.compute()) == pytest.approx(float(expected))
+
+    def test_labels_must_be_same_len(self, package, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(
+            metric="MulticlassAccuracy", package=package, validate_input=True
+        )
+        with pytest.raises(ValueError, match="Shape of inputs mismatched"):
+            metric(convert(y_observed[:10]), convert(y_predicted[:9]))
+
+    @pytest.mark.parametrize("y_observed", [[0, 20], [0, -1], [0.5, 1]])
+    def test_observed_labels_must_be_class_indices(self, package, data, y_observed):
+        _, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(
+            metric="MulticlassAccuracy", package=package, validate_input=True
+        )
+        with pytest.raises(ValueError, match="must be class indices"):
+            metric(convert(y_observed), convert(y_predicted[:2]))
+
+    @pytest.mark.parametrize("y_predicted", [[0.4, 1.7], [0.0, -1.0]])
+    def test_predicted_labels_must_be_class_indices(self, package, y_predicted):
+        convert = PACKAGES[package]
+        metric = load_metric(
+            metric="MulticlassAccuracy", package=package, validate_input=True
+        )
+        with pytest.raises(ValueError, match="Predicted labels must be class"):
+            metric(convert([0.0, 1.0]), convert(y_predicted))
+
+    @pytest.mark.parametrize("scores", [False, True])
+    def test_observed_labels_must_be_below_num_classes(self, package, scores):
+        convert = PACKAGES[package]
+        metric = load_metric(
+            metric="MulticlassAccuracy",
+            package=package,
+            average="macro",
+            num_classes=2,
+        )
+        y_predicted = np.eye(3) if scores else np.array([0.0, 1.0, 2.0])
+        with pytest.raises(ValueError, match=r"class indices in \[0, 2\)"):
+            metric(convert([0.0, 1.0, 2.0]), convert(y_predicted))
+
+    @pytest.mark.parametrize("scores", [False, True])
+    def test_unvalidated_labels_above_num_classes_raise(self, package, scores):
+        convert = PACKAGES[package]
+        metric = load_metric(
+            metric="MulticlassAccuracy",
+            package=package,
+            average="macro",
+            num_classes=2,
+            validate_input=False,
+        )
+        y_predicted = np.eye(3) if scores else np.array([0.0, 1.0, 2.0])
+        # pytorch does not check the labels on the host, see its docstring
+        errors = {
+            "numpy": (ValueError, r"class indices in \[0, 2\)"),
+            "pytorch": ((IndexError, RuntimeError), "out of bounds"),
+            "tensorflow": (tf.errors.InvalidArgumentError, r"\[0, 2\)"),
+        }
+        error, match = errors[package]
+        with pytest.raises(error, match=match):
+            metric(convert([0.0, 1.0, 2.0]), convert(y_predicted))
+
+    @pytest.mark.parametrize("top_k, expected", [(1, 0.5), (2, 1.0)])
+    def test_ties(self, package, top_k, expected):
+        if package == "tensorflow":
+            pytest.skip("tf.argmax does not specify which tied class it returns")
+        convert = PACKAGES[package]
+        metric = load_metric(metric="MulticlassAccuracy", package=package, top_k=top_k)
+        y_predicted = np.array([[0.4, 0.4, 0.2], [0.4, 0.4, 0.2]])
+        actual = metric(convert([0.0, 1.0]), convert(y_predicted))
+        assert float(actual) == pytest.approx(expected)
+
+    def test_top_k_requires_scores(self, package, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(metric="MulticlassAccuracy", package=package, top_k=2)
+        with pytest.raises(ValueError, match="top_k requires predicted scores"):
+            metric(convert(y_observed), convert(y_predicted.argmax(axis=1)))
+
+    def test_macro_requires_num_classes(self, package):
+        with pytest.raises(ValueError, match="num_classes is required"):
+            load_metric(metric="MulticlassAccuracy", package=package, average="macro")
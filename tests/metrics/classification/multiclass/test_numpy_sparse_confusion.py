@@ -0,0 +1,162 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from otito.metrics.numpy import evaluate_parallel
+from otito.metrics.numpy.sparse import SparseCounts
+from otito.metrics.utils import load_metric
+
+METRICS = ["MulticlassPrecision", "MulticlassRecall", "MulticlassF1Score"]
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    y_observed = rng.integers(0, 50, 2000)
+    y_predicted = np.where(
+        rng.random(2000) < 0.6, y_observed, rng.integers(0, 60, 2000)
+    )
+    sample_weights = rng.random(2000)
+    return y_observed, y_predicted, sample_weights / sample_weights.sum()
+
+
+def class_scores(metric_name, y_observed, y_predicted, sample_weights):
+    """
+    Reference metric of each observed or predicted class, one class at a time.
+    """
+    scores = {}
+    for label in np.union1d(y_observed, y_predicted).tolist():
+        observed, predicted = y_observed == label, y_predicted == label
+        tp = sample_weights[observed & predicted].sum()
+        fp = sample_weights[~observed & predicted].sum()
+        fn = sample_weights[observed & ~predicted].sum()
+        numerator, denominator = {
+            "MulticlassPrecision": (tp, tp + fp),
+            "MulticlassRecall": (tp, tp + fn),
+            "MulticlassF1Score": (2 * tp, 2 * tp + fp + fn),
+        }[metric_name]
+        scores[label] = numerator / denominator if denominator else 0.0
+    return scores
+
+
+class TestSparseCounts:
+    """
+    Class to test the sparse counts of the numpy metric states
+    """
+
+    def test_from_keys(self):
+        counts = SparseCounts.from_keys(np.array([7, 3, 7, 2**40]))
+        np.testing.assert_array_equal(counts.keys, [3, 7, 2**40])
+        np.testing.assert_array_equal(counts.counts, [1, 2, 1])
+
+    @pytest.mark.parametrize("other_keys", [[3, 7], [1, 7, 9]])
+    def test_add(self, other_keys):
+        counts = SparseCounts.from_keys(np.array([3, 7, 7]))
+        other = SparseCounts.from_keys(np.array(other_keys), np.ones(len(other_keys)))
+        added = counts + other
+        expected = SparseCounts.from_keys(np.array([3, 7, 7] + other_keys))
+        np.testing.assert_array_equal(added.keys, expected.keys)
+        np.testing.assert_array_equal(added.counts, expected.counts)
+        # the operands are left unchanged
+        np.testing.assert_array_equal(counts.counts, [1, 2])
+
+    def test_add_empty(self):
+        counts = SparseCounts() + SparseCounts.from_keys(np.array([5]))
+        assert len(counts + SparseCounts()) == 1
+
+
+@pytest.mark.parametrize("metric_name", METRICS)
+class TestSparseMulticlassMetrics:
+    """
+    Class to test the numpy multiclass metrics of sparse confusion states
+    """
+
+    @pytest.mark.parametrize("weighted", [False, True])
+    def test_per_class(self, metric_name, data, weighted):
+        y_observed, y_predicted, sample_weights = data
+        weights = sample_weights if weighted else np.ones(len(y_observed))
+        metric = load_metric(metric=metric_name, package="numpy", stateful=True)
+        metric(y_observed, y_predicted, sample_weights if weighted else None)
+        expected = class_scores(metric_name, y_observed, y_predicted, weights)
+        actual = metric.compute_per_class()
+        assert actual.keys() == expected.keys()
+        assert list(actual.values()) == pytest.approx(list(expected.values()))
+
+    @pytest.mark.parametrize("weighted", [False, True])
+    def test_macro(self, metric_name, data, weighted):
+        y_observed, y_predicted, sample_weights = data
+        weights = sample_weights if weighted else np.ones(len(y_observed))
+        metric = load_metric(metric=metric_name, package="numpy", validate_input=True)
+        actual = metric(y_observed, y_predicted, sample_weights if weighted else None)
+        expected = class_scores(metric_name, y_observed, y_predicted, weights)
+        assert actual == pytest.approx(np.mean(list(expected.values())))
+
+    def test_micro_is_accuracy(self, metric_name, data):
+        y_observed, y_predicted, _ = data
+        metric = load_metric(metric=metric_name, package="numpy", average="micro")
+        assert metric(y_observed, y_predicted) == pytest.approx(
+            np.mean(y_observed == y_predicted)
+        )
+
+    def test_scores_are_argmaxed(self, metric_name, data):
+        y_observed, y_predicted, _ = data
+        scores = np.zeros((len(y_predicted), 60))
+        scores[np.arange(len(y_predicted)), y_predicted] = 1.0
+        metric = load_metric(metric=metric_name, package="numpy", validate_input=True)
+        assert metric(y_observed, scores) == pytest.approx(
+            metric(y_observed, y_predicted)
+        )
+
+    def test_large_class_indices(self, metric_name):
+        metric = load_metric(metric=metric_name, package="numpy", stateful=True)
+        metric(np.array([2**31 - 1, 5]), np.array([2**32 - 1, 5]))
+        observed, predicted, counts = metric.confusion()
+        np.testing.assert_array_equal(observed, [5, 2**31 - 1])
+        np.testing.assert_array_equal(predicted, [5, 2**32 - 1])
+        np.testing.assert_array_equal(counts, [1, 1])
+
+    def test_update_from_iterable(self, metric_name, data):
+        y_observed, y_predicted, _ = data
+        metric = load_metric(metric=metric_name, package="numpy")
+        expected = metric(y_observed, y_predicted)
+        chunks = [
+            {"y_observed": y_observed[chunk], "y_predicted": y_predicted[chunk]}
+            for chunk in np.split(np.arange(len(y_observed)), 8)
+        ]
+        assert metric.update_from_iterable(chunks) == pytest.approx(expected)
+
+    def test_merge_state(self, metric_name, data):
+        y_observed, y_predicted, _ = data
+        expected = load_metric(metric=metric_name, package="numpy")(
+            y_observed, y_predicted
+        )
+        first = load_metric(metric=metric_name, package="numpy")
+        second = load_metric(metric=metric_name, package="numpy")
+        first.update(y_observed[:500], y_predicted[:500])
+        second.update(y_observed[500:], y_predicted[500:])
+        first.merge_state(pickle.loads(pickle.dumps(second.state)))
+        assert first.compute() == pytest.approx(expected)
+
+    def test_evaluate_parallel(self, metric_name, data):
+        y_observed, y_predicted, _ = data
+        expected = load_metric(metric=metric_name, package="numpy")(
+            y_observed, y_predicted
+        )
+        metric = load_metric(metric=metric_name, package="numpy")
+        actual = evaluate_parallel(
+            metric, y_observed, y_predicted, n_workers=2, n_shards=4
+        )
+        assert actual == pytest.approx(expected)
+
+    def test_predicted_labels_must_be_class_indices(self, metric_name):
+        metric = load_metric(metric=metric_name, package="numpy", validate_input=True)
+        with pytest.raises(ValueError, match="Predicted labels must be class"):
+            metric(np.array([0, 1]), np.array([0, -1]))
+
+    def test_class_indices_must_fit_keys(self, metric_name):
+        metric = load_metric(metric=metric_name, package="numpy", validate_input=True)
+        with pytest.raises(ValueError, match="Predicted labels must be class"):
+            metric(np.array([0, 1]), np.array([0, 2**32]))
+        with pytest.raises(ValueError, match="Observed labels must be class"):
+            metric(np.array([0, 2**31]), np.array([0, 1]))
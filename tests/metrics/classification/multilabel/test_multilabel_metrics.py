@@ -0,0 +1,149 @@
+import numpy as np
+import pytest
+import tensorflow as tf
+import torch as pt
+
+from otito.metrics.utils import load_metric
+
+PACKAGES = {
+    "numpy": np.asarray,
+    "pytorch": pt.as_tensor,
+    "tensorflow": tf.convert_to_tensor,
+}
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    y_observed = rng.integers(0, 2, (1000, 8)).astype(float)
+    y_predicted = np.clip(rng.normal(0.3 + 0.4 * y_observed, 0.3), 0, 1)
+    sample_weights = rng.random(1000)
+    return y_observed, y_predicted, sample_weights / sample_weights.sum()
+
+
+def label_confusion(y_observed, y_predicted, sample_weights, threshold=0.5):
+    """
+    Reference confusion counts of each label, one label at a time.
+    """
+    counts = []
+    for label in range(y_observed.shape[1]):
+        observed = y_observed[:, label] == 1
+        predicted = y_predicted[:, label] >= threshold
+        counts.append(
+            [
+                sample_weights[observed & predicted].sum(),
+                sample_weights[~observed & predicted].sum(),
+                sample_weights[~observed & ~predicted].sum(),
+                sample_weights[observed & ~predicted].sum(),
+            ]
+        )
+    return np.array(counts).T
+
+
+REFERENCES = {
+    "MultilabelAccuracy": lambda tp, fp, tn, fn: (tp + tn) / (tp + fp + tn + fn),
+    "MultilabelPrecision": lambda tp, fp, tn, fn: tp / (tp + fp),
+    "MultilabelRecall": lambda tp, fp, tn, fn: tp / (tp + fn),
+    "MultilabelF1Score": lambda tp, fp, tn, fn: 2 * tp / (2 * tp + fp + fn),
+}
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+class TestMultilabelMetrics:
+    """
+    Class to test the multilabel metrics of every package
+    """
+
+    @pytest.mark.parametrize("metric_name", REFERENCES)
+    @pytest.mark.parametrize("average", ["micro", "macro"])
+    @pytest.mark.parametrize("weighted", [False, True])
+    def test_confusion_metric(self, package, data, metric_name, average, weighted):
+        y_observed, y_predicted, sample_weights = data
+        convert = PACKAGES[package]
+        metric = load_metric(
+            metric=metric_name,
+            package=package,
+            validate_input=True,
+            num_labels=8,
+            average=average,
+        )
+        weights = sample_weights if weighted else np.ones(len(y_observed))
+        counts = label_confusion(y_observed, y_predicted, weights)
+        if average == "micro":
+            expected = REFERENCES[metric_name](*counts.sum(axis=1))
+        else:
+            expected = np.mean(REFERENCES[metric_name](*counts))
+        actual = metric(
+            convert(y_observed),
+            convert(y_predicted),
+            convert(sample_weights) if weighted else None,
+        )
+        assert float(actual) == pytest.approx(expected)
+
+    def test_threshold(self, package, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(
+            metric="MultilabelRecall", package=package, num_labels=8, threshold=0.8
+        )
+        counts = label_confusion(
+            y_observed, y_predicted, np.ones(len(y_observed)), threshold=0.8
+        )
+        tp, _, _, fn = counts.sum(axis=1)
+        actual = metric(convert(y_observed), convert(y_predicted))
+        assert float(actual) == pytest.approx(tp / (tp + fn))
+
+    @pytest.mark.parametrize("weighted", [False, True])
+    def test_exact_match(self, package, data, weighted):
+        y_observed, y_predicted, sample_weights = data
+        convert = PACKAGES[package]
+        # few samples of 8 labels match exactly, so 2 labels are compared
+        y_observed, y_predicted = y_observed[:, :2], y_predicted[:, :2]
+        metric = load_metric(
+            metric="MultilabelExactMatch", package=package, validate_input=True
+        )
+        matched = np.all(y_observed == (y_predicted >= 0.5), axis=1)
+        weights = sample_weights if weighted else np.ones(len(y_observed))
+        actual = metric(
+            convert(y_observed),
+            convert(y_predicted),
+            convert(sample_weights) if weighted else None,
+        )
+        assert float(actual) == pytest.approx(np.dot(matched, weights) / weights.sum())
+
+    def test_merge_state(self, package, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        arguments = dict(
+            metric="MultilabelF1Score", package=package, num_labels=8, average="macro"
+        )
+        expected = load_metric(**arguments)(convert(y_observed), convert(y_predicted))
+        first, second = load_metric(**arguments), load_metric(**arguments)
+        first.update(convert(y_observed[:300]), convert(y_predicted[:300]))
+        second.update(convert(y_observed[300:]), convert(y_predicted[300:]))
+        first.merge_state(second.state)
+        assert float(first.compute()) == pytest.approx(float(expected))
+
+    def test_labels_must_be_same_shape(self, package, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(
+            metric="MultilabelAccuracy",
+            package=package,
+            validate_input=True,
+            num_labels=8,
+        )
+        with pytest.raises(ValueError, match="Shape of inputs mismatched"):
+            metric(convert(y_observed), convert(y_predicted[:, :7]))
+
+    def test_observed_labels_must_be_binary(self, package, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(
+            metric="MultilabelAccuracy",
+            package=package,
+            validate_input=True,
+            num_labels=8,
+        )
+        with pytest.raises(ValueError, match="Observed labels are not binary"):
+            metric(convert(y_observed * np.arange(8)), convert(y_predicted))
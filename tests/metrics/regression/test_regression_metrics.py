@@ -0,0 +1,165 @@
+import numpy as np
+import pytest
+import tensorflow as tf
+import torch as pt
+
+from otito.metrics.utils import load_metric
+
+PACKAGES = {
+    "numpy": np.asarray,
+    "pytorch": pt.as_tensor,
+    "tensorflow": tf.convert_to_tensor,
+}
+
+METRICS = [
+    "MeanSquaredError",
+    "RootMeanSquaredError",
+    "MeanAbsoluteError",
+    "R2Score",
+    "ExplainedVariance",
+]
+
+
+def two_pass(metric_name, y_observed, y_predicted, sample_weights=None):
+    """
+    Reference values of the regression metrics, computed in float64 with a
+    pass for the means and another for the squared deviations.
+    """
+    y_observed = np.asarray(y_observed, dtype=np.float64)
+    residual = y_observed - np.asarray(y_predicted, dtype=np.float64)
+    weights = np.ones(len(y_observed)) if sample_weights is None else sample_weights
+    weights = weights / weights.sum()
+    mse = np.dot(weights, residual**2)
+    if metric_name == "MeanSquaredError":
+        return mse
+    if metric_name == "RootMeanSquaredError":
+        return np.sqrt(mse)
+    if metric_name == "MeanAbsoluteError":
+        return np.dot(weights, np.abs(residual))
+    variance = np.dot(weights, (y_observed - np.dot(weights, y_observed)) ** 2)
+    if metric_name == "R2Score":
+        return 1 - mse / variance
+    return 1 - np.dot(weights, (residual - np.dot(weights, residual)) ** 2) / variance
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    y_observed = rng.normal(2.0, 3.0, 500)
+    y_predicted = y_observed + rng.normal(0.5, 1.0, 500)
+    sample_weights = rng.random(500)
+    return y_observed, y_predicted, sample_weights / sample_weights.sum()
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+@pytest.mark.parametrize("metric_name", METRICS)
+class TestRegressionMetrics:
+    """
+    Class to test the regression metrics of every package
+    """
+
+    def test_matches_two_pass(self, package, metric_name, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(metric=metric_name, package=package)
+        actual = metric(convert(y_observed), convert(y_predicted))
+        assert float(actual) == pytest.approx(
+            two_pass(metric_name, y_observed, y_predicted)
+        )
+
+    def test_weighted_matches_two_pass(self, package, metric_name, data):
+        y_observed, y_predicted, sample_weights = data
+        convert = PACKAGES[package]
+        metric = load_metric(metric=metric_name, package=package)
+        actual = metric(
+            convert(y_observed), convert(y_predicted), convert(sample_weights)
+        )
+        assert float(actual) == pytest.approx(
+            two_pass(metric_name, y_observed, y_predicted, sample_weights)
+        )
+
+    def test_update_from_iterable(self, package, metric_name, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(metric=metric_name, package=package)
+        chunks = [
+            {
+                "y_observed": convert(y_observed[chunk]),
+                "y_predicted": convert(y_predicted[chunk]),
+            }
+            for chunk in np.split(np.arange(len(y_observed)), [1, 50, 300])
+        ]
+        assert float(metric.update_from_iterable(chunks)) == pytest.approx(
+            two_pass(metric_name, y_observed, y_predicted)
+        )
+
+    def test_merge_state(self, package, metric_name, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        first = load_metric(metric=metric_name, package=package)
+        second = load_metric(metric=metric_name, package=package)
+        empty = load_metric(metric=metric_name, package=package)
+        first.update(convert(y_observed[:200]), convert(y_predicted[:200]))
+        second.update(convert(y_observed[200:]), convert(y_predicted[200:]))
+        first.merge_state(second.state)
+        first.merge_state(empty.state)
+        assert float(first.compute()) == pytest.approx(
+            two_pass(metric_name, y_observed, y_predicted)
+        )
+
+    def test_float32_inputs_keep_float64_accuracy(self, package, metric_name):
+        # a large offset cancels catastrophically in float32 sums of squares
+        rng = np.random.default_rng(1)
+        y_observed = (1e6 + rng.normal(0.0, 1.0, 100_000)).astype(np.float32)
+        y_predicted = (y_observed + rng.normal(0.0, 0.5, 100_000)).astype(np.float32)
+        convert = PACKAGES[package]
+        metric = load_metric(metric=metric_name, package=package)
+        chunks = [
+            {
+                "y_observed": convert(y_observed[chunk]),
+                "y_predicted": convert(y_predicted[chunk]),
+            }
+            for chunk in np.split(np.arange(len(y_observed)), 10)
+        ]
+        assert float(metric.update_from_iterable(chunks)) == pytest.approx(
+            two_pass(metric_name, y_observed, y_predicted), rel=1e-9
+        )
+
+    def test_perfect_predictions(self, package, metric_name, data):
+        y_observed, _, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(metric=metric_name, package=package)
+        expected = 1.0 if metric_name in ("R2Score", "ExplainedVariance") else 0.0
+        actual = metric(convert(y_observed), convert(y_observed))
+        assert float(actual) == pytest.approx(expected)
+
+    def test_constant_observed_values(self, package, metric_name):
+        convert = PACKAGES[package]
+        metric = load_metric(metric=metric_name, package=package)
+        y_observed = convert(np.full(4, 3.0))
+        exact = float(metric(y_observed, y_observed))
+        inexact = float(metric(y_observed, convert([3.0, 3.0, 3.0, 5.0])))
+        if metric_name in ("R2Score", "ExplainedVariance"):
+            assert (exact, inexact) == (1.0, 0.0)
+        else:
+            assert exact == 0.0 and inexact > 0.0
+
+    def test_state_size_is_constant(self, package, metric_name, data):
+        y_observed, y_predicted, _ = data
+        convert = PACKAGES[package]
+        metric = load_metric(metric=metric_name, package=package, stateful=True)
+        metric(convert(y_observed), convert(y_predicted))
+        sizes = {
+            name: tuple(np.shape(value)) for name, value in vars(metric.state).items()
+        }
+        for _ in range(3):
+            metric(convert(y_observed), convert(y_predicted))
+        assert sizes == {
+            name: tuple(np.shape(value)) for name, value in vars(metric.state).items()
+        }
+
+    def test_labels_must_be_same_shape(self, package, metric_name):
+        convert = PACKAGES[package]
+        metric = load_metric(metric=metric_name, package=package, validate_input=True)
+        with pytest.raises(ValueError):
+            metric(convert([1.0, 2.0, 3.0]), convert([1.0, 2.0]))
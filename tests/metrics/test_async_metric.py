@@ -0,0 +1,178 @@
+import asyncio
+
+import pytest
+import numpy as np
+
+from otito.metrics.async_metric import AsyncMetric
+from otito.metrics.utils import load_metric
+
+
+@pytest.fixture
+def batches():
+    rng = np.random.default_rng(0)
+    return [
+        (
+            rng.integers(0, 2, size).astype(float),
+            rng.integers(0, 2, size).astype(float),
+        )
+        for size in rng.integers(1, 50, 300)
+    ]
+
+
+def expected_accuracy(batches):
+    return load_metric(metric="BinaryAccuracy", package="numpy")(
+        np.concatenate([y_observed for y_observed, _ in batches]),
+        np.concatenate([y_predicted for _, y_predicted in batches]),
+    )
+
+
+class TestAsyncMetric:
+    """
+    Class to test micro-batched asynchronous metric updates
+    """
+
+    @pytest.mark.parametrize("max_batch_size", [1, 100, 10**6])
+    def test_concurrent_updates(self, batches, max_batch_size):
+        async def evaluate():
+            metric = AsyncMetric(
+                load_metric(metric="BinaryAccuracy", package="numpy"),
+                max_batch_size=max_batch_size,
+            )
+            await asyncio.gather(*(metric.aupdate(*batch) for batch in batches))
+            result = await metric.acompute()
+            metric.close()
+            return result
+
+        assert asyncio.run(evaluate()) == pytest.approx(expected_accuracy(batches))
+
+    def test_updates_are_batched(self, batches, monkeypatch):
+        metric = load_metric(metric="BinaryAccuracy", package="numpy", stateful=True)
+        calls = []
+        update = metric.update
+        monkeypatch.setattr(
+            metric, "update", lambda **kwargs: calls.append(1) or update(**kwargs)
+        )
+
+        async def evaluate():
+            async_metric = AsyncMetric(metric, max_latency=10.0)
+            await asyncio.gather(
+                *(async_metric.aupdate(*batch) for batch in batches),
+                async_metric.aflush(),
+            )
+            async_metric.close()
+
+        asyncio.run(evaluate())
+        assert len(calls) == 1
+
+    def test_invalid_update_raises_for_its_caller(self, batches):
+        async def evaluate():
+            metric = AsyncMetric(load_metric(metric="BinaryAccuracy", package="numpy"))
+            results = await asyncio.gather(
+                *(metric.aupdate(*batch) for batch in batches),
+                metric.aupdate(np.array([1.0, 0.0]), np.array([2.0, 1.0])),
+                metric.aupdate(np.array([1.0, 0.0]), np.array([1.0])),
+                return_exceptions=True,
+            )
+            result = await metric.acompute()
+            metric.close()
+            return results, result
+
+        results, result = asyncio.run(evaluate())
+        assert all(outcome is None for outcome in results[:-2])
+        assert all(isinstance(outcome, ValueError) for outcome in results[-2:])
+        assert result == pytest.approx(expected_accuracy(batches))
+
+    def test_any_parse_error_raises_for_its_caller(self, batches, monkeypatch):
+        metric = load_metric(metric="BinaryAccuracy", package="numpy")
+        parse = metric._parse
+
+        def failing_parse(validator, **kwargs):
+            if kwargs["y_observed"].size and kwargs["y_observed"][0] == 7.0:
+                raise AttributeError("unparseable update")
+            return parse(validator, **kwargs)
+
+        monkeypatch.setattr(metric, "_parse", failing_parse)
+
+        async def evaluate():
+            async_metric = AsyncMetric(metric, max_latency=10.0)
+            results = await asyncio.gather(
+                async_metric.aupdate(np.array([7.0, 0.0]), np.array([1.0, 0.0])),
+                *(async_metric.aupdate(*batch) for batch in batches),
+                async_metric.aflush(),
+                return_exceptions=True,
+            )
+            result = await async_metric.acompute()
+            async_metric.close()
+            return results, result
+
+        results, result = asyncio.run(evaluate())
+        assert isinstance(results[0], AttributeError)
+        assert all(outcome is None for outcome in results[1:])
+        assert result == pytest.approx(expected_accuracy(batches))
+
+    def test_parse_holds_lock(self, batches, monkeypatch):
+        # validation may accumulate state, e.g. the deferred checks of pytorch
+        metric = load_metric(metric="BinaryAccuracy", package="numpy")
+        async_metric = AsyncMetric(metric, max_batch_size=1)
+        parse = metric._parse
+        locked = []
+
+        def recording_parse(validator, **kwargs):
+            locked.append(async_metric._lock.locked())
+            return parse(validator, **kwargs)
+
+        monkeypatch.setattr(metric, "_parse", recording_parse)
+
+        async def evaluate():
+            await asyncio.gather(*(async_metric.aupdate(*batch) for batch in batches))
+            async_metric.close()
+
+        asyncio.run(evaluate())
+        assert locked and all(locked)
+
+    def test_weighted_and_unweighted_updates(self, batches):
+        weights = [np.full(len(y_observed), 0.5) for y_observed, _ in batches]
+
+        async def evaluate():
+            metric = AsyncMetric(load_metric(metric="BinaryAccuracy", package="numpy"))
+            await asyncio.gather(
+                *(metric.aupdate(*batch) for batch in batches[:150]),
+                *(
+                    metric.aupdate(*batch, sample_weights=sample_weights)
+                    for batch, sample_weights in zip(batches[150:], weights[150:])
+                ),
+            )
+            result = await metric.acompute()
+            metric.close()
+            return result
+
+        sample_weights = np.concatenate(
+            [np.ones(len(y)) for y, _ in batches[:150]] + weights[150:]
+        )
+        expected = load_metric(metric="BinaryAccuracy", package="numpy")(
+            np.concatenate([y_observed for y_observed, _ in batches]),
+            np.concatenate([y_predicted for _, y_predicted in batches]),
+            sample_weights / sample_weights.sum(),
+        )
+        assert asyncio.run(evaluate()) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("package", ["pytorch", "tensorflow"])
+    def test_frameworks(self, batches, package):
+        framework = __import__(
+            {"pytorch": "torch", "tensorflow": "tensorflow"}[package]
+        )
+        convert = framework.tensor if package == "pytorch" else framework.constant
+
+        async def evaluate():
+            metric = AsyncMetric(load_metric(metric="BinaryAccuracy", package=package))
+            await asyncio.gather(
+                *(
+                    metric.aupdate(convert(y_observed), convert(y_predicted))
+                    for y_observed, y_predicted in batches
+                )
+            )
+            result = await metric.acompute()
+            metric.close()
+            return float(result)
+
+        assert asyncio.run(evaluate()) == pytest.approx(expected_accuracy(batches))
@@ -0,0 +1,97 @@
+import pickle
+
+import pytest
+import numpy as np
+import torch as pt
+
+from otito.metrics._state import MetricState
+from otito.metrics.utils import load_metric
+
+
+class TestValidatorRegistry:
+    """
+    Class to test the sharing of validator models between metric instances
+    """
+
+    def test_validator_shared_between_instances(self):
+        first = load_metric(metric="BinaryAccuracy", package="numpy")
+        second = load_metric(metric="BinaryAccuracy", package="numpy")
+
+        assert first.validator is second.validator
+        assert first.metric_args is second.metric_args
+
+    def test_validator_keyed_by_package(self):
+        numpy_metric = load_metric(metric="BinaryAccuracy", package="numpy")
+        pytorch_metric = load_metric(metric="BinaryAccuracy", package="pytorch")
+
+        assert numpy_metric.validator is not pytorch_metric.validator
+        assert pytorch_metric.validator.__name__ == "pytorch:BinaryAccuracyModel"
+
+    def test_metric_args(self):
+        metric = load_metric(metric="BinaryAccuracy", package="numpy")
+        assert metric.metric_args == ("y_observed", "y_predicted", "sample_weights")
+
+
+class TestMetricState:
+    """
+    Class to test merging and pickling of metric states
+    """
+
+    def test_merge(self):
+        state = MetricState(correct=1, total=2)
+        state.merge(MetricState(correct=3, total=4))
+
+        assert (state.correct, state.total) == (4, 6)
+
+    @pytest.mark.parametrize("package", ["numpy", "pytorch"])
+    def test_merge_state_matches_single_update(self, package):
+        y_observed = [1.0, 1.0, 0.0, 1.0, 0.0, 0.0]
+        y_predicted = [1.0, 0.0, 0.0, 1.0, 1.0, 0.0]
+        convert = np.array if package == "numpy" else pt.tensor
+
+        metric = load_metric(metric="BinaryAccuracy", package=package)
+        for chunk in (slice(None, 4), slice(4, None)):
+            partial = load_metric(metric="BinaryAccuracy", package=package)
+            partial.update(convert(y_observed[chunk]), convert(y_predicted[chunk]))
+            metric.merge_state(pickle.loads(pickle.dumps(partial.state)))
+
+        assert metric.compute() == pytest.approx(4 / 6)
+
+
+class TestCallPath:
+    """
+    Class to test the parsing performed on each metric call
+    """
+
+    @pytest.fixture
+    def inputs(self):
+        return np.array([1.0, 0.0, 1.0]), np.array([1.0, 1.0, 1.0])
+
+    def test_validates_once_per_call(self, inputs, monkeypatch):
+        metric = load_metric(metric="BinaryAccuracy", package="numpy")
+        validator = metric.validator
+        calls = []
+
+        def counting_validator(**kwargs):
+            calls.append(kwargs)
+            return validator(**kwargs)
+
+        monkeypatch.setattr(metric, "validator", counting_validator)
+        assert metric(*inputs) == pytest.approx(2 / 3)
+        assert len(calls) == 1
+        assert metric.call(*inputs) == pytest.approx(2 / 3)
+        assert len(calls) == 2
+
+    def test_trusted_inputs_skip_parsing(self, inputs, monkeypatch):
+        metric = load_metric(
+            metric="BinaryAccuracy", package="numpy", validate_input=False
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("inputs parsed")
+
+        monkeypatch.setattr(metric, "_merge_args_kwargs", fail)
+        assert metric(*inputs) == pytest.approx(2 / 3)
+        assert metric(y_predicted=inputs[1], y_observed=inputs[0]) == pytest.approx(
+            2 / 3
+        )
@@ -0,0 +1,154 @@
+import pytest
+import numpy as np
+from pydantic import validator
+
+from otito import MetricCollection
+from otito.metrics.numpy import BinaryAccuracy, BinaryPrecision
+from otito.metrics.utils import load_metric
+
+
+@validator("y_predicted", allow_reuse=True)
+def flip_labels(cls, v):
+    return 1.0 - v
+
+
+class FlippedAccuracy(BinaryAccuracy):
+    """
+    Binary accuracy of predictions flipped by its validator
+    """
+
+    input_validator_config = {
+        **BinaryAccuracy.input_validator_config,
+        "__validators__": {"flip_labels": flip_labels},
+    }
+
+
+class FlippedConfusionAccuracy(BinaryAccuracy):
+    """
+    Binary accuracy of flipped predictions, computing confusion counts of its
+    own under the shared name of the binary confusion counts
+    """
+
+    @staticmethod
+    def _binary_confusion(y_observed, y_predicted, sample_weights=None):
+        return BinaryAccuracy._binary_confusion(
+            y_observed, 1.0 - y_predicted, sample_weights
+        )
+
+
+class TestMetricCollection:
+    """
+    Class to test evaluating several metrics together on the same inputs
+    """
+
+    @pytest.fixture
+    def collection(self):
+        return MetricCollection(
+            {
+                "accuracy": load_metric(metric="BinaryAccuracy", package="numpy"),
+                "precision": load_metric(metric="BinaryPrecision", package="numpy"),
+                "recall": load_metric(metric="BinaryRecall", package="numpy"),
+            }
+        )
+
+    def test_call(self, collection):
+        actual = collection(np.array([1.0, 1.0, 0.0, 1.0]), np.array([1.0, 0, 0, 1]))
+        assert actual == {"accuracy": 0.75, "precision": 1.0, "recall": 2 / 3}
+
+    def test_validates_once(self, collection, monkeypatch):
+        calls = []
+        validator = collection.metrics["accuracy"].validator
+
+        def counting_validator(**kwargs):
+            calls.append(kwargs)
+            return validator(**kwargs)
+
+        for metric in collection.metrics.values():
+            monkeypatch.setattr(metric, "validator", counting_validator)
+
+        collection(np.array([1.0, 0.0]), np.array([1.0, 1.0]))
+        assert len(calls) == 1
+
+    def test_shares_intermediates(self, collection, monkeypatch):
+        calls = []
+        confusion = collection.metrics["accuracy"]._binary_confusion
+
+        def counting_confusion(*args):
+            calls.append(args)
+            return confusion(*args)
+
+        for metric in collection.metrics.values():
+            monkeypatch.setattr(metric, "_binary_confusion", counting_confusion)
+
+        collection(np.array([1.0, 0.0]), np.array([1.0, 1.0]))
+        assert len(calls) == 1
+
+    def test_arguments_parsed_per_config(self):
+        collection = MetricCollection(
+            {"accuracy": FlippedAccuracy(), "precision": BinaryPrecision()}
+        )
+        y_observed, y_predicted = np.array([1.0, 0.0, 1.0]), np.array([1.0, 0, 0])
+
+        # each metric receives, and shares intermediates of, its own arguments
+        assert collection(y_observed, y_predicted) == {
+            "accuracy": pytest.approx(1 / 3),
+            "precision": 1.0,
+        }
+
+    def test_shared_keys_namespaced_by_function(self):
+        collection = MetricCollection(
+            {"accuracy": BinaryAccuracy(), "flipped": FlippedConfusionAccuracy()}
+        )
+        actual = collection(np.array([1.0, 0.0, 1.0]), np.array([1.0, 0.0, 0.0]))
+
+        assert actual == {
+            "accuracy": pytest.approx(2 / 3),
+            "flipped": pytest.approx(1 / 3),
+        }
+
+    def test_thread_safe_metrics(self):
+        collection = MetricCollection(
+            {
+                name: load_metric(metric=name, package="numpy", thread_safe=True)
+                for name in ("BinaryAccuracy", "BinaryPrecision")
+            }
+        )
+        y_observed = np.array([1.0, 0.0, 1.0])
+        first = collection(y_observed, y_observed)
+        second = collection(y_observed, 1.0 - y_observed)
+        direct = collection.metrics["BinaryAccuracy"](y_observed, 1.0 - y_observed)
+
+        assert first == {"BinaryAccuracy": 1.0, "BinaryPrecision": 1.0}
+        assert second == {"BinaryAccuracy": 0.0, "BinaryPrecision": 0.0}
+        assert direct == 0.0
+
+    def test_invalid_input(self, collection):
+        with pytest.raises(ValueError, match="Input is not binary"):
+            collection(np.array([0.0, 1.0, 2.0]), np.array([0.0, 1.0, 1.0]))
+
+    def test_stateful(self):
+        collection = MetricCollection(
+            [load_metric(metric="BinaryAccuracy", package="numpy")], stateful=True
+        )
+        collection(np.array([1.0, 1.0]), np.array([1.0, 1.0]))
+        actual = collection(np.array([1.0, 1.0]), np.array([0.0, 0.0]))
+
+        assert actual == {"BinaryAccuracy": 0.5}
+
+    def test_mixed_packages(self):
+        with pytest.raises(ValueError, match="must share a package"):
+            MetricCollection(
+                {
+                    "numpy": load_metric(metric="BinaryAccuracy", package="numpy"),
+                    "pytorch": load_metric(metric="BinaryAccuracy", package="pytorch"),
+                }
+            )
+
+    def test_duplicate_names(self):
+        with pytest.raises(ValueError, match="unique names"):
+            MetricCollection(
+                [
+                    load_metric(metric="BinaryAccuracy", package="numpy"),
+                    load_metric(metric="BinaryAccuracy", package="numpy"),
+                ]
+            )
@@ -0,0 +1,85 @@
+import pytest
+import numpy as np
+
+from otito.metrics.numpy import BinaryAccuracy, BinaryF1Score, bootstrap
+from otito.metrics.numpy.bootstrap import _poisson_ones
+
+
+class TestBootstrap:
+    """
+    Class to test vectorised bootstrap confidence intervals of numpy metrics
+    """
+
+    @pytest.fixture
+    def inputs(self):
+        rng = np.random.default_rng(0)
+        y_observed = rng.integers(0, 2, 2000).astype(float)
+        y_predicted = np.where(rng.random(2000) < 0.8, y_observed, 1 - y_observed)
+        sample_weights = rng.random(2000)
+        return y_observed, y_predicted, sample_weights / sample_weights.sum()
+
+    @pytest.mark.parametrize("method", ["poisson", "multinomial"])
+    @pytest.mark.parametrize("weighted", [False, True])
+    @pytest.mark.parametrize("metric_class", [BinaryAccuracy, BinaryF1Score])
+    def test_interval(self, inputs, method, weighted, metric_class):
+        y_observed, y_predicted, sample_weights = inputs
+        sample_weights = sample_weights if weighted else None
+        result = bootstrap(
+            metric_class(),
+            y_observed,
+            y_predicted,
+            sample_weights,
+            n_resamples=500,
+            method=method,
+            random_state=0,
+        )
+
+        expected = metric_class()(y_observed, y_predicted, sample_weights)
+        assert result.value == pytest.approx(expected)
+        assert result.replicates.shape == (500,)
+        assert result.low < result.value < result.high
+        # the standard error of a proportion over 2000 samples is about 0.009
+        assert 0.005 < result.replicates.std() < 0.015
+
+    def test_matches_loop_of_resamples(self, inputs):
+        y_observed, y_predicted, _ = inputs
+        rng = np.random.default_rng(1)
+        replicates = []
+        for _ in range(500):
+            indices = rng.integers(0, 2000, 2000)
+            replicates.append(
+                BinaryAccuracy()(y_observed[indices], y_predicted[indices])
+            )
+        result = bootstrap(BinaryAccuracy(), y_observed, y_predicted, random_state=1)
+
+        assert result.replicates.mean() == pytest.approx(np.mean(replicates), abs=2e-3)
+        assert result.replicates.std() == pytest.approx(np.std(replicates), rel=0.2)
+
+    @pytest.mark.parametrize("method", ["poisson", "multinomial"])
+    def test_chunks_and_workers_are_reproducible(self, inputs, method):
+        results = [
+            bootstrap(
+                BinaryAccuracy(),
+                *inputs,
+                n_resamples=50,
+                method=method,
+                chunk_size=chunk_size,
+                n_workers=n_workers,
+                random_state=2,
+            )
+            for chunk_size, n_workers in [(10**5, 1), (10**5, 3)]
+        ]
+        np.testing.assert_array_equal(results[0].replicates, results[1].replicates)
+
+    def test_poisson_ones(self):
+        draws = _poisson_ones(np.random.default_rng(0), 10**6)
+        assert draws.mean() == pytest.approx(1.0, abs=5e-3)
+        assert draws.var() == pytest.approx(1.0, abs=1e-2)
+
+    def test_invalid_method_raises(self, inputs):
+        with pytest.raises(ValueError, match="Unknown bootstrap method"):
+            bootstrap(BinaryAccuracy(), *inputs, method="jackknife")
+
+    def test_invalid_input_raises(self):
+        with pytest.raises(ValueError, match="not binary"):
+            bootstrap(BinaryAccuracy(), np.array([0.0, 1.0]), np.array([2.0, 1.0]))
@@ -0,0 +1,78 @@
+import pytest
+import numpy as np
+
+from otito.metrics.numpy import evaluate_memmap, load_memmap
+from otito.metrics.utils import load_metric
+
+
+class TestEvaluateMemmap:
+    """
+    Class to test evaluating numpy metrics over memory mapped files
+    """
+
+    @pytest.fixture
+    def metric(self):
+        return load_metric(
+            metric="BinaryAccuracy", package="numpy", validate_input=True
+        )
+
+    @pytest.fixture
+    def data(self):
+        rng = np.random.default_rng(0)
+        y_observed = rng.integers(0, 2, 1000).astype(float)
+        y_predicted = rng.integers(0, 2, 1000).astype(float)
+        sample_weights = rng.random(1000)
+        return y_observed, y_predicted, sample_weights / sample_weights.sum()
+
+    @pytest.mark.parametrize("window_size", [1, 7, 1000, 4096])
+    def test_npy_files(self, metric, data, tmp_path, window_size):
+        y_observed, y_predicted, _ = data
+        np.save(tmp_path / "y_observed.npy", y_observed)
+        np.save(tmp_path / "y_predicted.npy", y_predicted)
+
+        actual = evaluate_memmap(
+            metric,
+            tmp_path / "y_observed.npy",
+            str(tmp_path / "y_predicted.npy"),
+            window_size=window_size,
+        )
+        assert metric(y_observed, y_predicted) == pytest.approx(actual)
+
+    def test_weighted_raw_files(self, metric, data, tmp_path):
+        for name, array in zip(("obs", "pred", "weights"), data):
+            array.tofile(tmp_path / f"{name}.bin")
+
+        actual = evaluate_memmap(
+            metric,
+            tmp_path / "obs.bin",
+            tmp_path / "pred.bin",
+            tmp_path / "weights.bin",
+            window_size=64,
+            dtype=np.float64,
+        )
+        assert metric(*data) == pytest.approx(actual)
+
+    def test_raw_file_requires_dtype(self, tmp_path):
+        np.zeros(4).tofile(tmp_path / "obs.bin")
+        with pytest.raises(ValueError, match="'dtype' is required"):
+            load_memmap(tmp_path / "obs.bin")
+
+    def test_mismatched_lengths(self, metric, tmp_path):
+        np.save(tmp_path / "y_observed.npy", np.zeros(4))
+        np.save(tmp_path / "y_predicted.npy", np.zeros(3))
+        with pytest.raises(ValueError, match="Shape of inputs mismatched"):
+            evaluate_memmap(
+                metric, tmp_path / "y_observed.npy", tmp_path / "y_predicted.npy"
+            )
+
+    @pytest.mark.parametrize("n_weights", [3, 5])
+    def test_mismatched_weights(self, metric, n_weights):
+        # windows follow y_observed, so extra weights would be silently dropped
+        with pytest.raises(ValueError, match="not the same length as input"):
+            evaluate_memmap(
+                metric,
+                np.zeros(4),
+                np.zeros(4),
+                np.full(n_weights, 0.25),
+                window_size=2,
+            )
@@ -0,0 +1,84 @@
+import pytest
+import numpy as np
+
+from otito.metrics.numpy import evaluate_parallel
+from otito.metrics.utils import load_metric
+
+
+class TestEvaluateParallel:
+    """
+    Class to test sharded evaluation of numpy metrics across processes
+    """
+
+    @pytest.fixture
+    def metric(self):
+        return load_metric(
+            metric="BinaryAccuracy", package="numpy", validate_input=True
+        )
+
+    @pytest.fixture
+    def data(self):
+        rng = np.random.default_rng(0)
+        y_observed = rng.integers(0, 2, 1001).astype(float)
+        y_predicted = rng.integers(0, 2, 1001).astype(float)
+        sample_weights = rng.random(1001)
+        return y_observed, y_predicted, sample_weights / sample_weights.sum()
+
+    @pytest.mark.parametrize("n_workers,n_shards", [(1, None), (2, None), (2, 7)])
+    def test_matches_serial(self, metric, data, n_workers, n_shards):
+        y_observed, y_predicted, _ = data
+        actual = evaluate_parallel(
+            metric, y_observed, y_predicted, n_workers=n_workers, n_shards=n_shards
+        )
+        assert metric(y_observed, y_predicted) == pytest.approx(actual)
+
+    def test_weighted_matches_serial(self, metric, data):
+        actual = evaluate_parallel(metric, *data, n_workers=2)
+        assert metric(*data) == pytest.approx(actual)
+
+    def test_inputs_validated(self, metric):
+        with pytest.raises(ValueError, match="Input is not binary"):
+            evaluate_parallel(metric, [0.0, 1.0, 2.0], [0.0, 1.0, 1.0], n_workers=2)
+
+    @pytest.mark.parametrize(
+        "metric_name,kwargs,shape",
+        [
+            ("BinaryROCAUC", {"bins": 10}, None),
+            ("MulticlassAccuracy", {"top_k": 2}, 3),
+            ("MulticlassAccuracy", {"average": "macro", "num_classes": 3}, 3),
+            ("MultilabelF1Score", {"num_labels": 3, "threshold": 0.3}, (3,)),
+        ],
+    )
+    def test_configuration_reaches_workers(self, metric_name, kwargs, shape):
+        rng = np.random.default_rng(0)
+        if shape is None:
+            y_observed = rng.integers(0, 2, 1001).astype(float)
+            y_predicted = rng.random(1001)
+        elif isinstance(shape, tuple):
+            y_observed = rng.integers(0, 2, (1001, *shape)).astype(float)
+            y_predicted = rng.random((1001, *shape))
+        else:
+            y_observed = rng.integers(0, shape, 1001).astype(float)
+            y_predicted = rng.random((1001, shape))
+        metric = load_metric(metric=metric_name, package="numpy", **kwargs)
+
+        actual = evaluate_parallel(metric, y_observed, y_predicted, n_workers=2)
+        assert metric(y_observed, y_predicted) == pytest.approx(actual)
+
+    def test_thread_safe_metric(self, data):
+        metric = load_metric(metric="BinaryAccuracy", package="numpy", thread_safe=True)
+        actual = evaluate_parallel(metric, *data[:2], n_workers=2)
+        assert metric(*data[:2]) == pytest.approx(actual)
+
+    def test_worker_error_is_raised(self):
+        metric = load_metric(
+            metric="MulticlassAccuracy",
+            package="numpy",
+            validate_input=False,
+            average="macro",
+            num_classes=1,
+        )
+        with pytest.raises(ValueError, match="class indices"):
+            evaluate_parallel(
+                metric, np.array([0.0, 1.0]), np.eye(2), n_workers=1, n_shards=2
+            )
@@ -0,0 +1,121 @@
+import pytest
+import numpy as np
+
+from otito.metrics.numpy import (
+    BinaryAccuracy,
+    BinaryF1Score,
+    DecayedMetric,
+    SlidingWindowMetric,
+)
+
+
+@pytest.fixture
+def stream():
+    rng = np.random.default_rng(0)
+    y_observed = rng.integers(0, 2, 10_000).astype(float)
+    y_predicted = rng.integers(0, 2, 10_000).astype(float)
+    return y_observed, y_predicted, rng.random(10_000)
+
+
+def batches(*arrays, size):
+    for start in range(0, len(arrays[0]), size):
+        stop = start + size
+        yield [array[start:stop] for array in arrays]
+
+
+class TestSlidingWindowMetric:
+    """
+    Class to test numpy metrics over a sliding window of a stream
+    """
+
+    @pytest.mark.parametrize("batch_size", [1, 7, 999, 5000])
+    @pytest.mark.parametrize("metric_class", [BinaryAccuracy, BinaryF1Score])
+    def test_matches_latest_samples(self, stream, batch_size, metric_class):
+        y_observed, y_predicted, _ = stream
+        window = SlidingWindowMetric(metric_class(), window_size=1000)
+        for batch in batches(y_observed, y_predicted, size=batch_size):
+            window.update(*batch)
+
+        assert len(window) == 1000
+        assert window.compute() == pytest.approx(
+            metric_class()(y_observed[-1000:], y_predicted[-1000:])
+        )
+
+    def test_weighted(self, stream):
+        y_observed, y_predicted, sample_weights = stream
+        window = SlidingWindowMetric(BinaryAccuracy(), window_size=3000)
+        window.update(y_observed[:500], y_predicted[:500])
+        for batch in batches(y_observed, y_predicted, sample_weights, size=123):
+            window.update(*batch)
+
+        weights = sample_weights[-3000:]
+        assert window.compute() == pytest.approx(
+            BinaryAccuracy()(
+                y_observed[-3000:], y_predicted[-3000:], weights / weights.sum()
+            )
+        )
+
+    def test_window_duration(self, stream):
+        y_observed, y_predicted, _ = stream
+        timestamps = np.cumsum(np.random.default_rng(1).exponential(0.1, 10_000))
+        window = SlidingWindowMetric(
+            BinaryAccuracy(), window_size=10_000, window_duration=60.0
+        )
+        for batch in batches(y_observed, y_predicted, timestamps, size=250):
+            window(*batch[:2], timestamps=batch[2])
+
+        recent = timestamps >= timestamps[-1] - 60.0
+        assert len(window) == recent.sum()
+        assert window.compute() == pytest.approx(
+            BinaryAccuracy()(y_observed[recent], y_predicted[recent])
+        )
+
+    def test_window_duration_requires_timestamps(self, stream):
+        window = SlidingWindowMetric(
+            BinaryAccuracy(), window_size=10, window_duration=1.0
+        )
+        with pytest.raises(ValueError, match="timestamps"):
+            window.update(*stream[:2])
+
+    def test_reset(self, stream):
+        window = SlidingWindowMetric(BinaryAccuracy(), window_size=100)
+        window.update(*stream[:2])
+        window.reset()
+        assert len(window) == 0
+        assert window(np.array([1.0, 0.0]), np.array([1.0, 1.0])) == 0.5
+
+
+class TestDecayedMetric:
+    """
+    Class to test numpy metrics with exponentially decayed sample weights
+    """
+
+    @pytest.mark.parametrize("batch_size", [1, 64, 10_000])
+    def test_matches_decayed_weights(self, stream, batch_size):
+        y_observed, y_predicted, _ = stream
+        decayed = DecayedMetric(BinaryAccuracy(), half_life=500)
+        for batch in batches(y_observed, y_predicted, size=batch_size):
+            decayed.update(*batch)
+
+        weights = np.exp2(-np.arange(10_000)[::-1] / 500)
+        assert decayed.compute() == pytest.approx(
+            BinaryAccuracy()(y_observed, y_predicted, weights / weights.sum())
+        )
+
+    def test_timestamps(self, stream):
+        y_observed, y_predicted, sample_weights = stream
+        timestamps = np.cumsum(np.random.default_rng(1).exponential(0.1, 10_000))
+        decayed = DecayedMetric(BinaryAccuracy(), half_life=30.0)
+        for batch in batches(
+            y_observed, y_predicted, sample_weights, timestamps, size=300
+        ):
+            decayed.update(*batch[:3], timestamps=batch[3])
+
+        weights = sample_weights * np.exp2(-(timestamps[-1] - timestamps) / 30.0)
+        assert decayed.compute() == pytest.approx(
+            BinaryAccuracy()(y_observed, y_predicted, weights / weights.sum())
+        )
+
+    def test_invalid_half_life_raises(self):
+        with pytest.raises(ValueError, match="half_life"):
+            DecayedMetric(BinaryAccuracy(), half_life=0)
@@ -0,0 +1,115 @@
+import json
+import threading
+
+import pytest
+import numpy as np
+
+from otito import Profiler
+from otito.metrics import profiling
+from otito.metrics.utils import load_metric
+
+
+class TestProfiler:
+    """
+    Class to test recording the stages of metric calls
+    """
+
+    y_observed = np.array([1.0, 0.0, 1.0, 1.0])
+    y_predicted = np.array([1.0, 1.0, 1.0, 0.0])
+
+    converters = {
+        "numpy": np.asarray,
+        "pytorch": lambda array: __import__("torch").tensor(array),
+        "tensorflow": lambda array: __import__("tensorflow").constant(array),
+    }
+
+    @pytest.mark.parametrize("package", ["numpy", "pytorch", "tensorflow"])
+    def test_records_stages(self, package):
+        metric = load_metric(metric="BinaryAccuracy", package=package)
+        y_observed, y_predicted = map(
+            self.converters[package], (self.y_observed, self.y_predicted)
+        )
+        with Profiler() as profiler:
+            metric(y_observed, y_predicted)
+
+        stages = [row["stage"] for row in profiler.summary()]
+        assert stages == [
+            "validator:labels_must_be_same_shape",
+            "validator:labels_must_be_binary",
+            "_parse_input",
+            "update",
+            "compute",
+        ]
+        assert {record.metric for record in profiler.records} == {"BinaryAccuracy"}
+
+    def test_result_unchanged(self):
+        metric = load_metric(metric="BinaryAccuracy", package="numpy")
+        expected = metric(self.y_observed, self.y_predicted)
+        with Profiler():
+            assert metric(self.y_observed, self.y_predicted) == expected
+
+    def test_invalid_input_raises(self):
+        metric = load_metric(metric="BinaryAccuracy", package="numpy")
+        with Profiler() as profiler, pytest.raises(ValueError):
+            metric(self.y_observed, np.array([0.0, 1.0, 2.0, 0.0]))
+        assert "update" not in {record.stage for record in profiler.records}
+
+    def test_nbytes_and_memory(self):
+        metric = load_metric(metric="BinaryAccuracy", package="numpy")
+        with Profiler(trace_memory=True) as profiler:
+            metric(np.ones(10_000), np.ones(10_000))
+
+        update = next(row for row in profiler.summary() if row["stage"] == "update")
+        assert update["nbytes"] == 2 * 80_000
+        assert update["peak_allocated"] > 0
+
+    def test_disabled_after_exit(self):
+        metric = load_metric(metric="BinaryAccuracy", package="numpy")
+        with Profiler() as profiler:
+            metric(self.y_observed, self.y_predicted)
+        records = len(profiler.records)
+
+        metric(self.y_observed, self.y_predicted)
+        assert profiling.active is None
+        assert len(profiler.records) == records
+
+    def test_table(self):
+        metric = load_metric(metric="BinaryAccuracy", package="numpy")
+        with Profiler() as profiler:
+            for _ in range(3):
+                metric(self.y_observed, self.y_predicted)
+
+        lines = profiler.table().splitlines()
+        assert lines[0].split()[:3] == ["metric", "stage", "calls"]
+        assert len(lines) == 2 + 5
+        assert lines[-1].split()[:3] == ["BinaryAccuracy", "compute", "3"]
+
+    def test_chrome_trace(self, tmp_path):
+        metric = load_metric(metric="BinaryAccuracy", package="numpy")
+        with Profiler() as profiler:
+            metric(self.y_observed, self.y_predicted)
+        path = tmp_path / "trace.json"
+        profiler.save_chrome_trace(path)
+
+        events = json.loads(path.read_text())["traceEvents"]
+        assert len(events) == len(profiler.records)
+        assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+        parse = next(event for event in events if event["name"] == "_parse_input")
+        validators = [event for event in events if event["name"].startswith("valid")]
+        assert all(
+            parse["ts"] <= event["ts"]
+            and event["ts"] + event["dur"] <= parse["ts"] + parse["dur"]
+            for event in validators
+        )
+
+    def test_thread_safe_call_finalizes_own_shard(self):
+        metric = load_metric(metric="BinaryAccuracy", package="numpy", thread_safe=True)
+        other = threading.Thread(target=metric.update, args=(np.zeros(4), np.ones(4)))
+        other.start()
+        other.join()
+        with Profiler():
+            actual = metric(self.y_observed, self.y_predicted)
+
+        assert actual == pytest.approx(0.5)
+        # the update of the other thread is neither computed nor reset
+        assert metric.compute() == pytest.approx(0.0)
@@ -0,0 +1,152 @@
+import pathlib
+import subprocess
+import sys
+
+import pytest
+import torch as pt
+
+from otito.metrics.pytorch import functional as F
+from otito.metrics.utils import load_metric
+
+from tests.test_utils import get_cases
+from tests.metrics.classification.binary.resources import test_data as td
+
+REPOSITORY_ROOT = pathlib.Path(__file__).parents[2]
+
+COMPILE_SCRIPT = """
+import torch as pt
+from otito.metrics.pytorch import functional as F
+
+update = pt.compile(F.binary_confusion_update, backend="eager", fullgraph=True)
+state = update(
+    pt.zeros(4),
+    pt.tensor([1.0, 1.0, 0.0, 1.0]),
+    pt.tensor([1.0, 0.0, 0.0, 1.0]),
+    pt.full((4,), 0.25) if {weighted} else None,
+)
+print(float(F.binary_accuracy_compute(state)))
+"""
+
+compute_kernels = {
+    "BinaryAccuracy": F.binary_accuracy_compute,
+    "BinaryPrecision": F.binary_precision_compute,
+    "BinaryRecall": F.binary_recall_compute,
+    "BinarySpecificity": F.binary_specificity_compute,
+    "BinaryF1Score": F.binary_f1_score_compute,
+}
+
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+class TestFunctionalKernels:
+    """
+    Class to test the compilable functional kernels of the pytorch metrics
+    """
+
+    @pytest.mark.parametrize("metric_name", list(compute_kernels))
+    @pytest.mark.parametrize(
+        *get_cases(
+            data_module=td,
+            data_name="weighted_confusion_metrics_data",
+            columns=[0, 1, 2],
+            target_type=pt.tensor,
+        )
+    )
+    def test_scripted_kernels(
+        self, metric_name, y_observed, y_predicted, sample_weights, expected
+    ):
+        update = pt.jit.script(F.binary_confusion_update)
+        compute = pt.jit.script(compute_kernels[metric_name])
+
+        state = update(pt.zeros(4), y_observed, y_predicted, sample_weights)
+        assert expected[metric_name] == pytest.approx(float(compute(state)))
+
+    @pytest.mark.parametrize(
+        *get_cases(
+            data_module=td,
+            data_name="confusion_metrics_data",
+            columns=[0, 1],
+            target_type=pt.tensor,
+        )
+    )
+    def test_scripted_update_matches_eager(self, y_observed, y_predicted, expected):
+        update = pt.jit.script(F.binary_confusion_update)
+        state = pt.zeros(4, dtype=pt.int64)
+
+        assert pt.equal(
+            update(state, y_observed, y_predicted),
+            F.binary_confusion_update(state, y_observed, y_predicted),
+        )
+
+    @pytest.mark.parametrize("weighted", [False, True])
+    def test_compiles_without_graph_breaks(self, weighted):
+        # run in a fresh interpreter, as torch.compile can't be imported in a
+        # process that has already loaded tensorflow
+        output = subprocess.run(
+            [sys.executable, "-c", COMPILE_SCRIPT.format(weighted=weighted)],
+            capture_output=True,
+            cwd=REPOSITORY_ROOT,
+            check=True,
+            text=True,
+        )
+        assert float(output.stdout) == pytest.approx(0.75)
+
+    @pytest.mark.parametrize("metric_name", list(compute_kernels))
+    def test_metric_wraps_kernels(self, metric_name):
+        y_observed = pt.tensor([1.0, 1.0, 0.0, 1.0, 0.0])
+        y_predicted = pt.tensor([1.0, 0.0, 0.0, 1.0, 1.0])
+        metric = load_metric(metric=metric_name, package="pytorch")
+        state = F.binary_confusion_update(
+            pt.zeros(4, dtype=pt.int64), y_observed, y_predicted
+        )
+
+        assert pt.equal(
+            metric(y_observed, y_predicted), compute_kernels[metric_name](state)
+        )
+
+    @pytest.mark.parametrize("top_k", [1, 2])
+    @pytest.mark.parametrize("num_classes", [None, 3])
+    def test_scripted_multiclass_kernels(self, top_k, num_classes):
+        update = pt.jit.script(F.multiclass_accuracy_update)
+        compute = pt.jit.script(F.multiclass_accuracy_compute)
+        y_observed = pt.tensor([0, 1, 2, 2])
+        y_predicted = pt.tensor(
+            [[0.5, 0.3, 0.2], [0.5, 0.3, 0.2], [0.1, 0.2, 0.7], [0.2, 0.5, 0.3]]
+        )
+        state = pt.zeros(2 if num_classes is None else (2, num_classes))
+
+        state = update(state, y_observed, y_predicted, top_k)
+        assert pt.equal(compute(state), F.multiclass_accuracy_compute(state))
+        # top 1: samples 0 and 2 are correct, top 2 adds samples 1 and 3
+        expected = {(1, None): 0.5, (2, None): 1.0, (1, 3): 0.5, (2, 3): 1.0}
+        assert float(compute(state)) == pytest.approx(expected[top_k, num_classes])
+
+    def test_scripted_multilabel_kernels(self):
+        update = pt.jit.script(F.multilabel_confusion_update)
+        y_observed = pt.tensor([[1.0, 0.0], [1.0, 1.0], [0.0, 0.0]])
+        y_predicted = pt.tensor([[0.9, 0.2], [0.4, 0.6], [0.7, 0.1]])
+
+        state = update(pt.zeros(4, 2, dtype=pt.int64), y_observed, y_predicted)
+        assert pt.equal(state, pt.tensor([[1, 1], [1, 0], [0, 2], [1, 0]]))
+        assert float(pt.jit.script(F.binary_accuracy_compute)(state.sum(1))) == (
+            pytest.approx(4 / 6)
+        )
+
+    def test_scripted_regression_kernels(self):
+        update = pt.jit.script(F.regression_update)
+        combine = pt.jit.script(F.moments_combine)
+        y_observed = pt.tensor([1.0, 2.0, 3.0, 4.0])
+        y_predicted = pt.tensor([1.5, 2.0, 2.0, 4.0])
+
+        state = update(pt.zeros(7, dtype=pt.float64), y_observed, y_predicted)
+        split = combine(
+            update(pt.zeros(7, dtype=pt.float64), y_observed[:1], y_predicted[:1]),
+            update(pt.zeros(7, dtype=pt.float64), y_observed[1:], y_predicted[1:]),
+        )
+        assert pt.allclose(state, split)
+        # residuals are [-0.5, 0, 1, 0] and the observed variance sum is 5
+        for kernel, expected in (
+            (F.mean_squared_error_compute, 0.3125),
+            (F.mean_absolute_error_compute, 0.375),
+            (F.r2_score_compute, 1 - 1.25 / 5),
+        ):
+            assert float(pt.jit.script(kernel)(state)) == pytest.approx(expected)
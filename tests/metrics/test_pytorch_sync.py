@@ -0,0 +1,131 @@
+import pytest
+import torch as pt
+
+from otito.metrics.pytorch.sync import register_sync_hook
+from otito.metrics.utils import load_metric
+
+
+@pytest.fixture
+def syncs():
+    synced = []
+    handle = register_sync_hook(synced.append)
+    yield synced
+    handle.remove()
+
+
+def make_chunks(n_chunks, size=8, labels=(0.0, 1.0)):
+    generator = pt.Generator().manual_seed(0)
+    return [
+        (
+            pt.tensor(labels)[pt.randint(0, 2, (size,), generator=generator)],
+            pt.tensor(labels)[pt.randint(0, 2, (size,), generator=generator)],
+        )
+        for _ in range(n_chunks)
+    ]
+
+
+class TestDeviceSyncs:
+    """
+    Class to test the device synchronisation of the pytorch metrics
+    """
+
+    def test_update_does_not_sync(self, syncs):
+        metric = load_metric(metric="BinaryAccuracy", package="pytorch")
+        for y_observed, y_predicted in make_chunks(10):
+            metric.update(y_observed, y_predicted)
+        metric.compute()
+
+        assert syncs == []
+
+    def test_eager_validation_syncs_per_chunk(self, syncs):
+        metric = load_metric(metric="BinaryAccuracy", package="pytorch")
+        metric.update_from_iterable(make_chunks(10))
+
+        assert len(syncs) == 10
+
+    @pytest.mark.parametrize("interval,expected", [(5, 2), (3, 4), (100, 1)])
+    def test_deferred_validation_syncs_per_interval(self, syncs, interval, expected):
+        chunks = make_chunks(10)
+        metric = load_metric(
+            metric="BinaryAccuracy", package="pytorch", validation_interval=interval
+        )
+        actual = metric.update_from_iterable(chunks)
+        expected_result = load_metric(
+            metric="BinaryAccuracy", package="pytorch", validate_input=False
+        ).update_from_iterable(chunks)
+
+        assert len(syncs) == expected
+        assert float(actual) == pytest.approx(float(expected_result))
+
+    def test_state_on_input_device_and_dtype(self):
+        metric = load_metric(metric="BinaryAccuracy", package="pytorch")
+        y_observed, y_predicted = make_chunks(1)[0]
+        metric.update(y_observed, y_predicted, pt.full((8,), 0.125, dtype=pt.float64))
+
+        assert metric.state.confusion.device == y_observed.device
+        assert metric.state.confusion.dtype == pt.float64
+
+
+class TestDeferredValidation:
+    """
+    Class to test the deferred validation checks of the pytorch metrics
+    """
+
+    def test_not_binary_within_chunk(self):
+        metric = load_metric(
+            metric="BinaryAccuracy", package="pytorch", validation_interval=10
+        )
+        chunks = make_chunks(2) + make_chunks(1, labels=(0.0, 2.0))
+        chunks[-1][0][0] = 1.0
+        with pytest.raises(ValueError, match="Input is not binary"):
+            metric.update_from_iterable(chunks)
+
+    def test_not_binary_across_chunks(self):
+        metric = load_metric(
+            metric="BinaryAccuracy", package="pytorch", validation_interval=10
+        )
+        chunks = make_chunks(2) + make_chunks(2, labels=(2.0, 2.0))
+        with pytest.raises(ValueError, match="Input is not binary"):
+            metric.update_from_iterable(chunks)
+
+    def test_weights_must_sum_to_one(self):
+        metric = load_metric(
+            metric="BinaryAccuracy", package="pytorch", validation_interval=10
+        )
+        with pytest.raises(ValueError, match="do not sum to one"):
+            metric(
+                pt.tensor([1.0, 0.0, 1.0]),
+                pt.tensor([1.0, 1.0, 1.0]),
+                pt.tensor([0.5, 0.5, 0.3]),
+            )
+
+    def test_shape_checked_without_deferral(self):
+        metric = load_metric(
+            metric="BinaryAccuracy", package="pytorch", validation_interval=10
+        )
+        with pytest.raises(ValueError, match="Shape of inputs mismatched"):
+            metric(pt.tensor([1.0, 0.0, 1.0]), pt.tensor([1.0, 1.0]))
+
+    def test_valid_call_after_failed_labels(self):
+        metric = load_metric(
+            metric="BinaryAccuracy", package="pytorch", validation_interval=10
+        )
+        with pytest.raises(ValueError, match="Input is not binary"):
+            metric(pt.tensor([0.0, 1.0, 2.0]), pt.tensor([0.0, 1.0, 1.0]))
+
+        actual = metric(pt.tensor([1.0, 0.0, 1.0]), pt.tensor([1.0, 0.0, 1.0]))
+        assert float(actual) == pytest.approx(1.0)
+
+    def test_valid_call_after_failed_weights(self):
+        metric = load_metric(
+            metric="BinaryAccuracy", package="pytorch", validation_interval=10
+        )
+        with pytest.raises(ValueError, match="do not sum to one"):
+            metric(
+                pt.tensor([1.0, 0.0, 1.0]),
+                pt.tensor([1.0, 1.0, 1.0]),
+                pt.tensor([0.5, 0.5, 0.3]),
+            )
+
+        actual = metric(pt.tensor([1.0, 0.0, 1.0]), pt.tensor([1.0, 0.0, 1.0]))
+        assert float(actual) == pytest.approx(1.0)
@@ -0,0 +1,108 @@
+import pickle
+
+import pytest
+import tensorflow as tf
+
+from otito.metrics.utils import load_metric
+
+
+@pytest.fixture
+def data():
+    generator = tf.random.Generator.from_seed(0)
+    y_observed = tf.cast(generator.uniform([100], maxval=2, dtype=tf.int32), tf.float32)
+    y_predicted = tf.cast(
+        generator.uniform([100], maxval=2, dtype=tf.int32), tf.float32
+    )
+    return y_observed, y_predicted
+
+
+class TestGraphUpdate:
+    """
+    Class to test the graph compiled updates of the tensorflow metrics
+    """
+
+    def test_update_state_in_tf_function(self, data):
+        metric = load_metric(metric="BinaryAccuracy", package="tensorflow")
+        dataset = tf.data.Dataset.from_tensor_slices(data).batch(16)
+
+        @tf.function
+        def evaluate(dataset):
+            for y_observed, y_predicted in dataset:
+                metric.update_state(y_observed, y_predicted)
+
+        evaluate(dataset)
+        assert metric.compute() == pytest.approx(metric(*data))
+
+    def test_update_state_traced_once_per_signature(self, data):
+        metric = load_metric(metric="BinaryAccuracy", package="tensorflow")
+        y_observed, y_predicted = data
+        for size in (10, 20, 30, 40):
+            metric.update_state(y_observed[:size], y_predicted[:size])
+
+        assert metric.update_state.experimental_get_tracing_count() <= 2
+
+    def test_reset_keeps_variables(self, data):
+        metric = load_metric(metric="BinaryAccuracy", package="tensorflow")
+        variables = dict(vars(metric.state))
+        metric.update_state(*data)
+        metric.reset()
+
+        assert vars(metric.state) == variables
+        assert float(metric.state.tp.numpy()) == 0.0
+
+    def test_merge_pickled_state(self, data):
+        y_observed, y_predicted = data
+        metric = load_metric(metric="BinaryAccuracy", package="tensorflow")
+        partial = load_metric(metric="BinaryAccuracy", package="tensorflow")
+        metric.update(y_observed[:50], y_predicted[:50])
+        partial.update(y_observed[50:], y_predicted[50:])
+        metric.merge_state(pickle.loads(pickle.dumps(partial.state)))
+
+        assert metric.compute() == pytest.approx(metric(*data))
+
+
+class TestGraphValidation:
+    """
+    Class to test the tf.debugging validation of graph compiled updates
+    """
+
+    @pytest.fixture
+    def metric(self):
+        return load_metric(metric="BinaryAccuracy", package="tensorflow")
+
+    def test_labels_must_be_binary(self, metric):
+        with pytest.raises(tf.errors.InvalidArgumentError, match="not binary"):
+            metric.update_state(tf.constant([0.0, 1.0, 2.0]), tf.constant([0.0] * 3))
+
+    def test_labels_must_be_same_shape(self, metric):
+        with pytest.raises(
+            (ValueError, tf.errors.InvalidArgumentError), match="mismatched"
+        ):
+            metric.update_state(tf.constant([0.0, 1.0, 1.0]), tf.constant([0.0] * 2))
+
+    def test_weights_must_be_same_len(self, metric):
+        with pytest.raises(
+            (ValueError, tf.errors.InvalidArgumentError), match="same length"
+        ):
+            metric.update_state(
+                tf.constant([0.0, 1.0]),
+                tf.constant([0.0, 1.0]),
+                tf.constant([0.5, 0.3, 0.2]),
+            )
+
+    def test_batch_weights_need_not_sum_to_one(self, metric, data):
+        # the weights are normalised over the whole dataset, not each batch
+        weights = tf.fill([100], 0.01)
+        dataset = tf.data.Dataset.from_tensor_slices((*data, weights)).batch(16)
+        for y_observed, y_predicted, sample_weights in dataset:
+            metric.update_state(y_observed, y_predicted, sample_weights)
+
+        assert metric.compute() == pytest.approx(metric(*data, weights))
+
+    def test_no_validation(self):
+        metric = load_metric(
+            metric="BinaryAccuracy", package="tensorflow", validate_input=False
+        )
+        metric.update_state(tf.constant([0.0, 1.0, 2.0]), tf.constant([0.0] * 3))
+
+        assert metric.compute() == pytest.approx(1 / 3)
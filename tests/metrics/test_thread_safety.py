@@ -0,0 +1,146 @@
+import threading
+
+import pytest
+import numpy as np
+
+from otito.metrics.utils import load_metric
+
+N_THREADS = 8
+
+
+def run_threads(target, n_threads=N_THREADS):
+    barrier = threading.Barrier(n_threads)
+
+    def run(index):
+        barrier.wait()
+        target(index)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.fixture
+def thread_batches():
+    rng = np.random.default_rng(0)
+    return [
+        [
+            (
+                rng.integers(0, 2, 16).astype(float),
+                rng.integers(0, 2, 16).astype(float),
+            )
+            for _ in range(500)
+        ]
+        for _ in range(N_THREADS)
+    ]
+
+
+def expected_metric(metric, thread_batches):
+    batches = [batch for batches in thread_batches for batch in batches]
+    return load_metric(metric=metric, package="numpy")(
+        np.concatenate([y_observed for y_observed, _ in batches]),
+        np.concatenate([y_predicted for _, y_predicted in batches]),
+    )
+
+
+class TestThreadSafeMetrics:
+    """
+    Stress tests of metrics updated concurrently from several threads
+    """
+
+    @pytest.mark.parametrize("package", ["numpy", "pytorch"])
+    @pytest.mark.parametrize("metric", ["BinaryAccuracy", "BinaryF1Score"])
+    def test_concurrent_updates(self, thread_batches, package, metric):
+        convert = np.asarray
+        if package == "pytorch":
+            convert = __import__("torch").tensor
+        threadsafe_metric = load_metric(
+            metric=metric, package=package, stateful=True, thread_safe=True
+        )
+
+        def update(index):
+            for y_observed, y_predicted in thread_batches[index]:
+                threadsafe_metric.update(convert(y_observed), convert(y_predicted))
+
+        run_threads(update)
+        assert float(threadsafe_metric.compute()) == pytest.approx(
+            expected_metric(metric, thread_batches)
+        )
+
+    def test_compute_while_updating(self, thread_batches):
+        metric = load_metric(
+            metric="BinaryAccuracy", package="numpy", stateful=True, thread_safe=True
+        )
+        results = []
+
+        def update_or_compute(index):
+            for y_observed, y_predicted in thread_batches[index]:
+                if index == 0:
+                    results.append(metric.compute())
+                else:
+                    metric(y_observed, y_predicted)
+
+        run_threads(update_or_compute)
+        assert all(0.0 <= result <= 1.0 for result in results)
+        assert metric.compute() == pytest.approx(
+            expected_metric("BinaryAccuracy", thread_batches[1:])
+        )
+
+    def test_calls_are_independent_per_thread(self, thread_batches):
+        metric = load_metric(metric="BinaryAccuracy", package="numpy", thread_safe=True)
+        results = [[] for _ in range(N_THREADS)]
+
+        def call(index):
+            for y_observed, y_predicted in thread_batches[index]:
+                results[index].append(metric(y_observed, y_predicted))
+
+        run_threads(call)
+        for index in range(N_THREADS):
+            assert results[index] == [
+                load_metric(metric="BinaryAccuracy", package="numpy")(*batch)
+                for batch in thread_batches[index]
+            ]
+
+    def test_reset_and_merge_state(self, thread_batches):
+        metric = load_metric(
+            metric="BinaryAccuracy", package="numpy", stateful=True, thread_safe=True
+        )
+        run_threads(lambda index: metric.update(*thread_batches[index][0]))
+        metric.reset()
+        other = load_metric(metric="BinaryAccuracy", package="numpy", stateful=True)
+        other.update(np.array([1.0, 0.0]), np.array([1.0, 1.0]))
+        metric.merge_state(other.state)
+        assert metric.compute() == 0.5
+
+    def test_shards_of_finished_threads_are_merged(self, thread_batches):
+        metric = load_metric(
+            metric="BinaryAccuracy", package="numpy", stateful=True, thread_safe=True
+        )
+        for batches in thread_batches:
+            # a new thread per batch of updates, as in a pool replacing threads
+            thread = threading.Thread(
+                target=lambda: [metric.update(*batch) for batch in batches]
+            )
+            thread.start()
+            thread.join()
+
+        assert len(metric._shards) <= 1
+        assert metric.compute() == pytest.approx(
+            expected_metric("BinaryAccuracy", thread_batches)
+        )
+        metric.reset()
+        metric.update(np.array([1.0, 0.0]), np.array([1.0, 1.0]))
+        assert metric.compute() == 0.5
+
+    def test_unsupported_configurations_raise(self):
+        with pytest.raises(ValueError, match="thread_safe"):
+            load_metric(metric="BinaryAccuracy", package="tensorflow", thread_safe=True)
+        with pytest.raises(ValueError, match="thread_safe"):
+            load_metric(
+                metric="BinaryAccuracy",
+                package="pytorch",
+                thread_safe=True,
+                validation_interval=10,
+            )
@@ -0,0 +1,66 @@
+import json
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+from otito.metrics.utils import import_backend
+
+REPOSITORY_ROOT = pathlib.Path(__file__).parents[1]
+
+IMPORT_TIME_BUDGET = 0.5
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "elapsed": elapsed,
+    "frameworks": sorted({{"torch", "tensorflow"}} & set(sys.modules)),
+}}))
+"""
+
+
+def run_import(module):
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT.format(module=module)],
+        capture_output=True,
+        cwd=REPOSITORY_ROOT,
+        check=True,
+        text=True,
+    )
+    return json.loads(output.stdout)
+
+
+class TestLazyImports:
+    """
+    Class to test that frameworks are only imported with their metrics
+    """
+
+    @pytest.mark.parametrize("module", ["otito", "otito.metrics"])
+    def test_import_time_budget(self, module):
+        result = run_import(module)
+
+        assert result["frameworks"] == []
+        assert result["elapsed"] < IMPORT_TIME_BUDGET
+
+    def test_numpy_metrics_do_not_import_frameworks(self):
+        assert run_import("otito.metrics.numpy")["frameworks"] == []
+
+    def test_missing_framework(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "torch", None)
+        for module in list(sys.modules):
+            if module.startswith("otito.metrics.pytorch"):
+                monkeypatch.delitem(sys.modules, module)
+
+        with pytest.raises(ImportError, match=r"pip install otito\[pytorch\]"):
+            import_backend("pytorch")
+
+    def test_load_metric_is_exported(self):
+        from otito.metrics import load_metric
+        import otito.metrics
+
+        assert "load_metric" in otito.metrics.__all__
+        assert load_metric(metric="BinaryAccuracy", package="numpy") is not None